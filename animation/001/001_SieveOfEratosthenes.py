@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from common.number_theory import sieve_steps
+
 
 class SieveOfEratosthenes(Scene):
     def construct(self):
@@ -190,14 +192,11 @@ class SieveOfEratosthenes(Scene):
         )
         self.wait(0.8)  # 대기 시간을 0.3에서 0.8로 증가
 
-        # 2부터 시작하여 √100까지 순차적으로 처리
-        for current_num in range(2, int(np.sqrt(100)) + 1):
+        # √100 이하의 소수마다 한 단계씩 처리 (단계별로 새로 지워지는 수는 미리 계산)
+        for step in sieve_steps(100):
+            current_num = step.prime
             idx = current_num - 1
 
-            # 이미 제거된 숫자는 건너뛰기 (fill opacity가 0.3인 경우)
-            if squares[idx].get_fill_opacity() == 0.3:
-                continue
-
             # 현재 숫자 강조 (배경색과 볼드체 숫자를 애니메이션 없이 즉시 )
             bold_num = Text(
                 str(current_num), font_size=TEXT_SIZE * 1.3, weight=BOLD
@@ -211,12 +210,9 @@ class SieveOfEratosthenes(Scene):
             color_changes = []
             removed_cells = []
 
-            # current_num의 배수들 처리
-            for i in range(current_num * 2, 101, current_num):
+            # current_num이 새로 지우는 배수들 처리 (이미 제거된 숫자는 포함되지 않음)
+            for i in step.crossed_out.tolist():
                 target_idx = i - 1
-                # 이미 제거된 숫자는 건너뛰기
-                if squares[target_idx].get_fill_opacity() == 0.3:
-                    continue
                 fade_outs.append(FadeOut(numbers[target_idx]))
                 color_changes.append(
                     squares[target_idx].animate.set_fill(RED_A, opacity=0.4)
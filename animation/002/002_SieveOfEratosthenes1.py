@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from common.number_theory import smallest_prime_factors
+
+# 각 수를 처음 걸러 내는 필터는 그 수의 가장 작은 소인수 필터
+# (spf[i] == p: p의 필터에 걸림, spf[i] > p: p까지의 필터를 모두 통과)
+SPF = smallest_prime_factors(100)
+
 
 class SieveOfEratosthenes1(Scene):
     def construct(self):
@@ -127,7 +133,7 @@ class SieveOfEratosthenes1(Scene):
         # 짝수들을 필터로 이동시키는 애니메이션
         moves = []
         for i in range(1, 101):  # 2부터 100까지
-            if i % 2 == 0:  # 짝수인 경우
+            if SPF[i] == 2:  # 짝수인 경우
                 number = numbers[i - 1]  # 인덱스는 0부터 시작하므로 1을 빼줌
                 # 필터에서의 대응되는 위치 계산
                 filter_rect = filter_squares[i - 2]  # 1을 제외했으므로 2를 빼줌
@@ -264,7 +270,7 @@ class SieveOfEratosthenes1(Scene):
         arrow_indices = {num: idx for idx, num in enumerate(range(3, 101, 2))}
 
         for i in range(3, 101, 2):  # 홀수들 중에서
-            if i % 3 == 0:  # 3의 배수인 경우
+            if SPF[i] == 3:  # 3의 배수인 경우
                 number = numbers[i - 1]
                 filter3_rect = filter3_squares[i - 2]
                 arrow = arrows[arrow_indices[i]]
@@ -354,7 +360,7 @@ class SieveOfEratosthenes1(Scene):
         # 기존 화살표들을 5의 필터까지 연장
         arrow_extensions = []
         for i in range(3, 101, 2):  # 홀수들 중에서
-            if i % 3 != 0:  # 3의 배수가 아닌 것들만
+            if SPF[i] > 3:  # 3의 배수가 아닌 것들만
                 number = numbers[i - 1]
                 filter5_rect = filter5_squares[i - 2]
                 arrow = arrows[arrow_indices[i]]  # 기존 화살표
@@ -384,7 +390,7 @@ class SieveOfEratosthenes1(Scene):
         arrows_to_fade = []
 
         for i in range(3, 101, 2):  # 홀수들 중에서
-            if i % 3 != 0 and i % 5 == 0:  # 3의 배수가 아니면서 5의 배수인 경우
+            if SPF[i] == 5:  # 3의 배수가 아니면서 5의 배수인 경우
                 number = numbers[i - 1]
                 filter5_rect = filter5_squares[i - 2]
                 arrow = arrows[arrow_indices[i]]
@@ -471,7 +477,7 @@ class SieveOfEratosthenes1(Scene):
         # 기존 화살표들을 7의 필터까지 연장
         arrow_extensions = []
         for i in range(3, 101, 2):  # 홀수들 중에서
-            if i % 3 != 0 and i % 5 != 0:  # 3과 5의 배수가 아닌 것들만
+            if SPF[i] > 5:  # 3과 5의 배수가 아닌 것들만
                 number = numbers[i - 1]
                 filter7_rect = filter7_squares[i - 2]
                 arrow = arrows[arrow_indices[i]]  # 기존 화살표
@@ -501,9 +507,7 @@ class SieveOfEratosthenes1(Scene):
         arrows_to_fade = []
 
         for i in range(3, 101, 2):  # 홀수들 중에서
-            if (
-                i % 3 != 0 and i % 5 != 0 and i % 7 == 0
-            ):  # 3과 5의 배수가 아니면서 7의 배수인 경우
+            if SPF[i] == 7:  # 3과 5의 배수가 아니면서 7의 배수인 경우
                 number = numbers[i - 1]
                 filter7_rect = filter7_squares[i - 2]
                 arrow = arrows[arrow_indices[i]]
@@ -546,7 +550,7 @@ class SieveOfEratosthenes1(Scene):
 
         # 남은 소수들(3,5,7의 배수가 아닌 수들)에 대한 화살표 연장 및 이동
         for i in range(3, 101, 2):
-            if i % 3 != 0 and i % 5 != 0 and i % 7 != 0:
+            if SPF[i] > 7:
                 number = numbers[i - 1]
                 arrow = arrows[arrow_indices[i]]
 
@@ -634,7 +638,7 @@ class SieveOfEratosthenes1(Scene):
 
         # 이미 이동된 소수들 추가 (복사본 생성하지 않고 직접 추가)
         for i in range(3, 101, 2):
-            if i % 3 != 0 and i % 5 != 0 and i % 7 != 0:
+            if SPF[i] > 7:
                 number = numbers[i - 1]
                 final_primes.add(number)
 
@@ -3,6 +3,7 @@ from manim import *
 from sympy import symbols, diff, solve, latex
 
 from common.manim_utils import create_code_block_from_file
+from common.sympy_compiler import compile_expr, compile_derivative
 
 
 class PolynimialDiff(Scene):
@@ -106,9 +107,8 @@ like differentiation and equation solving."""
             radius=0.05
         )
 
-        # Convert sympy expression to lambda function for plotting
-        def f(x_val):
-            return float(poly_expr.subs(x, x_val))  # x 심볼로 대체
+        # Convert sympy expression to compiled function for plotting
+        f = compile_expr(poly_expr, x)
 
         # Create graph of original function
         graph = plane.plot(
@@ -118,9 +118,8 @@ like differentiation and equation solving."""
             color=BLUE
         )
 
-        # Convert derivative expression to function for plotting
-        def df(x_val):
-            return float(diff_expr.subs(x, x_val))
+        # Convert derivative expression to compiled function for plotting
+        df = compile_derivative(poly_expr, x)
 
         # Create graph of derivative function
         derivative_graph = plane.plot(
@@ -3,6 +3,7 @@ from sympy import cos, sqrt, symbols, S
 from sympy.abc import x
 from manim import *
 from common.decorator.latex_factory import latex_factory
+from common.sympy_compiler import compile_expr
 from common.template.proof_sequence.base_proof_scene import BaseProofScene, ProofSceneConfig
 
 
@@ -31,7 +32,7 @@ class FreeWifiPasswordDefiniteIntegration(BaseProofScene):
     def after_qed(self) -> None:
         integrand = (x**3 * cos(x/2) + S(1)/2) * sqrt(4 - x**2)
 
-        def f(x): return float(integrand.subs('x', x))
+        f = compile_expr(integrand, x)
 
         plane = NumberPlane(
             y_range=[-3.5, 4.5],
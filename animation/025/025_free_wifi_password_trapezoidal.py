@@ -3,6 +3,7 @@ from sympy import cos, sqrt, S, latex
 from sympy.abc import x
 from manim import *
 from common.decorator.latex_factory import latex_factory
+from common.sympy_compiler import compile_expr
 from common.template.proof_sequence.base_proof_scene import BaseProofScene, ProofSceneConfig
 from visualizer.trapezoid_rule import TrapezoidalRuleVisualizer
 
@@ -49,7 +50,8 @@ class FreeWifiPasswordTrapezoidalRule(BaseProofScene):
         ).add_coordinates()
         self.add(self.plane)
 
-        def f(x): return float(self.integrand_f.subs('x', x))
+        # 한 번만 컴파일하여 그래프와 구적법 계산(배열 단위 평가)에 함께 사용
+        f = compile_expr(self.integrand_f, x)
 
         graph = self.plane.plot(f, x_range=[-2, 2], color=GREEN)
         f_latex = MathTex(
@@ -0,0 +1,146 @@
+import numpy as np
+
+
+def vectorize_integrand(integrand, probe):
+    """스칼라/배열 어느 쪽으로 작성된 피적분 함수든 배열 입력을 받도록 감싼다.
+
+    numpy 배열을 그대로 받아 같은 모양의 배열을 돌려주는 함수(lambdify 결과 등)는
+    그대로 사용하고, float(...) 처럼 스칼라만 받는 함수는 np.vectorize로 감싼다.
+
+    Args:
+        integrand: 피적분 함수
+        probe: 배열 입력 가능 여부를 확인할 점들 (적분 구간 안의 점)
+    """
+    try:
+        result = np.asarray(integrand(probe), dtype=float)
+        if result.shape == probe.shape:
+            return lambda xs: np.asarray(integrand(xs), dtype=float)
+    except (TypeError, ValueError):
+        pass
+    return np.vectorize(integrand, otypes=[float])
+
+
+class IncrementalQuadrature:
+    """구간을 2배씩 나누며 이전 단계의 샘플을 재사용하는 적분 엔진 (Romberg 방식)
+
+    단계(level) k 에서 구간 [a, b]는 n = 2^k 개의 소구간으로 나뉘고,
+    k+1 단계로 넘어갈 때는 새로 생긴 중점 2^k 개에서만 피적분 함수를 한 번에 평가한다.
+    따라서 k 단계까지의 전체 평가 횟수는 2^k + 1 번이다.
+
+    - 사다리꼴/좌·우/중점 리만 합, 심프슨 공식을 모두 같은 샘플에서 계산
+    - Romberg 외삽표와 단계 간 차이를 이용한 오차 추정 제공
+    """
+
+    def __init__(self, integrand, domain):
+        self.x_start, self.x_end = float(domain[0]), float(domain[1])
+        self.total_width = self.x_end - self.x_start
+
+        endpoints = np.array([self.x_start, self.x_end])
+        self.integrand = vectorize_integrand(integrand, endpoints)
+
+        self.level = 0
+        self.values = self.integrand(endpoints)
+        self.evaluation_count = 2
+
+        # trapezoids[k]: k 단계 사다리꼴 합, romberg_table[k][j]: j차 외삽값
+        first = self.total_width * (self.values[0] + self.values[1]) / 2
+        self.trapezoids = [first]
+        self.romberg_table = [[first]]
+
+    def refine(self):
+        """소구간을 2배로 나누고 새 중점에서만 피적분 함수를 평가"""
+        count = 2 ** self.level
+        width = self.total_width / count
+        midpoints = self.x_start + (np.arange(count) + 0.5) * width
+        midpoint_values = self.integrand(midpoints)
+        self.evaluation_count += count
+
+        values = np.empty(2 * count + 1)
+        values[::2] = self.values
+        values[1::2] = midpoint_values
+        self.values = values
+        self.level += 1
+
+        # T_{k+1} = T_k / 2 + h_{k+1} * (새 중점 값의 합)
+        trapezoid = self.trapezoids[-1] / 2 + width / 2 * midpoint_values.sum()
+        self.trapezoids.append(trapezoid)
+
+        row = [trapezoid]
+        for order in range(1, self.level + 1):
+            prev = self.romberg_table[-1][order - 1]
+            row.append(row[-1] + (row[-1] - prev) / (4 ** order - 1))
+        self.romberg_table.append(row)
+
+    def refine_to(self, level):
+        while self.level < level:
+            self.refine()
+
+    def subinterval_count(self, level):
+        return 2 ** level
+
+    def subinterval_width(self, level):
+        return self.total_width / 2 ** level
+
+    def bounds(self, level):
+        """level 단계의 소구간 경계점 (2^level + 1 개)"""
+        return np.linspace(self.x_start, self.x_end, 2 ** level + 1)
+
+    def node_values(self, level):
+        """level 단계 경계점에서의 함수값 (가장 세밀한 샘플에서 건너뛰어 추출)"""
+        self.refine_to(level)
+        return self.values[::2 ** (self.level - level)]
+
+    def midpoint_values(self, level):
+        """level 단계 각 소구간 중점에서의 함수값 (= level+1 단계의 홀수 번째 경계점)"""
+        return self.node_values(level + 1)[1::2]
+
+    def trapezoid(self, level):
+        self.refine_to(level)
+        return self.trapezoids[level]
+
+    def midpoint(self, level):
+        # M_k = 2 T_{k+1} - T_k
+        return 2 * self.trapezoid(level + 1) - self.trapezoid(level)
+
+    def left_riemann(self, level):
+        return self.subinterval_width(level) * self.node_values(level)[:-1].sum()
+
+    def right_riemann(self, level):
+        return self.subinterval_width(level) * self.node_values(level)[1:].sum()
+
+    def simpson(self, level):
+        """2^level 개 소구간(level >= 1)의 심프슨 공식 값 (= Romberg 1차 외삽)"""
+        if level < 1:
+            raise ValueError("심프슨 공식은 최소 2개의 소구간이 필요합니다")
+        return self.romberg(level, 1)
+
+    def romberg(self, level, order=None):
+        """Romberg 외삽값 R(level, order) (order 생략 시 해당 단계의 최고차)"""
+        self.refine_to(level)
+        row = self.romberg_table[level]
+        return row[-1] if order is None else row[order]
+
+    def trapezoid_error(self, level):
+        """사다리꼴 합의 오차 추정 |T_k - T_{k-1}| / 3"""
+        if level < 1:
+            return float('inf')
+        return abs(self.trapezoid(level) - self.trapezoid(level - 1)) / 3
+
+    def simpson_error(self, level):
+        """심프슨 공식의 오차 추정 |S_k - S_{k-1}| / 15"""
+        if level < 2:
+            return float('inf')
+        return abs(self.simpson(level) - self.simpson(level - 1)) / 15
+
+    def romberg_error(self, level):
+        """Romberg 대각 원소 간 차이로 본 오차 추정"""
+        if level < 1:
+            return float('inf')
+        return abs(self.romberg(level) - self.romberg(level - 1))
+
+    def integrate(self, tolerance=1e-10, max_level=20, min_level=4):
+        """오차 추정이 tolerance 이하가 될 때까지 세분하여 Romberg 외삽값 반환"""
+        for level in range(max_level + 1):
+            if level >= min_level and self.romberg_error(level) <= tolerance:
+                break
+        return self.romberg(level)
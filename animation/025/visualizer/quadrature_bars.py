@@ -0,0 +1,205 @@
+import copy
+from manim import *
+
+NEGATIVE_BAR_COLOR = "#FF69B4"
+# 표본점(Dot)은 막대와 달리 하나씩 객체가 생기므로 이 개수를 넘으면 그리지 않는다
+MAX_SAMPLE_DOT_COUNT = 256
+
+
+class QuadratureBars(VGroup):
+    """구적법 막대(사각형/사다리꼴/심프슨 조각) 전체를 하나의 점 배열로 그리는 묶음 객체
+
+    막대마다 Rectangle/Polygon 을 만드는 대신, 모든 막대를 하위 경로(subpath)로 이어 붙인
+    VMobject 하나에 담는다. 막대의 부호별 채우기 색을 위해 양수 부분과 음수 부분을
+    각각 하나의 VMobject (positive_bars / negative_bars) 로 나누어 채우고,
+    테두리는 자르지 않은 윤곽으로 부호별 VMobject (positive_outlines / negative_outlines) 에 그린다.
+
+    각 막대는 윗변 윤곽(profile)으로 정의된다.
+        profile_x, profile_y: (막대 수, k) 배열, 막대마다 왼쪽 -> 오른쪽 윤곽 꼭짓점 좌표
+    두 층 모두 모든 막대를 항상 같은 개수의 점으로 가지므로(높이 0 막대는 납작해질 뿐),
+    분할 단계 사이의 전환은 점 배열 하나를 보간하는 것으로 끝난다.
+    """
+
+    def __init__(self,
+                 plane,
+                 profile_x,
+                 profile_y,
+                 positive_color=BLUE,
+                 negative_color=NEGATIVE_BAR_COLOR,
+                 stroke_color=None,
+                 fill_opacity=0.3,
+                 stroke_width=1,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.plane = plane
+        # 채우기 층은 테두리 없이 그린다 (반대 부호 막대는 y=0 위로 납작해지므로 선이 남지 않도록)
+        self.positive_bars = VMobject(
+            fill_color=positive_color,
+            fill_opacity=fill_opacity,
+            stroke_width=0
+        )
+        self.negative_bars = VMobject(
+            fill_color=negative_color,
+            fill_opacity=fill_opacity,
+            stroke_width=0
+        )
+        # 테두리는 자르지 않은 윤곽으로 따로 그린다 (막대 부호별 색, 다른 부호 층에서는 한 점으로 접힘)
+        self.positive_outlines = VMobject(
+            fill_opacity=0,
+            stroke_color=stroke_color or positive_color,
+            stroke_width=stroke_width
+        )
+        self.negative_outlines = VMobject(
+            fill_opacity=0,
+            stroke_color=stroke_color or negative_color,
+            stroke_width=stroke_width
+        )
+        self.add(self.positive_bars, self.negative_bars, self.positive_outlines, self.negative_outlines)
+        self.set_profiles(profile_x, profile_y)
+
+    @classmethod
+    def rectangles(cls, plane, bounds, heights, **kwargs):
+        """리만 합 막대: 소구간 [bounds[i], bounds[i+1]] 위 높이 heights[i] 의 사각형"""
+        bounds = np.asarray(bounds, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        profile_x = np.stack([bounds[:-1], bounds[1:]], axis=1)
+        profile_y = np.stack([heights, heights], axis=1)
+        return cls(plane, profile_x, profile_y, **kwargs)
+
+    @classmethod
+    def trapezoids(cls, plane, bounds, heights, **kwargs):
+        """사다리꼴 공식 막대: 양 끝점 함수값 heights[i], heights[i+1] 을 잇는 사다리꼴"""
+        bounds = np.asarray(bounds, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        profile_x = np.stack([bounds[:-1], bounds[1:]], axis=1)
+        profile_y = np.stack([heights[:-1], heights[1:]], axis=1)
+        return cls(plane, profile_x, profile_y, **kwargs)
+
+    @classmethod
+    def simpson_panels(cls, plane, bounds, heights, **kwargs):
+        """심프슨 공식 조각: 소구간 두 개씩 묶어 세 점(왼쪽, 가운데, 오른쪽)을 잇는 도형"""
+        bounds = np.asarray(bounds, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        profile_x = np.stack([bounds[0:-1:2], bounds[1::2], bounds[2::2]], axis=1)
+        profile_y = np.stack([heights[0:-1:2], heights[1::2], heights[2::2]], axis=1)
+        return cls(plane, profile_x, profile_y, **kwargs)
+
+    def set_profiles(self, profile_x, profile_y):
+        """막대 윤곽을 바꾸고 두 층의 점 배열을 한 번에 다시 계산"""
+        self.profile_x = np.asarray(profile_x, dtype=float)
+        self.profile_y = np.asarray(profile_y, dtype=float)
+
+        full_x, full_y = self._split_at_zero(self.profile_x, self.profile_y)
+        self.positive_bars.set_points(
+            self._get_layer_points(full_x, np.maximum(full_y, 0)))
+        self.negative_bars.set_points(
+            self._get_layer_points(full_x, np.minimum(full_y, 0)))
+
+        # 막대 윤곽 평균의 부호로 테두리 색을 정한다 (0 을 지나는 막대도 테두리는 한 색)
+        outline_points = self._get_layer_points(self.profile_x, self.profile_y)
+        is_negative = self.profile_y.mean(axis=1) < 0
+        self.positive_outlines.set_points(self._collapse_bars(outline_points, is_negative))
+        self.negative_outlines.set_points(self._collapse_bars(outline_points, ~is_negative))
+        return self
+
+    def get_bar_count(self):
+        return len(self.profile_x)
+
+    def match_profiles(self, target):
+        """target 과 같은 막대 수/꼭짓점 배치를 갖되 모양은 현재와 같은 복사본
+
+        현재 막대 하나가 target 의 막대 여러 개로 나뉘는 경우(구간 2배 분할),
+        각 자식 막대의 윤곽은 부모 윤곽을 선형 보간하여 얻는다.
+        반환값을 target 으로 Transform 하면 점 배열 하나만 보간된다.
+        """
+        ratio = target.get_bar_count() // self.get_bar_count()
+        parent_index = np.arange(target.get_bar_count()) // ratio
+        parent_x = self.profile_x[parent_index]
+        parent_y = self.profile_y[parent_index]
+        query_x = target.profile_x
+
+        # 각 질의점이 속한 부모 윤곽의 선분 번호 (행 단위 piecewise-linear 보간)
+        segment = (parent_x[:, None, 1:-1] <= query_x[:, :, None]).sum(axis=-1)
+        x0 = np.take_along_axis(parent_x, segment, axis=1)
+        x1 = np.take_along_axis(parent_x, segment + 1, axis=1)
+        y0 = np.take_along_axis(parent_y, segment, axis=1)
+        y1 = np.take_along_axis(parent_y, segment + 1, axis=1)
+        span = np.where(x1 > x0, x1 - x0, 1.0)
+        t = np.clip((query_x - x0) / span, 0, 1)
+
+        # 좌표 평면은 공유 (깊은 복사 제외)
+        matched = copy.deepcopy(self, {id(self.plane): self.plane})
+        matched.set_profiles(query_x, y0 + (y1 - y0) * t)
+        return matched
+
+    @staticmethod
+    def _split_at_zero(profile_x, profile_y):
+        """윤곽 선분마다 꼭짓점 하나를 끼워 넣는다 (부호가 바뀌면 0 교차점, 아니면 중점)
+
+        꼭짓점 수가 막대마다 같게 유지되면서, y 를 0 으로 잘라 양수/음수 층을 만들 때
+        도형이 정확히 잘린다.
+        """
+        x0, x1 = profile_x[:, :-1], profile_x[:, 1:]
+        y0, y1 = profile_y[:, :-1], profile_y[:, 1:]
+        crossing = y0 * y1 < 0
+        t = np.where(crossing, y0 / np.where(crossing, y0 - y1, 1.0), 0.5)
+
+        count = profile_x.shape[1]
+        full_x = np.empty((len(profile_x), 2 * count - 1))
+        full_y = np.empty_like(full_x)
+        full_x[:, ::2], full_y[:, ::2] = profile_x, profile_y
+        full_x[:, 1::2] = x0 + (x1 - x0) * t
+        full_y[:, 1::2] = np.where(crossing, 0, (y0 + y1) / 2)
+        return full_x, full_y
+
+    @staticmethod
+    def _collapse_bars(points, mask):
+        """mask 인 막대의 점을 모두 그 막대의 첫 점으로 모은다 (길이 0 경로라 선이 그려지지 않음)
+
+        점 개수는 그대로 유지되므로 단계 사이의 전환 보간에는 영향이 없다.
+        """
+        bars = points.reshape(len(mask), -1, 3).copy()
+        bars[mask] = bars[mask, :1]
+        return bars.reshape(-1, 3)
+
+    def _get_layer_points(self, full_x, full_y):
+        """막대마다 (왼쪽 밑, 윤곽..., 오른쪽 밑) 닫힌 다각형을 베지어 점 배열로 변환"""
+        bar_count = len(full_x)
+        zeros = np.zeros((bar_count, 1))
+        xs = np.hstack([full_x[:, :1], full_x, full_x[:, -1:]])
+        ys = np.hstack([zeros, full_y, zeros])
+
+        # 평면 좌표 -> 화면 좌표 (아핀 변환을 배열 전체에 한 번에 적용)
+        origin = self.plane.c2p(0, 0)
+        x_unit = self.plane.c2p(1, 0) - origin
+        y_unit = self.plane.c2p(0, 1) - origin
+        corners = origin + xs[..., None] * x_unit + ys[..., None] * y_unit
+
+        # 각 변을 직선 3차 베지어 (시작, 1/3, 2/3, 끝) 로 표현
+        starts = corners
+        ends = np.roll(corners, -1, axis=1)
+        edges = np.stack([
+            starts,
+            starts + (ends - starts) / 3,
+            starts + (ends - starts) * 2 / 3,
+            ends
+        ], axis=2)
+        return edges.reshape(-1, 3)
+
+
+def create_sample_dots(plane, xs, ys):
+    """표본점 표시 (MAX_SAMPLE_DOT_COUNT 를 넘으면 빈 그룹)"""
+    if len(xs) > MAX_SAMPLE_DOT_COUNT:
+        return VGroup()
+    return VGroup(*[
+        Dot(plane.c2p(x, y), color=PINK, radius=0.05).set_z_index(10)
+        for x, y in zip(xs, ys)
+    ])
+
+
+def get_refine_animation(scene, prev_bars, bars):
+    """이전 단계 막대를 다음 단계 막대 배치에 맞춘 복사본으로 바꿔 두고 변형 애니메이션 반환"""
+    matched = prev_bars.match_profiles(bars)
+    scene.remove(prev_bars)
+    scene.add(matched)
+    return ReplacementTransform(matched, bars)
@@ -1,5 +1,7 @@
 from manim import *
 from enum import Enum
+from visualizer.quadrature import IncrementalQuadrature
+from visualizer.quadrature_bars import QuadratureBars, create_sample_dots, get_refine_animation
 
 
 class RiemannSumType(Enum):
@@ -15,36 +17,34 @@ class RiemannSumVisualizer:
     def compute_riemann_data(self, integrand, domain, iteration_count):
         """
         리만 합 계산 결과를 반환.
+        구간을 2배씩 나눌 때 이전 단계의 샘플을 재사용한다 (IncrementalQuadrature).
         Returns:
             A list of dict, where each dict has:
-                'subinterval_count', 'subinterval_width', 'bounds', 'areas'
+                'subinterval_count', 'subinterval_width', 'bounds', 'heights', 'areas',
+                'integral', 'error'
         """
-        x_start, x_end = domain
-        total_width = x_end - x_start
+        quadrature = IncrementalQuadrature(integrand, domain)
         data_list = []
 
         for step in range(iteration_count):
-            subinterval_count = 2 ** step
-            subinterval_width = total_width / subinterval_count
-            bounds = [
-                x_start + i * subinterval_width for i in range(subinterval_count + 1)
-            ]
-            areas = []
-            for i in range(subinterval_count):
-                if self.sum_type == RiemannSumType.LOWER:
-                    x_sample = bounds[i]
-                elif self.sum_type == RiemannSumType.UPPER:
-                    x_sample = bounds[i + 1]
-                else:
-                    x_sample = (bounds[i] + bounds[i + 1]) / 2
-                height = integrand(x_sample)
-                areas.append(height * subinterval_width)
+            subinterval_width = quadrature.subinterval_width(step)
+            if self.sum_type == RiemannSumType.LOWER:
+                heights = quadrature.node_values(step)[:-1]
+            elif self.sum_type == RiemannSumType.UPPER:
+                heights = quadrature.node_values(step)[1:]
+            else:
+                heights = quadrature.midpoint_values(step)
+            areas = heights * subinterval_width
 
             data_list.append({
-                'subinterval_count': subinterval_count,
+                'subinterval_count': quadrature.subinterval_count(step),
                 'subinterval_width': subinterval_width,
-                'bounds': bounds,
-                'areas': areas
+                'bounds': quadrature.bounds(step),
+                'heights': heights,
+                'areas': areas,
+                'integral': areas.sum(),
+                # 같은 샘플로 구한 Romberg 외삽값과의 차이를 오차 추정으로 사용
+                'error': abs(areas.sum() - quadrature.romberg(quadrature.level))
             })
 
         return data_list
@@ -188,58 +188,23 @@ class RiemannSumVisualizer:
         for step, data in enumerate(riemann_data):
             integral_value.become(MathTex("", font_size=48, color=YELLOW))
 
-            subinterval_count = data['subinterval_count']
             subinterval_width = data['subinterval_width']
             bounds = data['bounds']
-            areas = data['areas']
-
-            subinterval_rects = VGroup()
-            dot_group = VGroup()
-            accumulated_area = sum(areas)
-
-            for i in range(subinterval_count):
-                x_left = bounds[i]
-                x_right = bounds[i + 1]
-                # 샘플링 좌표 결정
-                if self.sum_type == RiemannSumType.LOWER:
-                    x_sample = x_left
-                    anchor_edge = LEFT
-                elif self.sum_type == RiemannSumType.UPPER:
-                    x_sample = x_right
-                    anchor_edge = RIGHT
-                else:  # MIDPOINT
-                    x_sample = (x_left + x_right) / 2
-                    anchor_edge = None
-
-                height = areas[i] / subinterval_width
-
-                rect = Rectangle(
-                    width=subinterval_width,
-                    height=abs(height),
-                    fill_opacity=0.3,
-                    stroke_width=1,
-                    color=BLUE if height >= 0 else "#FF69B4"
-                )
-                # 수평 위치 맞추기
-                if anchor_edge is not None:
-                    rect.move_to(scene.plane.c2p(x_sample, 0),
-                                 aligned_edge=anchor_edge)
-                else:
-                    rect.move_to(scene.plane.c2p(x_sample, 0))
-
-                # 수직 위치 맞추기
-                if height >= 0:
-                    rect.align_to(scene.plane.c2p(0, 0), DOWN)
-                else:
-                    rect.align_to(scene.plane.c2p(0, 0), UP)
-
-                dot = Dot(
-                    point=scene.plane.c2p(x_sample, height),
-                    color=PINK,
-                    radius=0.05
-                ).set_z_index(10)
-                dot_group.add(dot)
-                subinterval_rects.add(rect)
+            heights = data['heights']
+            accumulated_area = data['integral']
+
+            # 샘플링 좌표 결정
+            if self.sum_type == RiemannSumType.LOWER:
+                x_samples = bounds[:-1]
+            elif self.sum_type == RiemannSumType.UPPER:
+                x_samples = bounds[1:]
+            else:  # MIDPOINT
+                x_samples = (bounds[:-1] + bounds[1:]) / 2
+
+            # 모든 사각형을 하나의 점 배열로 (부호별 색상)
+            subinterval_rects = QuadratureBars.rectangles(
+                scene.plane, bounds, heights)
+            dot_group = create_sample_dots(scene.plane, x_samples, heights)
 
             formatted_area = f"{accumulated_area:.6f}".rstrip('0').rstrip('.')
             formatted_dx = f"{subinterval_width:.6f}".rstrip('0').rstrip('.')
@@ -247,7 +212,6 @@ class RiemannSumVisualizer:
             # n값 업데이트 (이터레이션 텍스트만)
             if prev_rectangles:
                 scene.play(
-                    FadeOut(prev_rectangles),
                     FadeOut(prev_dots),
                     Transform(iter_n_str,
                               MathTex(f"n = {2 ** step}",
@@ -263,11 +227,15 @@ class RiemannSumVisualizer:
                               })
                               .move_to(delta_x))
                 )
+                # 이전 사각형을 둘로 나눈 뒤 새 높이로 변형
+                rects_animation = get_refine_animation(
+                    scene, prev_rectangles, subinterval_rects)
             else:
                 scene.play(FadeIn(iter_info_text))
+                rects_animation = Create(subinterval_rects)
 
             # 사각형과 점들 생성
-            scene.play(Create(subinterval_rects), Create(dot_group))
+            scene.play(rects_animation, Create(dot_group))
 
             # 적분값 업데이트
             integral_value.become(
@@ -1,34 +1,34 @@
 from manim import *
+from visualizer.quadrature import IncrementalQuadrature
+from visualizer.quadrature_bars import QuadratureBars, create_sample_dots, get_refine_animation
 
 
 class SimpsonRuleVisualizer:
     def compute_simpson_data(self, integrand, domain, iteration_count):
-        x_start, x_end = domain
-        total_width = x_end - x_start
+        """
+        심프슨 공식 계산 결과를 반환
+        구간을 2배씩 나눌 때 이전 단계의 샘플을 재사용한다 (IncrementalQuadrature).
+        Returns:
+            A list of dict, where each dict has:
+                'subinterval_count', 'subinterval_width', 'bounds', 'heights', 'areas',
+                'integral', 'error'
+        """
+        quadrature = IncrementalQuadrature(integrand, domain)
         data_list = []
-        for step in range(iteration_count):
-            subinterval_count = 2 ** step
-            if subinterval_count < 2:
-                # Skip because we need at least 2 subintervals for Simpson's rule
-                continue
-            subinterval_width = total_width / subinterval_count
-            bounds = [x_start + i *
-                      subinterval_width for i in range(subinterval_count + 1)]
-            areas = []
-            for i in range(0, subinterval_count, 2):
-                x_left = bounds[i]
-                x_mid = bounds[i+1]
-                x_right = bounds[i+2]
-                h0 = integrand(x_left)
-                h1 = integrand(x_mid)
-                h2 = integrand(x_right)
-                area = subinterval_width * (h0 + 4*h1 + h2) / 3
-                areas.append(area)
+        # Skip step 0 because we need at least 2 subintervals for Simpson's rule
+        for step in range(1, iteration_count):
+            subinterval_width = quadrature.subinterval_width(step)
+            heights = quadrature.node_values(step)
+            areas = subinterval_width * \
+                (heights[0:-1:2] + 4 * heights[1::2] + heights[2::2]) / 3
             data_list.append({
-                'subinterval_count': subinterval_count,
+                'subinterval_count': quadrature.subinterval_count(step),
                 'subinterval_width': subinterval_width,
-                'bounds': bounds,
-                'areas': areas
+                'bounds': quadrature.bounds(step),
+                'heights': heights,
+                'areas': areas,
+                'integral': quadrature.simpson(step),
+                'error': quadrature.simpson_error(step)
             })
         return data_list
 
@@ -70,46 +70,23 @@ class SimpsonRuleVisualizer:
             subinterval_count = data['subinterval_count']
             subinterval_width = data['subinterval_width']
             bounds = data['bounds']
-            areas = data['areas']
-
-            shape_group = VGroup()
-            dot_group = VGroup()
-            accumulated_area = sum(areas)
-
-            for i in range(0, subinterval_count, 2):
-                x_left = bounds[i]
-                x_mid = bounds[i+1]
-                x_right = bounds[i+2]
-                h0 = integrand(x_left)
-                h1 = integrand(x_mid)
-                h2 = integrand(x_right)
-
-                points = [
-                    scene.plane.c2p(x_left, 0),
-                    scene.plane.c2p(x_left, h0),
-                    scene.plane.c2p(x_mid, h1),
-                    scene.plane.c2p(x_right, h2),
-                    scene.plane.c2p(x_right, 0)
-                ]
-
-                shape = Polygon(*points, fill_opacity=0.3,
-                                stroke_width=1, color=BLUE)
-                shape_group.add(shape)
-
-                dot1 = Dot(scene.plane.c2p(x_left, h0),
-                           color=PINK, radius=0.05).set_z_index(10)
-                dot2 = Dot(scene.plane.c2p(x_mid, h1), color=PINK,
-                           radius=0.05).set_z_index(10)
-                dot3 = Dot(scene.plane.c2p(x_right, h2),
-                           color=PINK, radius=0.05).set_z_index(10)
-                dot_group.add(dot1, dot2, dot3)
+            heights = data['heights']
+            accumulated_area = data['integral']
+
+            # 소구간 두 개씩 묶은 조각 전체를 하나의 점 배열로
+            shape_group = QuadratureBars.simpson_panels(
+                scene.plane,
+                bounds,
+                heights,
+                negative_color=BLUE
+            )
+            dot_group = create_sample_dots(scene.plane, bounds, heights)
 
             formatted_area = f"{accumulated_area:.6f}".rstrip('0').rstrip('.')
             formatted_dx = f"{subinterval_width:.6f}".rstrip('0').rstrip('.')
 
             if prev_shapes:
                 scene.play(
-                    FadeOut(prev_shapes),
                     FadeOut(prev_dots),
                     Transform(iter_n_str,
                               MathTex(f"n = {subinterval_count}",
@@ -125,10 +102,13 @@ class SimpsonRuleVisualizer:
                               })
                               .move_to(delta_x))
                 )
+                shape_animation = get_refine_animation(
+                    scene, prev_shapes, shape_group)
             else:
                 scene.play(FadeIn(iter_info_text))
+                shape_animation = Create(shape_group)
 
-            scene.play(Create(shape_group), Create(dot_group))
+            scene.play(shape_animation, Create(dot_group))
 
             integral_value.become(
                 MathTex(f"\\approx {formatted_area}",
@@ -1,40 +1,35 @@
 from manim import *
+from visualizer.quadrature import IncrementalQuadrature
+from visualizer.quadrature_bars import QuadratureBars, create_sample_dots, get_refine_animation
 
 
 class TrapezoidalRuleVisualizer:
     def compute_trapezoid_data(self, integrand, domain, iteration_count):
         """
         사다리꼴 공식 계산 결과를 반환
+        구간을 2배씩 나눌 때 이전 단계의 샘플을 재사용한다 (IncrementalQuadrature).
         Returns:
             A list of dict, where each dict has:
-                'subinterval_count', 'subinterval_width', 'bounds', 'areas'
+                'subinterval_count', 'subinterval_width', 'bounds', 'heights', 'areas',
+                'integral', 'error'
         """
-        x_start, x_end = domain
-        total_width = x_end - x_start
+        quadrature = IncrementalQuadrature(integrand, domain)
         data_list = []
 
         for step in range(iteration_count):
-            subinterval_count = 2 ** step
-            subinterval_width = total_width / subinterval_count
-            bounds = [
-                x_start + i * subinterval_width for i in range(subinterval_count + 1)
-            ]
-            areas = []
-
-            for i in range(subinterval_count):
-                x_left = bounds[i]
-                x_right = bounds[i + 1]
-                h1 = integrand(x_left)
-                h2 = integrand(x_right)
-                # 사다리꼴 면적 = (a+b)h/2
-                area = (h1 + h2) * subinterval_width / 2
-                areas.append(area)
+            subinterval_width = quadrature.subinterval_width(step)
+            heights = quadrature.node_values(step)
+            # 사다리꼴 면적 = (a+b)h/2
+            areas = (heights[:-1] + heights[1:]) * subinterval_width / 2
 
             data_list.append({
-                'subinterval_count': subinterval_count,
+                'subinterval_count': quadrature.subinterval_count(step),
                 'subinterval_width': subinterval_width,
-                'bounds': bounds,
-                'areas': areas
+                'bounds': quadrature.bounds(step),
+                'heights': heights,
+                'areas': areas,
+                'integral': quadrature.trapezoid(step),
+                'error': quadrature.trapezoid_error(step)
             })
 
         return data_list
@@ -66,57 +61,6 @@ class TrapezoidalRuleVisualizer:
         scene.play(Write(formulas))
         return formulas
 
-    def _same_sign(self, a, b):
-        return (a >= 0) == (b >= 0)
-
-    def _calc_fill_bg(self, scene, x_left, x_right, h1, h2):
-        if self._same_sign(h1, h2):
-            color = BLUE if h1 >= 0 else PINK
-            bg = Polygon(
-                *[
-                    scene.plane.c2p(x_left, 0),
-                    scene.plane.c2p(x_left, h1),
-                    scene.plane.c2p(x_right, h2),
-                    scene.plane.c2p(x_right, 0)
-                ],
-                fill_color=color,
-                fill_opacity=0.3,
-                stroke_opacity=0
-            )
-            if h1 >= 0:
-                return bg, None
-            else:
-                return None, bg
-        else:
-            if h1 >= 0:
-                upper_pt1 = scene.plane.c2p(x_left, 0)
-                upper_pt2 = scene.plane.c2p(x_left, h1)
-                upper_pt3 = scene.plane.c2p(x_right, 0)
-
-                lower_pt1 = scene.plane.c2p(x_left, 0)
-                lower_pt2 = scene.plane.c2p(x_right, 0)
-                lower_pt3 = scene.plane.c2p(x_right, h2)
-            else:
-                upper_pt1 = scene.plane.c2p(x_left, 0)
-                upper_pt2 = scene.plane.c2p(x_right, 0)
-                upper_pt3 = scene.plane.c2p(x_right, h2)
-
-                lower_pt1 = scene.plane.c2p(x_left, h1)
-                lower_pt2 = scene.plane.c2p(x_left, 0)
-                lower_pt3 = scene.plane.c2p(x_right, 0)
-
-            upper_part_fill_bg = Polygon(
-                upper_pt1, upper_pt2, upper_pt3,
-                fill_color=BLUE, fill_opacity=0.3, stroke_opacity=0
-            )
-
-            lower_part_fill_bg = Polygon(
-                lower_pt1, lower_pt2, lower_pt3,
-                fill_color=PINK, fill_opacity=0.3, stroke_opacity=0
-            )
-
-            return upper_part_fill_bg, lower_part_fill_bg
-
     def visualize(
         self,
         scene,
@@ -163,59 +107,28 @@ class TrapezoidalRuleVisualizer:
         for step, data in enumerate(trapezoid_data):
             integral_value.become(MathTex("", font_size=48, color=YELLOW))
 
-            subinterval_count = data['subinterval_count']
             subinterval_width = data['subinterval_width']
             bounds = data['bounds']
-            areas = data['areas']
-
-            trapezoid_group = VGroup()
-            dot_group = VGroup()
-            accumulated_area = sum(areas)
-
-            for i in range(subinterval_count):
-                x_left = bounds[i]
-                x_right = bounds[i + 1]
-                h1 = integrand(x_left)
-                h2 = integrand(x_right)
-
-                # 'delta x' 구간에서 함수의 양끝 값의 '부호'가 다를 경우에 정상적으로 그리기 위해서 리오더링 해줌.
-                bl = scene.plane.c2p(x_left, min(0, h1))
-                tl = scene.plane.c2p(x_left, max(0, h1))
-                tr = scene.plane.c2p(x_right, max(0, h2))
-                br = scene.plane.c2p(x_right, min(0, h2))
-                points = [bl, tl, tr, br]
-
-                trapezoid = Polygon(
-                    *points,
-                    fill_opacity=0
-                ).set_z_index(5)
-                trapezoid_group.add(trapezoid)
-
-                upper_part_fill_bg, lower_part_fill_bg = self._calc_fill_bg(
-                    scene,
-                    x_left,
-                    x_right,
-                    h1,
-                    h2
-                )
-                if upper_part_fill_bg:
-                    trapezoid_group.add(upper_part_fill_bg)
-                if lower_part_fill_bg:
-                    trapezoid_group.add(lower_part_fill_bg)
-
-                # 양 끝점 표시
-                dot1 = Dot(scene.plane.c2p(x_left, h1),
-                           color=PINK, radius=0.05).set_z_index(10)
-                dot2 = Dot(scene.plane.c2p(x_right, h2),
-                           color=PINK, radius=0.05).set_z_index(10)
-                dot_group.add(dot1, dot2)
+            heights = data['heights']
+            accumulated_area = data['integral']
+
+            # 모든 사다리꼴을 하나의 점 배열로 (부호가 바뀌는 구간은 0 에서 잘라 색 구분)
+            trapezoid_group = QuadratureBars.trapezoids(
+                scene.plane,
+                bounds,
+                heights,
+                negative_color=PINK,
+                stroke_color=BLUE,
+                stroke_width=DEFAULT_STROKE_WIDTH
+            ).set_z_index(5)
+            # 양 끝점 표시
+            dot_group = create_sample_dots(scene.plane, bounds, heights)
 
             formatted_area = f"{accumulated_area:.6f}".rstrip('0').rstrip('.')
             formatted_dx = f"{subinterval_width:.6f}".rstrip('0').rstrip('.')
 
             if prev_trapezoids:
                 scene.play(
-                    FadeOut(prev_trapezoids),
                     FadeOut(prev_dots),
                     Transform(iter_n_str,
                               MathTex(f"n = {2 ** step}",
@@ -231,10 +144,13 @@ class TrapezoidalRuleVisualizer:
                               })
                               .move_to(delta_x))
                 )
+                trapezoid_animation = get_refine_animation(
+                    scene, prev_trapezoids, trapezoid_group)
             else:
                 scene.play(FadeIn(iter_info_text))
+                trapezoid_animation = Create(trapezoid_group)
 
-            scene.play(Create(trapezoid_group), Create(dot_group))
+            scene.play(trapezoid_animation, Create(dot_group))
 
             integral_value.become(
                 MathTex(f"\\approx {formatted_area}",
@@ -1,12 +1,18 @@
 from manim import *
 from perceptron import Perceptron
-from perceptron_trainer import PerceptronTrainer
+from perceptron_trainer import BatchPerceptronTrainer, PerceptronTrainer
 
 
 class AndGateLearningVisualization(Scene):
     # 학습 관련 상수
     LEARNING_RATE = 0.1
 
+    # 하이퍼파라미터 탐색 범위 (학습률 x 초기 가중치 x 초기 바이어스 조합을 한 배치로 학습)
+    GRID_LEARNING_RATES = np.linspace(0.05, 1.0, 20)
+    GRID_INIT_WEIGHT_RANGE = [-1.0, 1.0]
+    GRID_INIT_WEIGHT_COUNT = 5  # 가중치 격자: 5 x 5
+    GRID_INIT_BIASES = np.linspace(-1.0, 1.0, 5)
+
     # 좌표평면 관련 상수
     PLANE_SCALE = 1.9
     X_RANGE = [-4.5, 4.5]
@@ -556,6 +562,30 @@ class AndGateLearningVisualization(Scene):
         # 결과 테스트 및 출력
         self._print_test_results(perceptron, training_data)
 
+        # 하이퍼파라미터 조합별 수렴 속도 비교
+        self._explore_hyperparameters(training_data)
+
+    def _explore_hyperparameters(self, training_data: list) -> None:
+        """학습률/초기값 격자 전체를 한 번에 학습하고 학습률별 수렴 결과를 콘솔에 출력합니다."""
+        weight_values = np.linspace(*self.GRID_INIT_WEIGHT_RANGE, self.GRID_INIT_WEIGHT_COUNT)
+        init_weights = np.stack(np.meshgrid(weight_values, weight_values), axis=-1).reshape(-1, 2)
+
+        trainer = BatchPerceptronTrainer.from_grid(
+            self.GRID_LEARNING_RATES, init_weights, self.GRID_INIT_BIASES
+        )
+        history = trainer.train(training_data)
+
+        # 실행 번호는 학습률이 바깥 순서이므로 (학습률 수, 초기값 조합 수)로 묶을 수 있다
+        epoch_counts = history.epoch_counts.reshape(len(self.GRID_LEARNING_RATES), -1)
+        converged = history.converged.reshape(len(self.GRID_LEARNING_RATES), -1)
+
+        print(f"\n하이퍼파라미터 탐색: {history.run_count}개 조합")
+        for rate, counts, done in zip(self.GRID_LEARNING_RATES, epoch_counts, converged):
+            print(
+                f"학습률 {rate:.2f}: 수렴 {done.mean():.0%}, "
+                f"평균 에포크 {counts[done].mean() if done.any() else float('nan'):.1f}"
+            )
+
     def _print_test_results(self, perceptron: Perceptron, training_data: list) -> None:
         """학습 결과를 테스트하고 콘솔에 출력합니다."""
         print("\n결과:")
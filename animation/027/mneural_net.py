@@ -1,4 +1,4 @@
-from typing import Optional, Callable, TypeAlias
+from typing import Optional, Callable, Sequence, TypeAlias
 from manim import *
 from mperceptron_layer import MPerceptronLayer
 
@@ -14,8 +14,107 @@ DEFAULT_FILL_OPACITY: float = 0.2
 DEFAULT_ANIMATION_TIME: float = 0.5
 
 
+def relu(x: np.ndarray) -> np.ndarray:
+    """기본 활성화 함수 (배열 입력)"""
+    return np.maximum(0, x)
+
+
+def apply_activation(
+    activation_fn: Callable, values: np.ndarray
+) -> np.ndarray:
+    """활성화 함수를 배열 전체에 적용
+
+    배열을 받지 못하는 스칼라 함수(예: lambda x: max(0, x))는 np.vectorize로 감싸서 적용한다.
+    """
+    try:
+        result = np.asarray(activation_fn(values), dtype=float)
+        if result.shape == values.shape:
+            return result
+    except (TypeError, ValueError):
+        pass
+    return np.vectorize(activation_fn, otypes=[float])(values)
+
+
+def set_arrow_style(arrow: VMobject, opacity: float, width: float) -> None:
+    """화살표(몸통 + 화살촉)의 불투명도와 선 두께를 바로 변경"""
+    arrow.set_stroke(width=width, opacity=opacity)
+    tip = getattr(arrow, "tip", None)
+    if tip is not None:
+        tip.set_fill(opacity=opacity)
+
+
+def clamped_arrow_width(arrow: VMobject, width: float) -> float:
+    """Arrow와 같은 규칙으로 길이에 맞춰 줄인 선 두께 (짧은 화살표가 뭉개지지 않도록)"""
+    max_ratio = getattr(arrow, "max_stroke_width_to_length_ratio", None)
+    if max_ratio is None:
+        return width
+    # 이후 arrow.scale()에서도 같은 두께를 기준으로 다시 계산되도록 기록
+    arrow.initial_stroke_width = width
+    return min(width, max_ratio * arrow.get_length())
+
+
+class StyleArrayAnimation(Animation):
+    """여러 도형의 불투명도/선 두께를 배열 단위로 보간하는 애니메이션
+
+    .animate 나 FadeOut/FadeIn 처럼 도형 복사본을 만들지 않고,
+    시작값과 목표값 배열 사이를 보간하여 기존 도형의 스타일만 바꾼다.
+
+    Args:
+        mobject: 장면에 올라가 있는 부모 도형 (애니메이션 대상)
+        members: 스타일을 바꿀 도형들
+        opacities: 목표 불투명도 배열
+        widths: 목표 선 두께 배열 (None이면 유지)
+        fill: True면 채우기 불투명도, False면 선(화살표) 불투명도를 바꿈
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        members: Sequence[VMobject],
+        opacities: Sequence[float],
+        widths: Optional[Sequence[float]] = None,
+        fill: bool = False,
+        **kwargs,
+    ):
+        self.members = list(members)
+        self.target_opacities = np.asarray(opacities, dtype=float)
+        self.target_widths = None if widths is None else np.asarray(widths, dtype=float)
+        self.fill = fill
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # 시작 상태는 아래 배열로 보관하므로 대상 복사본이 필요 없다
+        return Mobject()
+
+    def begin(self) -> None:
+        if self.fill:
+            self.start_opacities = np.array([m.get_fill_opacity() for m in self.members])
+        else:
+            self.start_opacities = np.array([m.get_stroke_opacity() for m in self.members])
+        self.start_widths = np.array([m.get_stroke_width() for m in self.members])
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        t = self.rate_func(alpha)
+        opacities = self.start_opacities + (self.target_opacities - self.start_opacities) * t
+        if self.target_widths is None:
+            widths = self.start_widths
+        else:
+            widths = self.start_widths + (self.target_widths - self.start_widths) * t
+
+        for member, opacity, width in zip(self.members, opacities, widths):
+            if self.fill:
+                member.set_fill(opacity=opacity)
+            else:
+                set_arrow_style(member, opacity, width)
+
+
 class MNeuralNet(VGroup):
-    """신경망을 표현하는 클래스"""
+    """신경망을 표현하는 클래스
+
+    - 순전파: 레이어마다 가중치 행렬 곱 한 번 (forward)
+    - 연결 화살표: 레이어 쌍마다 한 번만 생성하고, 입력이 바뀌면 불투명도/두께만 바꿈
+    """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -48,76 +147,98 @@ class MNeuralNet(VGroup):
         from_layer = self.neuron_layers[from_layer_idx]
         to_layer = self.neuron_layers[to_layer_idx]
 
-        # 화살표들을 담을 그룹
-        arrows = VGroup()
-
         # 시작층의 각 퍼셉트론에서 타겟층의 모든 퍼셉트론으로 화살표 생성
-        for from_perceptron in from_layer.perceptrons:
-            for to_perceptron in to_layer.perceptrons:
-                arrow = Arrow(
-                    start=from_perceptron.get_output_point(),
-                    end=to_perceptron.get_input_point(),
-                    stroke_width=stroke_width,
-                    color=stroke_color,
-                    buff=0,
-                    max_tip_length_to_length_ratio=max_tip_length_to_length_ratio,
-                )
-                arrows.add(arrow)
+        arrows = self.create_arrows_between_layers(
+            from_layer,
+            to_layer,
+            np.ones(len(from_layer.perceptrons) * len(to_layer.perceptrons)),
+            stroke_width,
+            stroke_color,
+            max_tip_length_to_length_ratio,
+        )
 
         self.add(arrows)
         self.layer_connections.append(arrows)
         return arrows
 
     def normalize_values(
-        self, values: list[float], min_opacity: float = MIN_OPACITY
-    ) -> list[float]:
+        self, values: Sequence[float], min_opacity: float = MIN_OPACITY
+    ) -> np.ndarray:
         """값들을 불투명도 범위(0.1~1.0)로 정규화"""
-        if not values:
-            return []
+        magnitudes = np.abs(np.asarray(values, dtype=float))
+        if magnitudes.size == 0:
+            return magnitudes
 
-        max_val = max(abs(v) for v in values)
+        max_val = magnitudes.max()
         if max_val == 0:
-            return [min_opacity] * len(values)
+            return np.full(magnitudes.shape, min_opacity)
 
-        return [min_opacity + (1 - min_opacity) * (abs(v) / max_val) for v in values]
+        return min_opacity + (1 - min_opacity) * (magnitudes / max_val)
 
     def create_arrows_between_layers(
         self,
         from_layer: MPerceptronLayer,
         to_layer: MPerceptronLayer,
-        opacities: list[float],
+        opacities: Sequence[float],
         stroke_width: float = DEFAULT_STROKE_WIDTH,
         stroke_color: ManimColor = YELLOW,
         max_tip_length_to_length_ratio: float = DEFAULT_ARROW_TIP_RATIO,
     ) -> VGroup:
-        """두 레이어 사이의 화살표들을 생성하는 헬퍼 메서드"""
+        """두 레이어 사이의 화살표들을 생성하는 헬퍼 메서드
+
+        화살표 순서는 (시작 퍼셉트론, 타겟 퍼셉트론) 순 — opacities[i * 타겟 수 + j]
+        """
         arrows = VGroup()
         arrow_idx = 0
 
         for prev_perceptron in from_layer.perceptrons:
             for current_perceptron in to_layer.perceptrons:
-                opacity = opacities[arrow_idx]
-                if opacity > MIN_OPACITY:
-                    arrow = Arrow(
-                        start=prev_perceptron.get_output_point(),
-                        end=current_perceptron.get_input_point(),
-                        stroke_width=stroke_width,
-                        color=stroke_color,
-                        stroke_opacity=opacity,
-                        buff=0,
-                        max_tip_length_to_length_ratio=max_tip_length_to_length_ratio,
-                    )
-                    arrows.add(arrow)
+                arrow = Arrow(
+                    start=prev_perceptron.get_output_point(),
+                    end=current_perceptron.get_input_point(),
+                    stroke_width=stroke_width,
+                    color=stroke_color,
+                    buff=0,
+                    max_tip_length_to_length_ratio=max_tip_length_to_length_ratio,
+                )
+                set_arrow_style(arrow, opacities[arrow_idx], arrow.get_stroke_width())
+                arrows.add(arrow)
                 arrow_idx += 1
 
         return arrows
 
+    def forward(
+        self,
+        input_values: Sequence[float] | np.ndarray,
+        weights: WeightMatrix,
+        biases: BiasMatrix,
+        activation_fn: Callable = relu,
+    ) -> list[np.ndarray]:
+        """모든 레이어의 활성화 값을 행렬 곱으로 계산
+
+        Args:
+            input_values: (입력 수,) 또는 여러 표본을 한 번에 계산할 때 (표본 수, 입력 수)
+            weights: weights[l] 은 (다음 레이어 뉴런 수, 이전 레이어 뉴런 수) 행렬
+            biases: biases[l] 은 (다음 레이어 뉴런 수,) 벡터
+
+        Returns:
+            입력층을 포함한 레이어별 활성화 값 배열 리스트
+        """
+        activations = [np.asarray(input_values, dtype=float)]
+        for layer_weights, layer_biases in zip(weights, biases):
+            weighted_sum = (
+                activations[-1] @ np.asarray(layer_weights, dtype=float).T
+                + np.asarray(layer_biases, dtype=float)
+            )
+            activations.append(apply_activation(activation_fn, weighted_sum))
+        return activations
+
     def update_input(
         self,
         input_values: list[float],
         weights: WeightMatrix,
         biases: BiasMatrix,
-        activation_fn: Callable[[float], float] = lambda x: max(0, x),
+        activation_fn: Callable[[float], float] = relu,
         stroke_width: float = DEFAULT_STROKE_WIDTH,
         stroke_color: ManimColor = YELLOW,
         max_tip_length_to_length_ratio: float = DEFAULT_ARROW_TIP_RATIO,
@@ -128,148 +249,148 @@ class MNeuralNet(VGroup):
         if not self.neuron_layers:
             return []
 
-        animations = []
+        layer_count = len(self.neuron_layers)
+        activations = self.forward(
+            input_values, weights[: layer_count - 1], biases[: layer_count - 1], activation_fn
+        )
 
         # 1. 입력층 업데이트
-        input_layer = self.neuron_layers[0]
-        input_opacities = self.normalize_values(input_values, MIN_OPACITY)
-
-        # 입력층 애니메이션 생성
-        animations.append(
+        animations = [
             (
-                self._create_layer_opacity_animation(input_layer, input_opacities),
+                self._create_layer_opacity_animation(
+                    self.neuron_layers[0], self.normalize_values(activations[0])
+                ),
                 opacity_animation_time,
             )
-        )
-
-        prev_activations = input_values
+        ]
 
         # 2. 은닉층과 출력층 업데이트
-        for layer_idx in range(1, len(self.neuron_layers)):
-            current_layer = self.neuron_layers[layer_idx]
-            layer_weights = weights[layer_idx - 1]
-            layer_biases = biases[layer_idx - 1]
-
-            # 활성화 값과 연결 가중치 계산
-            current_activations, connection_weights = self._calculate_layer_activations(
-                prev_activations, layer_weights, layer_biases, activation_fn
-            )
+        for layer_idx in range(1, layer_count):
+            # 화살표 순서(시작, 타겟)에 맞춰 가중치 행렬을 전치하여 펼침
+            connection_weights = np.asarray(weights[layer_idx - 1], dtype=float).T.ravel()
+            connection_opacities = self.normalize_values(connection_weights, MIN_OPACITY)
 
-            # 화살표 업데이트 애니메이션
-            connection_opacities = self.normalize_values(
-                connection_weights, MIN_OPACITY
-            )
-            connection_anims = self._update_layer_connections(
-                layer_idx,
-                self.neuron_layers[layer_idx - 1],
-                current_layer,
-                connection_opacities,
-                stroke_width,
-                stroke_color,
-                max_tip_length_to_length_ratio,
-            )
-            animations.extend(
-                (anim, connection_animation_time) for anim in connection_anims
+            animations.append(
+                (
+                    self._update_layer_connections(
+                        layer_idx,
+                        self.neuron_layers[layer_idx - 1],
+                        self.neuron_layers[layer_idx],
+                        connection_opacities,
+                        stroke_width,
+                        stroke_color,
+                        max_tip_length_to_length_ratio,
+                    ),
+                    connection_animation_time,
+                )
             )
 
             # 뉴런 불투명도 업데이트 애니메이션
-            neuron_opacities = self.normalize_values(current_activations, MIN_OPACITY)
             animations.append(
                 (
                     self._create_layer_opacity_animation(
-                        current_layer, neuron_opacities
+                        self.neuron_layers[layer_idx],
+                        self.normalize_values(activations[layer_idx], MIN_OPACITY),
                     ),
                     opacity_animation_time,
                 )
             )
 
-            prev_activations = current_activations
-
         return animations
 
-    def _calculate_layer_activations(
-        self,
-        prev_activations: list[float],
-        layer_weights: list[list[float]],
-        layer_biases: list[float],
-        activation_fn: Callable[[float], float],
-    ) -> tuple[list[float], list[float]]:
-        """레이어의 활성화 값과 연결 가중치를 계산"""
-        current_activations = []
-        connection_weights = []
-
-        for weights, bias in zip(layer_weights, layer_biases):
-            weighted_sum = sum(w * a for w, a in zip(weights, prev_activations)) + bias
-            current_activations.append(activation_fn(weighted_sum))
-            connection_weights.extend(weights)
-
-        return current_activations, connection_weights
-
     def _create_layer_opacity_animation(
-        self, layer: MPerceptronLayer, opacities: list[float]
+        self, layer: MPerceptronLayer, opacities: Sequence[float]
     ) -> Animation:
         """레이어 뉴런들의 불투명도 변경 애니메이션 생성"""
-        return AnimationGroup(
-            *[
-                perceptron.main_outer_circle.animate.set_fill(opacity=opacity)
-                for perceptron, opacity in zip(layer.perceptrons, opacities)
-            ]
+        return StyleArrayAnimation(
+            layer,
+            [perceptron.main_outer_circle for perceptron in layer.perceptrons],
+            opacities,
+            fill=True,
         )
 
-    def _update_layer_connections(
+    def _get_layer_connection(
         self,
         layer_idx: int,
         from_layer: MPerceptronLayer,
         to_layer: MPerceptronLayer,
-        connection_opacities: list[float],
         stroke_width: float,
         stroke_color: ManimColor,
         max_tip_length_to_length_ratio: float,
-    ) -> list[Animation]:
-        """레이어 간 연결 업데이트 애니메이션 생성"""
-        animations = []
-
+    ) -> VGroup:
+        """레이어 간 연결 화살표 (처음 한 번만 보이지 않는 상태로 생성)"""
         # layer_connections 리스트 자동 확장
         while len(self.layer_connections) <= layer_idx - 1:
             self.layer_connections.append(VGroup())
             self.add(self.layer_connections[-1])
 
-        # 이전 화살표 제거
-        old_arrows = self.layer_connections[layer_idx - 1]
-        if old_arrows and old_arrows in self.submobjects:
-            animations.append(FadeOut(old_arrows))
-            self.remove(old_arrows)
+        arrows = self.layer_connections[layer_idx - 1]
+        arrow_count = len(from_layer.perceptrons) * len(to_layer.perceptrons)
+        if len(arrows) == arrow_count:
+            if arrows.submobjects and arrows[0].get_stroke_color() != ManimColor(stroke_color):
+                arrows.set_color(stroke_color)
+            if arrows not in self.submobjects:
+                self.add(arrows)
+            return arrows
+
+        # 레이어 구성이 바뀐 경우에만 새로 생성
+        self.remove(arrows)
+        arrows = self.create_arrows_between_layers(
+            from_layer,
+            to_layer,
+            np.zeros(arrow_count),
+            stroke_width,
+            stroke_color,
+            max_tip_length_to_length_ratio,
+        )
+        self.layer_connections[layer_idx - 1] = arrows
+        self.add(arrows)
+        return arrows
 
-        # 새 화살표 생성 및 추가
-        new_arrows = self.create_arrows_between_layers(
+    def _update_layer_connections(
+        self,
+        layer_idx: int,
+        from_layer: MPerceptronLayer,
+        to_layer: MPerceptronLayer,
+        connection_opacities: Sequence[float],
+        stroke_width: float,
+        stroke_color: ManimColor,
+        max_tip_length_to_length_ratio: float,
+    ) -> Animation:
+        """레이어 간 연결 업데이트 애니메이션 생성 (기존 화살표의 스타일만 변경)"""
+        arrows = self._get_layer_connection(
+            layer_idx,
             from_layer,
             to_layer,
-            connection_opacities,
             stroke_width,
             stroke_color,
             max_tip_length_to_length_ratio,
         )
-        self.layer_connections[layer_idx - 1] = new_arrows
-        self.add(new_arrows)
-        animations.append(FadeIn(new_arrows))
 
-        return animations
+        # 가중치가 0인 연결(최소 불투명도)은 숨김
+        opacities = np.asarray(connection_opacities, dtype=float)
+        opacities = np.where(opacities > MIN_OPACITY, opacities, 0)
+        return StyleArrayAnimation(
+            arrows,
+            arrows.submobjects,
+            opacities,
+            widths=[clamped_arrow_width(arrow, stroke_width) for arrow in arrows],
+        )
 
     def reset_network(self) -> list[VGroup]:
-        """신경망을 초기 상태로 즉시 리셋하고 제거할 화살표들을 반환"""
+        """신경망을 초기 상태로 즉시 리셋
+
+        연결 화살표는 제거하지 않고 숨겨 두었다가 다음 update_input에서 다시 사용하므로
+        장면에서 제거할 화살표는 없다 (빈 리스트 반환).
+        """
         # 모든 뉴런의 불투명도를 기본값으로 리셋
         for layer in self.neuron_layers:
             for perceptron in layer.perceptrons:
                 perceptron.main_outer_circle.set_fill(opacity=DEFAULT_FILL_OPACITY)
 
-        # 제거할 화살표들 수집 및 제거
-        arrows_to_remove = [
-            arrows
-            for arrows in self.layer_connections
-            if arrows and arrows in self.submobjects
-        ]
-        for arrows in arrows_to_remove:
-            self.remove(arrows)
+        # 화살표는 숨기기만 함
+        for arrows in self.layer_connections:
+            for arrow in arrows:
+                set_arrow_style(arrow, 0, arrow.get_stroke_width())
 
-        self.layer_connections.clear()
-        return arrows_to_remove
+        return []
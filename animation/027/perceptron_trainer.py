@@ -1,14 +1,209 @@
-from perceptron import Perceptron
-from typing import Dict, Any, Callable
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from perceptron import Perceptron, step_function
+
+# 기록 배열의 초기 에포크 용량 (부족하면 두 배씩 늘림)
+INITIAL_HISTORY_CAPACITY = 64
+
+
+def vectorize_activation(
+    activation_function: Callable[[float], int]
+) -> Callable[[np.ndarray], np.ndarray]:
+    """스칼라 활성화 함수를 배열에 적용하는 함수로 변환 (계단 함수는 NumPy 비교로 처리)"""
+    if activation_function is step_function:
+        return lambda summation: (summation > 0).astype(float)
+    return np.vectorize(activation_function, otypes=[float])
+
+
+@dataclass
+class TrainingHistory:
+    """배치 학습 기록 (epochs: 기록된 에포크 수, runs: 동시에 학습한 퍼셉트론 수, d: 입력 수)
+
+    weights/biases/errors 는 각 에포크 시작 전 상태와 그 상태의 전체 오류이다.
+    """
+
+    weights: np.ndarray  # (epochs, runs, d)
+    biases: np.ndarray  # (epochs, runs)
+    errors: np.ndarray  # (epochs, runs)
+    learning_rates: np.ndarray  # (runs,)
+    epoch_counts: np.ndarray  # (runs,) 실행별 기록된 에포크 수 (수렴한 에포크 + 1)
+    converged: np.ndarray  # (runs,) bool
+    final_weights: np.ndarray  # (runs, d)
+    final_biases: np.ndarray  # (runs,)
+
+    @property
+    def run_count(self) -> int:
+        return len(self.learning_rates)
+
+    def epoch_data(self, run: int, epoch: int) -> Dict[str, Any]:
+        """기존 epoch_callbacks 형식의 에포크 데이터"""
+        return {
+            "epoch": epoch,
+            "total_error": float(self.errors[epoch, run]),  # 이전 가중치에 맞는 오류
+            "weights": self.weights[epoch, run].tolist(),  # 이전 가중치
+            "bias": float(self.biases[epoch, run]),  # 이전 바이어스
+            "learning_rate": float(self.learning_rates[run]),
+        }
+
+    def iter_epoch_data(self, run: int = 0) -> Iterator[Dict[str, Any]]:
+        """한 실행의 에포크 데이터를 필요할 때 하나씩 생성"""
+        for epoch in range(int(self.epoch_counts[run])):
+            yield self.epoch_data(run, epoch)
+
+
+class BatchPerceptronTrainer:
+    """여러 퍼셉트론(학습률/초기값 조합)을 NumPy 배치로 동시에 학습
+
+    학습 규칙은 PerceptronTrainer와 같은 온라인 방식이다.
+    표본 순서대로 갱신하되, 표본 하나의 갱신을 모든 실행에 한 번에 적용한다.
+    수렴한 실행은 오류가 0이므로 더 이상 값이 바뀌지 않는다.
+    """
+
+    def __init__(
+        self,
+        learning_rates: float | Sequence[float],
+        init_weights: Optional[Sequence[Sequence[float]]] = None,
+        init_biases: Optional[float | Sequence[float]] = None,
+        activation_function: Callable[[float], int] = step_function,
+    ) -> None:
+        """
+        Args:
+            learning_rates: 스칼라 또는 실행별 (runs,) 학습률
+            init_weights: (runs, d) 또는 (d,) 초기 가중치 (생략 시 0)
+            init_biases: 스칼라 또는 실행별 (runs,) 초기 바이어스 (생략 시 0)
+        """
+        self.learning_rates = np.atleast_1d(np.asarray(learning_rates, dtype=float))
+        self.init_weights = (
+            None if init_weights is None else np.atleast_2d(np.asarray(init_weights, dtype=float))
+        )
+        self.init_biases = (
+            None if init_biases is None else np.atleast_1d(np.asarray(init_biases, dtype=float))
+        )
+        self.activation = vectorize_activation(activation_function)
+
+    @classmethod
+    def from_grid(
+        cls,
+        learning_rates: Sequence[float],
+        init_weights: Sequence[Sequence[float]],
+        init_biases: Sequence[float],
+        **kwargs,
+    ) -> "BatchPerceptronTrainer":
+        """학습률 x 초기 가중치 x 초기 바이어스의 모든 조합을 한 배치로 펼친다
+
+        실행 번호 = (학습률 번호 * 가중치 수 + 가중치 번호) * 바이어스 수 + 바이어스 번호
+        """
+        rates, weights, biases = np.meshgrid(
+            np.asarray(learning_rates, dtype=float),
+            np.arange(len(init_weights)),
+            np.asarray(init_biases, dtype=float),
+            indexing="ij",
+        )
+        return cls(
+            rates.ravel(),
+            np.asarray(init_weights, dtype=float)[weights.ravel()],
+            biases.ravel(),
+            **kwargs,
+        )
+
+    def train(
+        self,
+        training_data: list[tuple[list[float], int]],
+        epochs: int = 10000,
+    ) -> TrainingHistory:
+        """모든 실행을 학습하고 에포크별 기록 반환 (모든 실행이 수렴하면 조기 종료)"""
+        inputs = np.asarray([sample for sample, _ in training_data], dtype=float)  # (n, d)
+        targets = np.asarray([target for _, target in training_data], dtype=float)  # (n,)
+        dim = inputs.shape[1]
+
+        runs = max(
+            len(self.learning_rates),
+            0 if self.init_weights is None else len(self.init_weights),
+            0 if self.init_biases is None else len(self.init_biases),
+        )
+        rates = np.broadcast_to(self.learning_rates, (runs,)).copy()
+        weights = (
+            np.zeros((runs, dim))
+            if self.init_weights is None
+            else np.broadcast_to(self.init_weights, (runs, dim)).copy()
+        )
+        biases = (
+            np.zeros(runs)
+            if self.init_biases is None
+            else np.broadcast_to(self.init_biases, (runs,)).copy()
+        )
+
+        capacity = min(epochs, INITIAL_HISTORY_CAPACITY)
+        weight_history = np.empty((capacity, runs, dim))
+        bias_history = np.empty((capacity, runs))
+        error_history = np.empty((capacity, runs))
+        epoch_counts = np.full(runs, epochs)
+        converged = np.zeros(runs, dtype=bool)
+
+        epoch = 0
+        for epoch in range(epochs):
+            if epoch == capacity:
+                capacity = min(epochs, capacity * 2)
+                weight_history = self._grow(weight_history, capacity)
+                bias_history = self._grow(bias_history, capacity)
+                error_history = self._grow(error_history, capacity)
+
+            # 현재 에포크 시작 전의 상태와 그 상태의 전체 오류 (모든 표본을 한 번에 계산)
+            weight_history[epoch] = weights
+            bias_history[epoch] = biases
+            predictions = self.activation(weights @ inputs.T + biases[:, None])  # (runs, n)
+            error_history[epoch] = np.abs(targets - predictions).sum(axis=1)
+
+            # 온라인 학습: 표본 하나씩, 모든 실행에 한 번에 갱신
+            total_error = np.zeros(runs)
+            for sample, target in zip(inputs, targets):
+                error = target - self.activation(weights @ sample + biases)  # (runs,)
+                total_error += np.abs(error)
+                delta = rates * error
+                weights += delta[:, None] * sample
+                biases += delta
+
+            # 이번 에포크에서 처음 오류가 0이 된 실행 기록
+            newly_converged = (total_error == 0) & ~converged
+            epoch_counts[newly_converged] = epoch + 1
+            converged |= newly_converged
+            if converged.all():
+                break
+
+        recorded = int(epoch_counts.max()) if runs else 0
+        return TrainingHistory(
+            weights=weight_history[:recorded],
+            biases=bias_history[:recorded],
+            errors=error_history[:recorded],
+            learning_rates=rates,
+            epoch_counts=epoch_counts,
+            converged=converged,
+            final_weights=weights,
+            final_biases=biases,
+        )
+
+    @staticmethod
+    def _grow(history: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty((capacity,) + history.shape[1:])
+        grown[: len(history)] = history
+        return grown
 
 
 class PerceptronTrainer:
-    """단층 퍼셉트론의 학습을 담당하는 클래스"""
+    """단층 퍼셉트론의 학습을 담당하는 클래스
+
+    학습은 BatchPerceptronTrainer(실행 1개)로 수행하고,
+    에포크 기록은 학습이 끝난 뒤 epoch_callbacks 에 차례로 전달한다.
+    """
 
     perceptron: Perceptron
     learning_rate: float
 
     epoch_callbacks: list[Callable[[Dict[str, Any]], None]]
+    history: Optional[TrainingHistory]
 
     def __init__(self, perceptron: Perceptron, learning_rate: float = 0.1) -> None:
         """학습기 초기화"""
@@ -16,12 +211,13 @@ class PerceptronTrainer:
         self.learning_rate = learning_rate
 
         self.epoch_callbacks = []
+        self.history = None
 
     def train(
         self,
         training_data: list[tuple[list[float], int]],
         epochs: int = 10000,
-    ) -> None:
+    ) -> TrainingHistory:
         """
         퍼셉트론 학습 수행
 
@@ -29,76 +225,32 @@ class PerceptronTrainer:
             training_data: 학습 데이터 세트
             epochs: 최대 학습 반복 횟수
         """
-        learning_rate = self.learning_rate
-
-        # 특정 가중치와 바이어스로 예측했을 때의 오류를 계산하는 함수
-        def calculate_error_for_weights(weights, bias):
-            # 현재 가중치와 바이어스를 임시 저장
-            orig_weights = self.perceptron.input_weights.copy()
-            orig_bias = self.perceptron.input_bias
+        trainer = BatchPerceptronTrainer(
+            self.learning_rate,
+            init_weights=[self.perceptron.input_weights],
+            init_biases=self.perceptron.input_bias,
+            activation_function=self.perceptron.activation_function,
+        )
+        self.history = trainer.train(training_data, epochs)
 
-            # 주어진 가중치와 바이어스로 설정
-            self.perceptron.input_weights = weights.copy()
-            self.perceptron.input_bias = bias
+        # 학습된 가중치와 바이어스 반영
+        self.perceptron.input_weights = self.history.final_weights[0].tolist()
+        self.perceptron.input_bias = float(self.history.final_biases[0])
 
-            # 오류 계산
-            total_error = 0
-            for inputs, target in training_data:
-                prediction = self.perceptron.predict(inputs)
-                error = target - prediction
-                total_error += abs(error)
+        if self.history.converged[0]:
+            print(f"학습 완료! (epoch {self.history.epoch_counts[0] - 1})")
 
-            # 원래 가중치와 바이어스 복원
-            self.perceptron.input_weights = orig_weights
-            self.perceptron.input_bias = orig_bias
+        self.replay_epoch_callbacks()
+        return self.history
 
-            return total_error
+    def replay_epoch_callbacks(self, run: int = 0) -> None:
+        """기록된 에포크 데이터를 등록된 콜백에 차례로 전달 (콜백이 없으면 데이터를 만들지 않음)"""
+        if not self.epoch_callbacks or self.history is None:
+            return
 
-        for epoch in range(epochs):
-            # 현재 에포크 시작 전의 상태 저장
-            prev_weights = self.perceptron.input_weights.copy()
-            prev_bias = self.perceptron.input_bias
-
-            # 현재 학습 진행
-            total_error = 0
-            for inputs, target in training_data:
-                prediction = self.perceptron.predict(inputs)
-                error = target - prediction
-                total_error += abs(error)
-
-                if error != 0:
-                    # 가중치 업데이트
-                    for i in range(len(self.perceptron.input_weights)):
-                        weight_delta = learning_rate * error * inputs[i]
-                        self.perceptron.update_input_weight(i, weight_delta)
-
-                    # 바이어스 업데이트
-                    bias_delta = learning_rate * error
-                    self.perceptron.update_input_bias(bias_delta)
-
-            # 이전 가중치와 바이어스에 맞는 오류값 계산
-            prev_error = calculate_error_for_weights(prev_weights, prev_bias)
-
-            # 에포크 콜백 호출
-            if self.epoch_callbacks:
-                epoch_data = {
-                    "epoch": epoch,
-                    "total_error": prev_error,  # 이전 가중치에 맞는 오류
-                    "weights": prev_weights,  # 이전 가중치
-                    "bias": prev_bias,  # 이전 바이어스
-                    "learning_rate": self.learning_rate,  # 학습률 추가
-                }
-
-                print(f"Epoch {epoch}: Total Error {prev_error}")
-                print(f"Weights: {prev_weights}, Bias: {prev_bias}")
-
-                for callback in self.epoch_callbacks:
-                    callback(epoch_data)
-
-            # 오차가 0이면 학습 종료
-            if total_error == 0:
-                print(f"학습 완료! (epoch {epoch})")
-                break
+        for epoch_data in self.history.iter_epoch_data(run):
+            for callback in self.epoch_callbacks:
+                callback(epoch_data)
 
     def add_epoch_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """에포크 완료 시 호출할 콜백 함수 등록"""
@@ -2,34 +2,14 @@ import numpy as np
 from manim import *
 from typing import Callable, Union, Any
 
+from common.gradient_descent import GradientDescent
+
 
 # 비대칭을 강조한 W형태 함수
 def f(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     return 0.2 * (1.5 * x**4 - 3.9 * x**2 + 3 * x) + 1.35
 
 
-def numerical_diff(f: Callable[[float], float], x: float) -> float:
-    h: float = 1e-4
-    return (f(x + h) - f(x - h)) / (2 * h)
-
-
-def numerical_gradient(f: Callable[[np.ndarray], float], x: np.ndarray) -> np.ndarray:
-    grad: np.ndarray = np.zeros_like(x)
-
-    for i in range(x.size):
-        tmp_val = x[i]  # 원래 값 저장
-
-        def f_partial(t: float) -> float:
-            x[i] = t  # 임시로 값 변경
-            ret = f(x)
-            x[i] = tmp_val  # 원래 값 복원
-            return ret
-
-        grad[i] = numerical_diff(f_partial, tmp_val)
-
-    return grad
-
-
 # gradient descent 관련 전역 상수
 LEARNING_RATE: float = (
     # 0.2  # 시각화 대상 함수에 대해서 정상적으로 최소값을 찾지 못하는 학습률
@@ -40,23 +20,16 @@ MAX_ITER: int = 10
 
 
 def gradient_descent(
-    f: Callable[[np.ndarray], float], init_x: np.ndarray
+    f: Callable[[np.ndarray], np.ndarray], init_x: np.ndarray
 ) -> tuple[np.ndarray, list[np.ndarray], list[np.ndarray], list[float]]:
-    x: np.ndarray = init_x
-    x_history: list[np.ndarray] = [x.copy()]
-    grad_history: list[np.ndarray] = []
-    f_history: list[float] = [f(x)]
+    # 벡터화된 중앙 차분을 쓰는 공용 배치 엔진으로 한 개의 경로만 계산
+    result = GradientDescent(f).run(init_x, LEARNING_RATE, MAX_ITER)
 
-    for i in range(MAX_ITER):
-        grad = numerical_gradient(f, x)
-        x -= LEARNING_RATE * grad
+    x_history: list[np.ndarray] = list(result.trajectory(0))
+    grad_history: list[np.ndarray] = list(result.gradients[:, 0])
+    f_history: list[float] = result.values[:, 0].tolist()
 
-        # 히스토리 저장
-        x_history.append(x.copy())
-        grad_history.append(grad)
-        f_history.append(f(x))
-
-    return x, x_history, grad_history, f_history
+    return result.final_points[0], x_history, grad_history, f_history
 
 
 class GradientDescent2D(ZoomedScene):
@@ -246,11 +219,9 @@ class GradientDescent2D(ZoomedScene):
             FadeIn(iter_label), FadeIn(lr_label), FadeIn(x_label), FadeIn(grad_label)
         )
 
-        # Gradient Descent 실행 - lambda 함수 수정
+        # Gradient Descent 실행
         init_x = np.array([self.INIT_X])
-        _, x_history, grad_history, _ = gradient_descent(
-            lambda x: f(x[0]), init_x  # float() 대신 인덱싱 사용
-        )
+        _, x_history, grad_history, _ = gradient_descent(f, init_x)
 
         # 시작점과 현재점 생성 - 명시적 인덱싱 사용
         start_x = x_history[0][0]  # 명시적 인덱싱
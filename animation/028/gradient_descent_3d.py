@@ -2,6 +2,9 @@ import numpy as np
 from scipy import optimize
 from manim import *
 
+from common.gradient_descent import GradientDescent, numerical_gradient as batch_numerical_gradient
+from common.surface_mesh import choose_resolution, default_surface_mesh_builder, projected_screen_size
+
 
 # 3D 원형 링을 생성하는 헬퍼 함수 추가
 def create_circle_3d(radius, color, normal=None, stroke_width=2, num_components=24):
@@ -95,7 +98,9 @@ class Config:
         # 모드별 설정
         if mode == "dev":
             # 개발용 설정 - 빠른 렌더링 우선
-            self.surface_resolution = (25, 25)  # 낮은 해상도
+            self.surface_resolution = (25, 25)  # 최대 해상도 (낮음)
+            self.surface_min_resolution = 6  # 최소 해상도
+            self.surface_face_pixels = 48  # 면 하나의 목표 화면 크기 (픽셀, 클수록 거침)
             self.contour_levels_count = 3  # 적은 등고선
             self.gd_init_point = (1.5, 1.5)  # 시작점
             # self.gd_learning_rate = 0.1  # 학습률
@@ -114,7 +119,9 @@ class Config:
         else:  # "prod" (프로덕션)
             # 프로덕션용 설정 - 고품질 우선
             # self.surface_resolution = (50, 50)  # 높은 해상도
-            self.surface_resolution = (50, 50)  # 높은 해상도
+            self.surface_resolution = (50, 50)  # 최대 해상도 (높음)
+            self.surface_min_resolution = 20  # 최소 해상도
+            self.surface_face_pixels = 12  # 면 하나의 목표 화면 크기 (픽셀)
             self.contour_levels_count = 8  # 많은 등고선
             self.gd_init_point = (1.5, 1.5)  # 시작점
             # self.gd_learning_rate = 0.1  # 미세 조정된 학습률
@@ -143,23 +150,15 @@ def f_for_minimize(xy):
     return f(xy[0], xy[1], 0)  # 오프셋 없이 원래 함수의 최솟값을 계산
 
 
-# 수치 미분을 이용한 그래디언트 계산
+# 수치 미분을 이용한 그래디언트 계산 (xy: (2,) 또는 (..., 2) 점 배열)
 def numerical_gradient(f, xy, h=1e-4, z_offset=2.0):
-    x, y = xy
-    df_dx = (f(x + h, y, z_offset) - f(x - h, y, z_offset)) / (2 * h)
-    df_dy = (f(x, y + h, z_offset) - f(x, y - h, z_offset)) / (2 * h)
-    return np.array([df_dx, df_dy])
+    return batch_numerical_gradient(lambda x, y: f(x, y, z_offset), xy, h)
 
 
-# 경사 하강법 구현
+# 경사 하강법 구현 (공용 배치 엔진으로 한 개의 경로만 계산)
 def gradient_descent(f, init_xy, lr=0.2, steps=10, z_offset=2.0):
-    xy = np.array(init_xy, dtype=float)
-    path = [xy.copy()]
-    for _ in range(steps):
-        grad = numerical_gradient(f, xy, z_offset=z_offset)
-        xy -= lr * grad  # 학습률 반영
-        path.append(xy.copy())
-    return np.array(path)
+    descent = GradientDescent(lambda x, y: f(x, y, z_offset))
+    return descent.run(init_xy, lr, steps).trajectory(0)
 
 
 # 자동으로 함수의 최솟값을 찾고 적절한 z_offset 계산
@@ -179,20 +178,17 @@ def calculate_normal_vector(x, y, z_offset=2.0, h=1e-4):
     """
     주어진 점 (x,y)에서 함수 표면의 법선 벡터를 계산합니다.
     항상 곡면 위쪽을 향하는 법선 벡터를 반환합니다.
+    x, y가 배열이면 (..., 3) 모양의 법선 벡터 배열을 한 번에 계산합니다.
     """
     # x, y 방향의 편미분 계산 (그래디언트)
-    df_dx = (f(x + h, y, z_offset) - f(x - h, y, z_offset)) / (2 * h)
-    df_dy = (f(x, y + h, z_offset) - f(x, y - h, z_offset)) / (2 * h)
+    grad = numerical_gradient(f, np.stack([x, y], axis=-1), h, z_offset)
 
     # 법선 벡터: (-df/dx, -df/dy, 1)
     # 이 벡터는 항상 z 성분이 양수입니다 (위를 향함)
-    normal = np.array([-df_dx, -df_dy, 1.0])
+    normal = np.concatenate([-grad, np.ones(grad.shape[:-1] + (1,))], axis=-1)
 
     # 법선 벡터 정규화 (길이 1로)
-    normal_length = np.sqrt(np.sum(normal**2))
-    normal = normal / normal_length
-
-    return normal
+    return normal / np.linalg.norm(normal, axis=-1, keepdims=True)
 
 
 # 법선 벡터 방향으로 오프셋된 점 계산 함수 - 단순화된 버전
@@ -226,25 +222,18 @@ class GradientDescent3D(ThreeDScene):
 
     # 경로에 있는 모든 점과 법선 벡터를 계산하는 함수
     def calculate_path_points_and_normals(self, axes, path_points):
-        normals = []
-        dot_positions = []
-        surface_points = []
-
-        for point in path_points:
-            x, y = point
-            z_val = f(x, y, self.config.z_offset)
-            surface_point = axes.c2p(x, y, z_val)
-            surface_points.append(surface_point)
-
-            # 법선 벡터 계산
-            normal = calculate_normal_vector(x, y, self.config.z_offset)
-            normals.append(normal)
-
-            # 법선 방향으로 오프셋된 점 위치 계산
-            offset_point = (
-                np.array(surface_point) + normal * self.config.dot_height_offset
-            )
-            dot_positions.append(offset_point)
+        path_points = np.asarray(path_points, dtype=float)
+        x, y = path_points[:, 0], path_points[:, 1]
+        z_vals = f(x, y, self.config.z_offset)
+        surface_points = [axes.c2p(*point) for point in zip(x, y, z_vals)]
+
+        # 법선 벡터를 모든 점에 대해 한 번에 계산
+        normals = calculate_normal_vector(x, y, self.config.z_offset)
+
+        # 법선 방향으로 오프셋된 점 위치 계산
+        dot_positions = list(
+            np.array(surface_points) + normals * self.config.dot_height_offset
+        )
 
         return normals, dot_positions, surface_points
 
@@ -338,10 +327,7 @@ class GradientDescent3D(ThreeDScene):
 
         # 벡터화된 함수 값 계산
         X, Y = np.meshgrid(x_vals, y_vals)
-        Z = np.zeros_like(X)
-        for i in range(len(x_vals)):
-            for j in range(len(y_vals)):
-                Z[j, i] = f(X[j, i], Y[j, i], self.config.z_offset)
+        Z = f(X, Y, self.config.z_offset)
 
         min_z = np.min(Z)
         max_z = np.max(Z)
@@ -461,13 +447,21 @@ class GradientDescent3D(ThreeDScene):
 
             contour_group.set_shade_in_3d(True)
 
-        # 3D 곡면 생성 (해상도 설정 반영)
-        surface = Surface(
-            lambda u, v: axes.c2p(u, v, f(u, v, self.config.z_offset)),
-            u_range=[-2, 2],
-            v_range=[-2, 2],
-            resolution=self.config.surface_resolution,
-            color=BLUE,
+        # 3D 곡면 생성 (모드와 화면에 투영된 크기로 해상도 결정, 격자 데이터는 캐시)
+        surface_range = [-2, 2]
+        resolution = choose_resolution(
+            projected_screen_size(axes, surface_range, surface_range),
+            self.config.surface_face_pixels,
+            self.config.surface_min_resolution,
+            self.config.surface_resolution,
+        )
+        surface = default_surface_mesh_builder.build(
+            axes,
+            f,
+            u_range=surface_range,
+            v_range=surface_range,
+            resolution=resolution,
+            args=(self.config.z_offset,),
         )
         surface.set_opacity(self.config.surface_opacity)  # 투명도 증가
         surface.set_shade_in_3d(True)
@@ -0,0 +1,75 @@
+import numpy as np
+import sympy as sp
+from manim import *
+
+from common.gradient_descent import GradientDescent, grid_points, sympy_gradient
+from common.sympy_compiler import compile_expr
+
+# gradient_descent_3d.py 와 같은 함수 (z_offset 제외)
+x_sym, y_sym = sp.symbols("x y")
+r2 = x_sym**2 + y_sym**2
+FUNC_EXPR = r2**2 - 4 * r2 + 2 * x_sym + 3 * y_sym + 2
+
+START_RANGE = [-2, 2]
+START_COUNT = 20  # 20 x 20 = 400개의 경로를 동시에 계산
+LEARNING_RATE = 0.02
+STEPS = 60
+BASIN_COLORS = [BLUE, YELLOW, GREEN, PURPLE, ORANGE]
+
+
+class GradientDescentBasins(Scene):
+    """여러 시작점에서 동시에 경사 하강을 실행하여 수렴 영역(basin of attraction) 표시"""
+
+    def construct(self):
+        plane = NumberPlane(
+            x_range=[-2.5, 2.5, 1],
+            y_range=[-2.5, 2.5, 1],
+            x_length=7,
+            y_length=7,
+            background_line_style={"stroke_opacity": 0.4},
+        )
+        self.add(plane)
+
+        # 해석적 그래디언트로 모든 경로를 한 번의 배치 계산으로 구함
+        f = compile_expr(FUNC_EXPR, x_sym, y_sym)
+        descent = GradientDescent(f, gradient=sympy_gradient(FUNC_EXPR, [x_sym, y_sym]))
+        result = descent.run(
+            grid_points(START_RANGE, START_RANGE, START_COUNT), LEARNING_RATE, STEPS
+        )
+
+        # 도착점(극소점)별로 경로를 묶어 색상 지정
+        minima, basin_index = np.unique(
+            np.round(result.final_points, 1), axis=0, return_inverse=True
+        )
+        basin_index = basin_index.ravel()
+
+        # 평면 좌표 -> 화면 좌표 (경로 전체를 한 번에 변환)
+        origin = plane.c2p(0, 0)
+        x_unit = plane.c2p(1, 0) - origin
+        y_unit = plane.c2p(0, 1) - origin
+        screen_paths = (
+            origin
+            + result.trajectories[..., :1] * x_unit
+            + result.trajectories[..., 1:] * y_unit
+        )
+
+        paths = VGroup()
+        for run in range(screen_paths.shape[1]):
+            color = BASIN_COLORS[basin_index[run] % len(BASIN_COLORS)]
+            paths.add(
+                VMobject(stroke_width=1.5, stroke_color=color, stroke_opacity=0.7)
+                .set_points_as_corners(screen_paths[:, run])
+            )
+
+        start_dots = VGroup(*[
+            Dot(point, radius=0.03, color=paths[run].get_stroke_color())
+            for run, point in enumerate(screen_paths[0])
+        ])
+        minimum_dots = VGroup(*[
+            Dot(plane.c2p(*minimum), radius=0.08, color=RED) for minimum in minima
+        ])
+
+        self.play(FadeIn(start_dots))
+        self.play(Create(paths), run_time=4)
+        self.play(FadeIn(minimum_dots))
+        self.wait(2)
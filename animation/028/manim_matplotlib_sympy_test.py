@@ -4,7 +4,8 @@ import matplotlib.pyplot as plt
 from io import BytesIO
 from PIL import Image
 import sympy as sp
-from sympy.utilities.lambdify import lambdify
+
+from common.sympy_compiler import compile_expr
 
 
 class Display3DPlot(Scene):
@@ -126,7 +127,7 @@ class Display3DPlot(Scene):
 
     def create_3d_plot(self, func_expr, x_sym, y_sym):
         # sympy 표현식을 numpy에서 사용 가능한 함수로 변환
-        f_numpy = lambdify((x_sym, y_sym), func_expr, "numpy")
+        f_numpy = compile_expr(func_expr, x_sym, y_sym)
 
         # 3D 그래프 그리기 위한 x, y 좌표 설정
         x = np.linspace(-2, 2, 100)
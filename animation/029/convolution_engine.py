@@ -0,0 +1,118 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+type IntPair = int | tuple[int, int]
+
+
+def as_pair(value: IntPair) -> tuple[int, int]:
+    """정수 하나 또는 (세로, 가로) 쌍을 (세로, 가로) 쌍으로 정규화"""
+    if isinstance(value, (int, np.integer)):
+        return int(value), int(value)
+    return int(value[0]), int(value[1])
+
+
+def get_output_size(
+    input_size: tuple[int, int],
+    kernel_size: tuple[int, int],
+    stride: IntPair = 1,
+    padding: IntPair = 0,
+    dilation: IntPair = 1,
+) -> tuple[int, int]:
+    """합성곱 결과 크기 ((H + 2p - d(k - 1) - 1) // s + 1)"""
+    stride, padding, dilation = as_pair(stride), as_pair(padding), as_pair(dilation)
+    return tuple(
+        (size + 2 * pad - step * (k - 1) - 1) // s + 1
+        for size, k, s, pad, step in zip(input_size, kernel_size, stride, padding, dilation)
+    )
+
+
+class ConvolutionEngine:
+    """sliding_window_view 로 출력 맵 전체를 한 번에 계산하는 2차원 합성곱 엔진
+
+    - 입력: (H, W) 또는 채널이 있는 (C, H, W)
+    - 커널: (kh, kw), (C, kh, kw), 또는 필터 F개의 (F, C, kh, kw)
+    - 출력: 필터 축이 없으면 (oh, ow), 있으면 (F, oh, ow)
+
+    패딩은 0으로 채우고, 윈도우는 딥러닝 관례대로 커널을 뒤집지 않는다(상호상관).
+    모든 윈도우는 입력 배열을 복사하지 않는 뷰(view)이고, 곱셈-합은 einsum 한 번으로 끝난다.
+    """
+
+    def __init__(
+        self,
+        source,
+        kernel,
+        stride: IntPair = 1,
+        padding: IntPair = 0,
+        dilation: IntPair = 1,
+    ):
+        source = np.asarray(source)
+        kernel = np.asarray(kernel)
+        if source.ndim not in (2, 3):
+            raise ValueError(f"입력은 (H, W) 또는 (C, H, W) 여야 합니다: {source.shape}")
+        if kernel.ndim not in (2, 3, 4):
+            raise ValueError(f"커널은 (kh, kw), (C, kh, kw), (F, C, kh, kw) 중 하나여야 합니다: {kernel.shape}")
+
+        self.has_channels = source.ndim == 3
+        self.has_filters = kernel.ndim == 4
+        self.source = source if self.has_channels else source[None]  # (C, H, W)
+        self.kernel = kernel.reshape((1,) * (4 - kernel.ndim) + kernel.shape)  # (F, C, kh, kw)
+
+        channels = self.source.shape[0]
+        if self.kernel.shape[1] != channels:
+            if kernel.ndim == 2:
+                # 채널 공용 2차원 커널은 모든 채널에 같은 가중치를 적용
+                self.kernel = np.broadcast_to(self.kernel, (1, channels) + self.kernel.shape[2:])
+            else:
+                raise ValueError(
+                    f"커널 채널 수({self.kernel.shape[1]})가 입력 채널 수({channels})와 다릅니다"
+                )
+
+        self.stride = as_pair(stride)
+        self.padding = as_pair(padding)
+        self.dilation = as_pair(dilation)
+        self.kernel_size = self.kernel.shape[2:]
+
+        # 확장(dilation)을 반영한 실제 윈도우 크기
+        self.kernel_extent = tuple(
+            step * (k - 1) + 1 for k, step in zip(self.kernel_size, self.dilation)
+        )
+        self.output_size = get_output_size(
+            self.source.shape[1:], self.kernel_size, self.stride, self.padding, self.dilation
+        )
+        if min(self.output_size) <= 0:
+            raise ValueError(f"커널이 입력보다 큽니다: 출력 크기 {self.output_size}")
+
+        (pad_h, pad_w) = self.padding
+        self.padded = np.pad(self.source, ((0, 0), (pad_h, pad_h), (pad_w, pad_w)))
+
+        self.output = self._compute()
+
+    def _compute(self) -> np.ndarray:
+        # (C, oh, ow, kh, kw) — 보폭/확장은 뷰 슬라이싱으로 처리 (복사 없음)
+        windows = self.get_windows()
+        output = np.einsum("chwij,fcij->fhw", windows, self.kernel)
+        return output if self.has_filters else output[0]
+
+    def get_windows(self) -> np.ndarray:
+        """모든 윈도우의 탭 값 뷰 (C, oh, ow, kh, kw)"""
+        (stride_h, stride_w), (step_h, step_w) = self.stride, self.dilation
+        oh, ow = self.output_size
+        windows = sliding_window_view(self.padded, self.kernel_extent, axis=(1, 2))
+        return windows[:, ::stride_h, ::stride_w, ::step_h, ::step_w][:, :oh, :ow]
+
+    def get_window_origin(self, i: int, j: int) -> tuple[int, int]:
+        """출력 (i, j) 윈도우의 좌상단 위치 (패딩 포함 좌표)"""
+        return i * self.stride[0], j * self.stride[1]
+
+    def get_window_taps(self, i: int, j: int) -> list[tuple[int, int, int, int]]:
+        """출력 (i, j) 윈도우의 탭 목록 [(ki, kj, 패딩 포함 행, 열), ...]"""
+        top, left = self.get_window_origin(i, j)
+        return [
+            (ki, kj, top + ki * self.dilation[0], left + kj * self.dilation[1])
+            for ki in range(self.kernel_size[0])
+            for kj in range(self.kernel_size[1])
+        ]
+
+    def get_window_values(self, i: int, j: int) -> np.ndarray:
+        """출력 (i, j) 윈도우의 탭 값 (C, kh, kw)"""
+        return self.get_windows()[:, i, j]
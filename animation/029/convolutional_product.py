@@ -1,4 +1,5 @@
 from manim import *
+from convolution_engine import ConvolutionEngine, IntPair
 
 type GridSize = tuple[int, int]
 type GridValues = list[list[int | float | str]]
@@ -37,6 +38,13 @@ class ConvolutionVisualizer(VGroup):
         source_fill_opacity: float = 0.15,
         kernel_fill_opacity: float = 0.15,
         result_fill_opacity: float = 0.025,
+        # 합성곱 연산 파라미터
+        stride: IntPair = 1,  # 보폭
+        padding: IntPair = 0,  # 0 패딩 (소스 테이블에 0 셀로 표시)
+        dilation: IntPair = 1,  # 커널 탭 간격
+        # 큰 입력(예: 28x28)용 창 모드: 화면에 보이는 (행, 열) 만큼의 셀만 생성
+        viewport_size: GridSize | None = None,
+        max_animated_windows: int | None = None,  # 이 개수 이후의 윈도우는 애니메이션 없이 한 번에 채움
         # 애니메이션 관련 파라미터 추가
         anim_window_move_time: float = 0.5,  # 윈도우 이동 시간
         anim_result_fadein_time: float = 0.5,  # 결과 표시 시간
@@ -65,11 +73,7 @@ class ConvolutionVisualizer(VGroup):
         self.kernel_fill_opacity = kernel_fill_opacity
         self.result_fill_opacity = result_fill_opacity
 
-        # 결과 크기 계산
-        self.result_size = (
-            source_size[0] - kernel_size[0] + 1,
-            source_size[1] - kernel_size[1] + 1,
-        )
+        self.max_animated_windows = max_animated_windows
 
         # 색상 초기화
         self.colors = self._initialize_colors(colors)
@@ -82,6 +86,23 @@ class ConvolutionVisualizer(VGroup):
         self.source_values = source_values
         self.kernel_values = kernel_values
 
+        # 출력 맵 전체를 미리 계산
+        self.engine = ConvolutionEngine(
+            source_values, kernel_values, stride=stride, padding=padding, dilation=dilation
+        )
+        if self.engine.has_channels or self.engine.has_filters:
+            raise ValueError("테이블 시각화는 단일 채널 입력과 2차원 커널만 지원합니다")
+        self.convolution_output = self.engine.output
+        self.padded_values = self.engine.padded[0]
+        self.result_size = self.engine.output_size
+        self.computed_mask = np.zeros(self.result_size, dtype=bool)
+
+        # 창 모드: 보이는 영역 크기와 시작 위치 (창 모드가 아니면 전체)
+        self.source_view_size = self._get_view_size(self.padded_values.shape, viewport_size)
+        self.result_view_size = self._get_view_size(self.result_size, viewport_size)
+        self.source_view_offset = (0, 0)
+        self.result_view_offset = (0, 0)
+
         # 테이블과 기호 생성
         self._create_source_table()
         self._create_conv_symbol()
@@ -149,20 +170,35 @@ class ConvolutionVisualizer(VGroup):
             values.append(row)
         return values
 
+    @staticmethod
+    def _get_view_size(size: GridSize, viewport_size: GridSize | None) -> GridSize:
+        """창 모드에서 실제로 보이는 (행, 열) 수"""
+        if viewport_size is None:
+            return tuple(size)
+        return min(size[0], viewport_size[0]), min(size[1], viewport_size[1])
+
+    def _get_visible_source_values(self) -> GridValues:
+        """소스 테이블에 보이는 영역의 값 (패딩 포함)"""
+        (top, left), (rows, cols) = self.source_view_offset, self.source_view_size
+        return self.padded_values[top : top + rows, left : left + cols].tolist()
+
+    def _create_source_entry(self, value) -> Text:
+        return Text(
+            str(value),
+            font_size=self.text_font_size,
+            color=self.colors["source_text"],
+        )
+
     def _create_source_table(self) -> None:
-        """소스 테이블 생성"""
+        """소스 테이블 생성 (창 모드에서는 보이는 영역만)"""
         self.source_table = Table(
-            self.source_values,
+            self._get_visible_source_values(),
             include_outer_lines=True,
             line_config={
                 "stroke_width": self.line_thickness,
                 "stroke_color": self.colors["source_stroke"],
             },
-            element_to_mobject=lambda value: Text(
-                str(value),
-                font_size=self.text_font_size,
-                color=self.colors["source_text"],
-            ),
+            element_to_mobject=self._create_source_entry,
             h_buff=self.source_h_buff,
             v_buff=self.source_v_buff,
         )
@@ -213,28 +249,37 @@ class ConvolutionVisualizer(VGroup):
             "=", font_size=self.symbol_font_size, color=self.colors["symbol_color"]
         )
 
+    def _create_result_placeholder(self, i: int, j: int) -> MathTex:
+        """결과 (i, j) 위치를 나타내는 플레이스홀더"""
+        return MathTex(
+            self.RESULT_PLACEHOLDER_TEMPLATE.format(i + 1, j + 1),
+            font_size=self.text_font_size * self.RESULT_TEXT_SCALE,
+            color=GRAY_D,
+        )
+
+    def _create_result_value(self, i: int, j: int) -> MathTex:
+        """결과 (i, j) 위치의 계산값"""
+        return MathTex(
+            str(self._calculate_window_result(i, j)),
+            font_size=self.text_font_size * self.RESULT_VALUE_SCALE,
+            color=WHITE,
+        )
+
     def _create_result_table(self) -> None:
-        """결과 테이블 생성"""
-        # 위치 정보를 담은 플레이스홀더로 초기화
-        result_values = [
-            [
-                self.RESULT_PLACEHOLDER_TEMPLATE.format(i + 1, j + 1)
-                for j in range(self.result_size[1])
-            ]
-            for i in range(self.result_size[0])
+        """결과 테이블 생성 (창 모드에서는 보이는 영역만)"""
+        # 위치 정보를 담은 플레이스홀더로 초기화 (결과 맵 전체 기준 위치)
+        (top, left), (rows, cols) = self.result_view_offset, self.result_view_size
+        result_positions = [
+            [(top + i, left + j) for j in range(cols)] for i in range(rows)
         ]
         self.result_table = Table(
-            result_values,
+            result_positions,
             include_outer_lines=True,
             line_config={
                 "stroke_width": self.line_thickness,
                 "stroke_color": self.colors["result_stroke"],
             },
-            element_to_mobject=lambda value: MathTex(
-                value,
-                font_size=self.text_font_size * self.RESULT_TEXT_SCALE,
-                color=GRAY_D,
-            ),
+            element_to_mobject=lambda position: self._create_result_placeholder(*position),
             h_buff=self.result_h_buff,
             v_buff=self.result_v_buff,
         )
@@ -297,14 +342,12 @@ class ConvolutionVisualizer(VGroup):
     def _create_calculation_formula(self, i: int, j: int, conv_result: int) -> MathTex:
         """현재 윈도우 위치의 계산식 생성"""
         terms = []
-        # 모든 항 표시 (0 곱셈 포함)
-        for ki in range(self.kernel_size[0]):
-            for kj in range(self.kernel_size[1]):
-                source_i, source_j = i + ki, j + kj
-                kernel_val = self.kernel_values[ki][kj]
-                source_val = self.source_values[source_i][source_j]
-                # 항 추가 - 괄호 없이 표시
-                terms.append(f"{kernel_val} \\cdot {source_val}")
+        # 모든 항 표시 (0 곱셈 포함, 패딩 셀은 0, 확장 커널은 떨어진 탭)
+        for ki, kj, source_i, source_j in self.engine.get_window_taps(i, j):
+            kernel_val = self.kernel_values[ki][kj]
+            source_val = self.padded_values[source_i, source_j]
+            # 항 추가 - 괄호 없이 표시
+            terms.append(f"{kernel_val} \\cdot {source_val}")
 
         # 항들을 '+' 로 연결하고 '=' 결과값 추가
         formula = " + ".join(terms) + f" = {conv_result}"
@@ -316,64 +359,147 @@ class ConvolutionVisualizer(VGroup):
         ).shift(DOWN * self.CALC_SHIFT_DOWN)
 
     def show_convolution_product_process(self, scene: Scene) -> None:
-        """합성곱 연산 과정을 애니메이션으로 시각화"""
+        """합성곱 연산 과정을 애니메이션으로 시각화
+
+        max_animated_windows 가 지정되면 그 개수만큼만 윈도우 이동/계산식을 보여주고,
+        나머지 결과는 (미리 계산된 출력 맵에서) 한 번에 채운다.
+        """
         highlight_window = self._create_kernel_sized_window()
         scene.play(Create(highlight_window))
 
         # 계산식 표시용 변수 (이전 수식 제거를 위해)
         current_formula = None
-        convolution_results = []
-
-        for i in range(self.result_size[0]):
-            row_results = []
-            for j in range(self.result_size[1]):
-                # 윈도우 이동
-                window_position = self._get_window_position(i, j)
-                scene.play(
-                    highlight_window.animate.move_to(window_position["center"]),
-                    run_time=self.anim_window_move_time,
-                )
+        window_count = self.result_size[0] * self.result_size[1]
+        animated_count = (
+            window_count
+            if self.max_animated_windows is None
+            else min(window_count, self.max_animated_windows)
+        )
 
-                # 결과 계산
-                conv_result = self._calculate_window_result(i, j)
-                row_results.append(conv_result)
+        for index in range(animated_count):
+            i, j = divmod(index, self.result_size[1])
 
-                # 이전 계산식 제거
-                if current_formula:
-                    scene.remove(current_formula)
+            # 윈도우가 보이는 영역 밖이면 먼저 영역을 옮김
+            self._scroll_source_view(*self.engine.get_window_origin(i, j))
+            self._scroll_result_view(i, j)
 
-                # 새 계산식 표시
-                current_formula = self._create_calculation_formula(i, j, conv_result)
-                scene.play(
-                    Write(current_formula),
-                    run_time=self.anim_result_fadein_time,
-                )
+            # 윈도우 이동
+            window_position = self._get_window_position(i, j)
+            scene.play(
+                highlight_window.animate.move_to(window_position["center"]),
+                run_time=self.anim_window_move_time,
+            )
+
+            # 결과 계산 (미리 계산된 출력 맵에서 조회)
+            conv_result = self._calculate_window_result(i, j)
 
-                # 결과 표시
-                target_entry = self.result_table.get_entries((i + 1, j + 1))
-                result_text = MathTex(
-                    str(conv_result),
-                    font_size=self.text_font_size * self.RESULT_VALUE_SCALE,
-                    color=WHITE,
-                ).move_to(target_entry)
-                target_entry.become(result_text)
+            # 이전 계산식 제거
+            if current_formula:
+                scene.remove(current_formula)
 
-                scene.wait(self.anim_wait_time)
+            # 새 계산식 표시
+            current_formula = self._create_calculation_formula(i, j, conv_result)
+            scene.play(
+                Write(current_formula),
+                run_time=self.anim_result_fadein_time,
+            )
 
-            convolution_results.append(row_results)
+            # 결과 표시
+            self.computed_mask[i, j] = True
+            self._set_result_entry(i, j)
+
+            scene.wait(self.anim_wait_time)
 
         # 마지막 계산식 제거
         if current_formula:
             scene.remove(current_formula)
 
-        self.convolution_results = convolution_results
+        # 남은 윈도우는 애니메이션 없이 결과만 한 번에 채움
+        if animated_count < window_count:
+            self.computed_mask[:] = True
+            self._refresh_result_entries()
+            scene.wait(self.anim_wait_time)
+
+        self.convolution_results = self.convolution_output.tolist()
         return highlight_window
 
+    def _scroll_source_view(self, top: int, left: int) -> bool:
+        """(top, left) 윈도우가 보이도록 소스 테이블의 보이는 영역을 옮김 (옮겼으면 True)"""
+        offset = self._get_scrolled_offset(
+            self.source_view_offset,
+            self.source_view_size,
+            self.padded_values.shape,
+            (top, left),
+            self.engine.kernel_extent,
+        )
+        if offset == self.source_view_offset:
+            return False
+
+        self.source_view_offset = offset
+        for row, values in enumerate(self._get_visible_source_values()):
+            for col, value in enumerate(values):
+                entry = self.source_table.get_entries((row + 1, col + 1))
+                entry.become(self._create_source_entry(value).move_to(entry))
+        return True
+
+    def _scroll_result_view(self, i: int, j: int) -> bool:
+        """결과 (i, j) 셀이 보이도록 결과 테이블의 보이는 영역을 옮김 (옮겼으면 True)"""
+        offset = self._get_scrolled_offset(
+            self.result_view_offset, self.result_view_size, self.result_size, (i, j), (1, 1)
+        )
+        if offset == self.result_view_offset:
+            return False
+
+        self.result_view_offset = offset
+        self._refresh_result_entries()
+        return True
+
+    @staticmethod
+    def _get_scrolled_offset(
+        offset: GridSize,
+        view_size: GridSize,
+        full_size: GridSize,
+        start: GridSize,
+        extent: GridSize,
+    ) -> GridSize:
+        """[start, start + extent) 가 보이는 영역에 들어오도록 한 새 시작 위치
+
+        축마다 영역을 벗어났을 때만 옮기고, 옮길 때는 한 화면씩 넘겨서(start 를 영역 맨 앞에)
+        래스터 순서로 진행할 때 셀을 다시 만드는 횟수를 줄인다.
+        """
+        new_offset = []
+        for first, view, full, lo, length in zip(offset, view_size, full_size, start, extent):
+            if lo < first or lo + length > first + view:
+                first = max(0, min(lo, full - view))
+            new_offset.append(first)
+        return tuple(new_offset)
+
+    def _set_result_entry(self, i: int, j: int) -> None:
+        """결과 (i, j) 셀 내용을 현재 상태(계산값/플레이스홀더)로 바꿈 (보이는 영역일 때만)"""
+        row, col = i - self.result_view_offset[0], j - self.result_view_offset[1]
+        if not (0 <= row < self.result_view_size[0] and 0 <= col < self.result_view_size[1]):
+            return
+
+        target_entry = self.result_table.get_entries((row + 1, col + 1))
+        content = (
+            self._create_result_value(i, j)
+            if self.computed_mask[i, j]
+            else self._create_result_placeholder(i, j)
+        )
+        target_entry.become(content.move_to(target_entry))
+
+    def _refresh_result_entries(self) -> None:
+        """결과 테이블의 보이는 셀 전체를 현재 상태로 갱신"""
+        top, left = self.result_view_offset
+        for row in range(self.result_view_size[0]):
+            for col in range(self.result_view_size[1]):
+                self._set_result_entry(top + row, left + col)
+
     def _create_kernel_sized_window(self) -> Rectangle:
         """커널 크기와 정확히 일치하는 윈도우 생성"""
         source_cell = self.source_table.get_cell((1, 1))
-        window_width = source_cell.width * self.kernel_size[1]
-        window_height = source_cell.height * self.kernel_size[0]
+        window_width = source_cell.width * self.engine.kernel_extent[1]
+        window_height = source_cell.height * self.engine.kernel_extent[0]
         window_position = self._get_window_position(0, 0)
 
         window = Rectangle(
@@ -387,13 +513,18 @@ class ConvolutionVisualizer(VGroup):
         window.move_to(window_position["center"])
         return window
 
-    def _get_window_position(self, top_row: int, left_col: int) -> dict:
-        """특정 셀 위치에서의 윈도우 위치 계산 (마님의 1-based 인덱싱 조정)"""
+    def _get_window_position(self, i: int, j: int) -> dict:
+        """결과 (i, j) 윈도우의 화면 위치 계산 (마님의 1-based 인덱싱 조정)"""
+        # 패딩 포함 좌표 -> 보이는 영역 기준 좌표
+        top_row, left_col = self.engine.get_window_origin(i, j)
+        top_row -= self.source_view_offset[0]
+        left_col -= self.source_view_offset[1]
+
         # 마님은 1-based 인덱싱을 사용하므로, 0-based에서 1-based로 변환
         manim_top_row = top_row + 1
         manim_left_col = left_col + 1
-        manim_bottom_right_row = manim_top_row + self.kernel_size[0] - 1
-        manim_bottom_right_col = manim_left_col + self.kernel_size[1] - 1
+        manim_bottom_right_row = manim_top_row + self.engine.kernel_extent[0] - 1
+        manim_bottom_right_col = manim_left_col + self.engine.kernel_extent[1] - 1
 
         # 윈도우의 좌상단과 우하단 셀
         top_left_cell = self.source_table.get_cell((manim_top_row, manim_left_col))
@@ -412,16 +543,9 @@ class ConvolutionVisualizer(VGroup):
 
         return {"center": center, "width": width, "height": height}
 
-    def _calculate_window_result(self, top_left_i: int, top_left_j: int) -> int:
-        """특정 윈도우 위치에서의 합성곱 결과 계산"""
-        result = 0
-        for i in range(self.kernel_size[0]):
-            for j in range(self.kernel_size[1]):
-                source_i, source_j = top_left_i + i, top_left_j + j
-                kernel_val = self.kernel_values[i][j]
-                source_val = self.source_values[source_i][source_j]
-                result += kernel_val * source_val
-        return result
+    def _calculate_window_result(self, i: int, j: int) -> int | float:
+        """결과 (i, j) 윈도우의 합성곱 결과 (미리 계산된 출력 맵에서 조회)"""
+        return self.convolution_output[i, j].item()
 
 
 class SimpleConvolutionalProduct(Scene):
@@ -448,3 +572,35 @@ class SimpleConvolutionalProduct(Scene):
 
         # final wait
         self.wait(2)
+
+
+class MnistSizedConvolution(Scene):
+    """28x28 입력의 합성곱 (창 모드: 보이는 7x7 셀만 생성)"""
+
+    def construct(self) -> None:
+        # 숫자 0 모양의 28x28 합성 입력 (0~9 밝기)
+        rows, cols = np.mgrid[0:28, 0:28]
+        radius = np.hypot((rows - 13.5) / 9, (cols - 13.5) / 6)
+        source_values = np.rint(9 * np.exp(-(((radius - 1) / 0.25) ** 2))).astype(int)
+
+        conv_vis = ConvolutionVisualizer(
+            source_size=source_values.shape,
+            kernel_size=(3, 3),
+            source_values=source_values.tolist(),
+            kernel_values=[[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]],  # 세로 경계 검출
+            padding=1,
+            viewport_size=(7, 7),
+            max_animated_windows=10,
+            anim_window_move_time=0.3,
+            anim_result_fadein_time=0.3,
+            anim_wait_time=0.3,
+        ).shift(UP * 0.8)
+
+        self.play(FadeIn(conv_vis))
+        self.wait(1)
+
+        highlight_window = conv_vis.show_convolution_product_process(self)
+        self.play(FadeOut(highlight_window))
+
+        # final wait
+        self.wait(2)
@@ -8,6 +8,7 @@ DEFAULT_VECTOR_OPACITY = 1.0
 DEFAULT_DOT_RADIUS = 0.05
 DEFAULT_DOT_OPACITY = 1.2
 DEFAULT_STROKE_OPACITY = 0.3
+MAX_REFERENCE_CACHE_SIZE = 256  # 벡터 애니메이션당 길이별 기준 벡터 캐시 개수
 
 # 벡터 스타일 상수 추가
 VECTOR_STYLE = {
@@ -29,12 +30,19 @@ def create_rotated_vector(plane, direction, color, start_point=ORIGIN, **kwargs)
 
 
 class BaseVectorAnimation(Animation):
-    """벡터 애니메이션의 기본 클래스"""
+    """벡터 애니메이션의 기본 클래스
 
-    def __init__(self, mobject, plane, color=None, **kwargs):
+    매 프레임 Vector를 새로 만들어 become하는 대신, 같은 길이의 기준 벡터(x축 방향)의
+    점 배열을 한 번 만들어 두고 회전 행렬만 곱해 기존 벡터의 점 배열에 제자리에서 쓴다.
+    (in_place=False이면 이전 방식으로 동작)
+    """
+
+    def __init__(self, mobject, plane, color=None, in_place=True, **kwargs):
         super().__init__(mobject, **kwargs)
         self.plane = plane
         self.color = color if color else mobject.get_color()
+        self.has_explicit_color = color is not None
+        self.in_place = in_place
         self.center = mobject.get_start()
         # 벡터의 길이를 화면 좌표계가 아닌 논리적 좌표계에서 계산
         start = self.plane.plane.p2c(mobject.get_start())
@@ -47,6 +55,18 @@ class BaseVectorAnimation(Animation):
             'tip_length': mobject.tip_length,
             'stroke_width': mobject.stroke_width
         }
+        # 화면상 길이 -> 기준 벡터의 (점 배열, 선 두께) 목록 (구조가 달라 쓸 수 없으면 None)
+        self._references = {}
+
+    def begin(self):
+        # 논리 좌표 1만큼의 x, y 방향을 화면 벡터로 미리 계산 (좌표계는 아핀 변환)
+        coords = self.plane.plane.p2c(self.center)
+        origin = self.plane.plane.c2p(coords[0], coords[1])
+        self._x_axis = self.plane.plane.c2p(coords[0] + 1, coords[1]) - origin
+        self._y_axis = self.plane.plane.c2p(coords[0], coords[1] + 1) - origin
+        if self.in_place and self.has_explicit_color:
+            self.mobject.set_color(self.color)
+        super().begin()
 
     def create_vector_at_angle(self, angle, length=None):
         """주어진 각도에서 벡터 생성"""
@@ -69,6 +89,62 @@ class BaseVectorAnimation(Animation):
         
         return vector
 
+    def set_vector_at_angle(self, angle, length=None):
+        """기존 벡터를 주어진 각도로 갱신 (가능하면 점 배열을 제자리에서 회전)"""
+        if not self.in_place:
+            self.mobject.become(self.create_vector_at_angle(angle, length))
+            return
+
+        vector_length = length if length is not None else self.length
+        direction = vector_length * (np.cos(angle) * self._x_axis + np.sin(angle) * self._y_axis)
+        screen_length = np.hypot(direction[0], direction[1])
+        if screen_length < 1e-9:
+            return
+
+        reference = self._get_reference(screen_length)
+        if reference is None:
+            self.mobject.become(self.create_vector_at_angle(angle, length))
+            return
+
+        cos, sin = direction[0] / screen_length, direction[1] / screen_length
+        # 행 벡터에 곱하는 회전 행렬 (R^T)
+        rotation = np.array([[cos, sin, 0], [-sin, cos, 0], [0, 0, 1]])
+        for mob, points, stroke_width in reference:
+            np.matmul(points, rotation, out=mob.points)
+            mob.points += self.center
+            if mob.stroke_width != stroke_width:
+                mob.set_stroke(width=stroke_width, family=False)
+
+    def _get_reference(self, screen_length):
+        """화면상 길이가 screen_length인 x축 방향 기준 벡터의 점 배열 (길이별 캐시)"""
+        key = round(float(screen_length), 6)
+        if key in self._references:
+            return self._references[key]
+
+        # 좌표계 x, y 단위가 달라 길이가 계속 바뀌는 경우 캐시가 무한히 커지지 않도록 제한
+        if len(self._references) >= MAX_REFERENCE_CACHE_SIZE:
+            self._references.clear()
+
+        reference_vector = Vector(
+            direction=np.array([screen_length, 0, 0]),
+            color=self.color,
+            **self.original_style
+        )
+        members = self.mobject.family_members_with_points()
+        reference_members = reference_vector.family_members_with_points()
+        reference = None
+        if len(members) == len(reference_members) and all(
+            mob.points.shape == ref.points.shape and mob.points.dtype == ref.points.dtype
+            for mob, ref in zip(members, reference_members)
+        ):
+            reference = [
+                (mob, ref.points.copy(), ref.stroke_width)
+                for mob, ref in zip(members, reference_members)
+            ]
+
+        self._references[key] = reference
+        return reference
+
 
 class RotateVector(BaseVectorAnimation):
     """벡터 회전 애니메이션 클래스"""
@@ -80,8 +156,7 @@ class RotateVector(BaseVectorAnimation):
 
     def interpolate_mobject(self, alpha):
         angle = self.start_angle + self.angle_diff * alpha
-        new_vector = self.create_vector_at_angle(angle)
-        self.mobject.become(new_vector)
+        self.set_vector_at_angle(angle)
 
 
 class RotateVectorWithAngularVelocity(BaseVectorAnimation):
@@ -112,8 +187,7 @@ class RotateVectorWithAngularVelocity(BaseVectorAnimation):
     def interpolate_mobject(self, alpha):
         current_angle = self.initial_angle + \
             (self.total_angle * self.angular_velocity * alpha)
-        new_vector = self.create_vector_at_angle(current_angle)
-        self.mobject.become(new_vector)
+        self.set_vector_at_angle(current_angle)
 
 
 class UpdateVectorWithCircle(Animation):
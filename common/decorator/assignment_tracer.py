@@ -0,0 +1,341 @@
+import ast
+import dis
+import sys
+import types
+import logging
+import linecache
+import threading
+from functools import wraps
+from typing import Callable, Any, Dict, List, NamedTuple, Optional
+from .function_transformer import CallbackFunc
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 3.12 이상에서는 sys.monitoring, 그 이전 버전에서는 sys.settrace를 사용
+HAS_SYS_MONITORING = hasattr(sys, 'monitoring')
+MONITORING_TOOL_NAME = 'assignment_tracer'
+
+# 이 명령 다음의 STORE_*는 대입문이 아닌 바인딩(루프 변수, import, with ... as 등)
+_NON_ASSIGN_BINDING_OPS = {
+    'FOR_ITER', 'IMPORT_NAME', 'IMPORT_FROM', 'BEFORE_WITH', 'BEFORE_ASYNC_WITH',
+    'SETUP_WITH', 'CHECK_EXC_MATCH', 'PUSH_EXC_INFO',
+}
+# 바인딩 대상이 이어지는 동안(튜플 언패킹 등) 유지되는 명령
+_BINDING_CONTINUATION_OPS = {'UNPACK_SEQUENCE', 'UNPACK_EX'}
+# 문장 경계로 보는 명령 (소스 범위 계산용)
+_STATEMENT_BOUNDARY_OPS = {'POP_TOP', 'RETURN_VALUE', 'RETURN_CONST', 'RESUME'}
+_JUMP_OPCODES = set(getattr(dis, 'hasjump', dis.hasjrel + dis.hasjabs))
+
+
+class AssignmentSite(NamedTuple):
+    """바이트코드상의 대입 위치"""
+    offset: int
+    line: int
+    name: str
+    source: str
+    location: Dict[str, int]
+
+
+def _stored_names(instr: dis.Instruction) -> tuple:
+    """STORE 계열 명령이 값을 저장하는 지역 변수 이름들"""
+    if instr.opname in ('STORE_FAST', 'STORE_DEREF'):
+        return (instr.argval,)
+    if instr.opname == 'STORE_FAST_STORE_FAST':  # 3.13 슈퍼 명령
+        return tuple(instr.argval)
+    if instr.opname == 'STORE_FAST_LOAD_FAST':  # 3.13 슈퍼 명령 (앞쪽만 저장)
+        return (instr.argval[0],)
+    return ()
+
+
+def _statement_source(code: types.CodeType, start_line: int, end_line: int, names: List[str]) -> str:
+    """대입문의 소스 텍스트 (소스를 읽을 수 없으면 위치 기반 대체 텍스트)"""
+    lines = linecache.getlines(code.co_filename)
+    if lines and end_line <= len(lines):
+        return '\n'.join(line.strip() for line in lines[start_line - 1:end_line])
+
+    relative_line = start_line - code.co_firstlineno + 1
+    return f"{', '.join(names)} = ...  # line {relative_line}"
+
+
+def _target_names(target: ast.AST) -> List[str]:
+    """대입 대상의 변수 이름들 (중첩 언패킹 포함, 왼쪽부터)"""
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, ast.Starred):
+        return _target_names(target.value)
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for elt in target.elts for name in _target_names(elt)]
+    return []
+
+
+def _statement_target_order(source: str) -> Optional[List[str]]:
+    """대입문 소스에 적힌 대상 변수 순서 (파싱할 수 없으면 None)"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                names.extend(_target_names(target))
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            names.extend(_target_names(node.target))
+    return names
+
+
+_site_cache: Dict[types.CodeType, Dict[int, List[AssignmentSite]]] = {}
+
+
+def get_assignment_sites(code: types.CodeType) -> Dict[int, List[AssignmentSite]]:
+    """코드 객체의 대입 위치를 줄 번호별로 분석 (코드 객체 단위로 캐시)
+
+    소스를 다시 파싱하지 않고 바이트코드만으로 지역 변수 저장 명령을 찾는다.
+    location의 줄 번호는 AST 백엔드와 같이 함수 소스(데코레이터 포함) 기준 상대값이다.
+    """
+    sites = _site_cache.get(code)
+    if sites is not None:
+        return sites
+
+    sites = {}
+    instructions = list(dis.get_instructions(code))
+    window: List[dis.Instruction] = []  # 현재 문장에 속한 명령들
+    pending: List[tuple] = []  # (명령, 이름) - 같은 문장의 대입 대상
+    skip_targets = False
+
+    def close_statement():
+        if not pending:
+            return
+        start_lines = [i.positions.lineno for i in window if i.positions.lineno]
+        end_lines = [i.positions.end_lineno for i in window if i.positions.end_lineno]
+        start_line = min(start_lines) if start_lines else code.co_firstlineno
+        end_line = max(end_lines) if end_lines else start_line
+        names = [name for _, name in pending]
+        source = _statement_source(code, start_line, end_line, names)
+        location = {
+            'start_line': start_line - code.co_firstlineno + 1,
+            'end_line': end_line - code.co_firstlineno + 1,
+        }
+
+        # 컴파일러는 언패킹 저장 순서를 바꾸기도 하므로(a, b = x, y -> b, a 순서로 저장)
+        # 소스에 적힌 대상 순서로 정렬한다. 소스가 없으면 저장 명령의 열 위치 기준.
+        target_order = _statement_target_order(source)
+        if target_order is not None:
+            pending.sort(key=lambda item: target_order.index(item[1]) if item[1] in target_order else -1)
+        else:
+            pending.sort(key=lambda item: (item[0].positions.lineno or 0, item[0].positions.col_offset or 0))
+
+        for instr, name in pending:
+            line = instr.positions.lineno or start_line
+            sites.setdefault(line, []).append(
+                AssignmentSite(instr.offset, line, name, source, location))
+        pending.clear()
+
+    for instr in instructions:
+        names = _stored_names(instr)
+        if names:
+            window.append(instr)
+            if not skip_targets:
+                pending.extend((instr, name) for name in names)
+            continue
+
+        if instr.opname in _BINDING_CONTINUATION_OPS:
+            window.append(instr)
+            continue
+
+        # 저장 명령들 다음의 첫 명령에서 문장 종료
+        if window and _stored_names(window[-1]):
+            close_statement()
+            window = []
+
+        skip_targets = instr.opname in _NON_ASSIGN_BINDING_OPS
+        if instr.opname in _STATEMENT_BOUNDARY_OPS or instr.opcode in _JUMP_OPCODES:
+            window = []
+        else:
+            window.append(instr)
+    close_statement()
+
+    # 문장 단위로 명령 순서대로 추가했으므로 줄별 목록은 이미 실행 순서(문장 안에서는 대상 순서)
+    _site_cache[code] = sites
+    return sites
+
+
+class _CallState:
+    """하나의 호출(프레임)에 대한 추적 상태"""
+    __slots__ = ('callback', 'sites', 'prev_line', 'prev_offset')
+
+    def __init__(self, callback: CallbackFunc, sites: Dict[int, List[AssignmentSite]]):
+        self.callback = callback
+        self.sites = sites
+        self.prev_line: Optional[int] = None
+        self.prev_offset = -1
+
+    def on_line(self, frame: types.FrameType, line: int, offset: int) -> None:
+        """새 줄 진입 시 직전 줄에서 실행된 대입문의 값을 콜백으로 전달"""
+        self.emit(frame, offset)
+        self.prev_line = line
+        self.prev_offset = offset
+
+    def emit(self, frame: types.FrameType, offset: int) -> None:
+        line_sites = self.sites.get(self.prev_line)
+        if not line_sites:
+            return
+
+        # 직전 줄 진입 지점 이후, 현재 지점 이전의 저장 명령만 실행된 것으로 본다.
+        # (현재 지점이 더 앞이면 루프 등으로 되돌아온 경우이므로 줄 끝까지 실행된 것)
+        # 문장 안에서는 대상 순서로 정렬되어 있어 오프셋이 단조 증가하지 않으므로 끝까지 확인한다.
+        jumped_back = offset <= self.prev_offset
+        f_locals = frame.f_locals
+        for site in line_sites:
+            if site.offset < self.prev_offset:
+                continue
+            if not jumped_back and site.offset >= offset:
+                continue
+            if site.name not in f_locals:  # 해제된 컴프리헨션 변수 등
+                continue
+            try:
+                self.callback(f_locals[site.name], site.source, dict(site.location))
+            except Exception as e:
+                logger.error(f"Assignment callback failed: {e}")
+
+
+class _ThreadCalls(threading.local):
+    def __init__(self):
+        # 코드 객체 -> 진행 중인 호출 상태 스택 (재귀 호출 대응)
+        self.stacks: Dict[types.CodeType, List[_CallState]] = {}
+
+
+_thread_calls = _ThreadCalls()
+
+
+def _current_state(code: types.CodeType) -> Optional[_CallState]:
+    stack = _thread_calls.stacks.get(code)
+    return stack[-1] if stack else None
+
+
+# sys.monitoring 백엔드 ---------------------------------------------------------
+
+_monitoring_tool_id: Optional[int] = None
+
+
+def _on_monitoring_line(code: types.CodeType, line: int) -> Any:
+    state = _current_state(code)
+    if state is not None:
+        frame = sys._getframe(1)
+        state.on_line(frame, line, frame.f_lasti)
+
+
+def _on_monitoring_return(code: types.CodeType, offset: int, retval: Any) -> Any:
+    state = _current_state(code)
+    if state is not None:
+        state.emit(sys._getframe(1), offset)
+
+
+def _ensure_monitoring_tool() -> int:
+    """비어 있는 sys.monitoring 도구 ID를 하나 확보하고 콜백 등록"""
+    global _monitoring_tool_id
+    if _monitoring_tool_id is not None:
+        return _monitoring_tool_id
+
+    monitoring = sys.monitoring
+    for tool_id in range(6):  # 0 ~ 5번이 사용자 도구용 ID
+        if monitoring.get_tool(tool_id) is None:
+            monitoring.use_tool_id(tool_id, MONITORING_TOOL_NAME)
+            monitoring.register_callback(
+                tool_id, monitoring.events.LINE, _on_monitoring_line)
+            monitoring.register_callback(
+                tool_id, monitoring.events.PY_RETURN, _on_monitoring_return)
+            _monitoring_tool_id = tool_id
+            return tool_id
+
+    raise RuntimeError("No free sys.monitoring tool id for assignment tracing")
+
+
+def _enable_monitoring(code: types.CodeType) -> None:
+    tool_id = _ensure_monitoring_tool()
+    events = sys.monitoring.events
+    sys.monitoring.set_local_events(tool_id, code, events.LINE | events.PY_RETURN)
+
+
+# sys.settrace 백엔드 (3.12 미만) -----------------------------------------------
+
+def _make_settrace_tracer(code: types.CodeType, state: _CallState) -> Callable:
+    def local_tracer(frame, event, arg):
+        if event == 'line':
+            state.on_line(frame, frame.f_lineno, frame.f_lasti)
+        elif event == 'return':
+            state.emit(frame, frame.f_lasti)
+        return local_tracer
+
+    def global_tracer(frame, event, arg):
+        # 대상 함수의 프레임에만 지역 추적기를 설치
+        if event == 'call' and frame.f_code is code:
+            return local_tracer
+        return None
+
+    return global_tracer
+
+
+def trace_assignments(
+    func_to_trace: Callable,
+    callback_func: CallbackFunc
+) -> Callable:
+    """
+    소스 변환 없이 실행 중인 프레임을 관찰하여 대입문 값마다 콜백을 호출합니다.
+
+    add_func_call_after_assign과 같은 콜백 규약을 따르지만,
+    inspect.getsource를 사용하지 않으므로 REPL이나 exec으로 정의한 함수에도 동작합니다.
+    Python 3.12 이상에서는 sys.monitoring의 코드 객체 단위 LINE/PY_RETURN 이벤트를,
+    그 이전 버전에서는 호출 동안만 sys.settrace를 사용합니다.
+
+    Args:
+        func_to_trace: 추적할 함수 또는 메서드
+        callback_func: 대입문이 실행된 뒤 호출될 콜백 함수.
+                     시그너처: (value, source: str, location: Dict[str, int]) -> None
+
+    Returns:
+        호출 동안 대입문을 추적하는 래퍼 함수를 반환합니다.
+
+    Notes:
+        - 지역 변수에 저장하는 모든 대입문(+= 등 복합 대입 포함)이 대상이며,
+          for 루프 변수, import, with ... as 바인딩은 제외됩니다.
+        - 언패킹 대입은 컴파일러의 저장 순서와 관계없이 대상이 적힌 순서대로 전달하므로
+          add_func_call_after_assign과 같은 순서로 콜백이 호출됩니다.
+        - settrace 백엔드는 호출 동안 기존 추적기(디버거, 커버리지)를 잠시 대체합니다.
+    """
+    raw_func = getattr(func_to_trace, '__func__', func_to_trace)
+    code = raw_func.__code__
+    sites = get_assignment_sites(code)
+
+    if HAS_SYS_MONITORING:
+        _enable_monitoring(code)
+
+    @wraps(raw_func)
+    def wrapper(*args, **kwargs):
+        state = _CallState(callback_func, sites)
+        stack = _thread_calls.stacks.setdefault(code, [])
+        stack.append(state)
+        try:
+            if HAS_SYS_MONITORING:
+                return raw_func(*args, **kwargs)
+
+            previous_tracer = sys.gettrace()
+            sys.settrace(_make_settrace_tracer(code, state))
+            try:
+                return raw_func(*args, **kwargs)
+            finally:
+                sys.settrace(previous_tracer)
+        finally:
+            stack.pop()
+            if not stack:
+                del _thread_calls.stacks[code]
+
+    # 원본 함수 타입에 맞게 다시 바인딩
+    if isinstance(func_to_trace, classmethod):
+        return classmethod(wrapper)
+    elif isinstance(func_to_trace, types.MethodType):
+        return types.MethodType(wrapper, func_to_trace.__self__)
+    return wrapper
@@ -0,0 +1,86 @@
+import unittest
+from common.decorator.assignment_tracer import trace_assignments
+from common.decorator.function_transformer import add_func_call_after_assign
+
+
+def unpack_tuple(x, y):
+    a, b = x, y
+    c, d = 1, 2
+    return a, b, c, d
+
+
+def swap_values(x, y):
+    a, b = x, y
+    a, b = b, a
+    return a, b
+
+
+def unpack_nested(x, y):
+    e, (g, h) = x, (y, x)
+    first, *rest = [x, y, x]
+    return e, g, h, first, rest
+
+
+def augmented_assign(x):
+    a = x
+    a += 5
+    total: int = a * 2
+    return total
+
+
+def chained_assign_in_loop(n):
+    total = 0
+    for i in range(n):
+        a = b = i
+        total += a + b
+    return total
+
+
+BACKENDS = {
+    'ast': add_func_call_after_assign,
+    'trace': trace_assignments,
+}
+
+
+def record_assignments(backend, func, *args):
+    """백엔드로 감싼 함수를 실행하고 (값, 소스, 위치) 호출 기록을 반환"""
+    records = []
+    wrapped = backend(func, lambda value, source, location: records.append((value, source, location)))
+    result = wrapped(*args)
+    return result, records
+
+
+class TestAssignmentBackendParity(unittest.TestCase):
+    CASES = [
+        (unpack_tuple, (1, 2)),
+        (swap_values, (1, 2)),
+        (unpack_nested, (1, 2)),
+        (augmented_assign, (3,)),
+        (chained_assign_in_loop, (3,)),
+    ]
+
+    def test_backends_report_same_assignments(self):
+        for func, args in self.CASES:
+            results = {name: record_assignments(backend, func, *args) for name, backend in BACKENDS.items()}
+            with self.subTest(func=func.__name__):
+                self.assertEqual(results['ast'], results['trace'])
+
+    def test_unpack_reported_in_target_order(self):
+        for name, backend in BACKENDS.items():
+            with self.subTest(backend=name):
+                _, records = record_assignments(backend, swap_values, 1, 2)
+                self.assertEqual([value for value, _, _ in records], [1, 2, 2, 1])
+
+    def test_augmented_assign_reported(self):
+        for name, backend in BACKENDS.items():
+            with self.subTest(backend=name):
+                _, records = record_assignments(backend, augmented_assign, 3)
+                self.assertEqual([(value, source) for value, source, _ in records], [
+                    (3, 'a = x'),
+                    (8, 'a += 5'),
+                    (16, 'total: int = a * 2'),
+                ])
+
+
+if __name__ == '__main__':
+    unittest.main()
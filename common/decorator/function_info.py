@@ -23,6 +23,7 @@ class FunctionInfo:
         self.instance: Optional[Any] = None
         self.cls: Optional[type] = None
         self.source = ""
+        self.is_source_generated = False  # 소스를 읽을 수 없어 직접 생성했는지 여부
 
         # 기본 분석 수행
         self._analyze_function()
@@ -54,6 +55,7 @@ class FunctionInfo:
         except OSError:
             # exec으로 생성된 함수의 경우 소스를 직접 생성
             self.source = self._create_simple_function_source()
+            self.is_source_generated = True
 
     def _create_simple_function_source(self) -> str:
         """exec으로 생성된 함수를 위한 기본 소스 코드 생성"""
@@ -1,7 +1,6 @@
-import sys
 import types
+import inspect
 import ast
-import astor
 import logging
 from typing import Callable, Any, Dict, Union, List, TypeVar
 from .function_info import FunctionInfo
@@ -42,10 +41,26 @@ class AssignmentVisitor(ast.NodeTransformer):
 
     def visit_Assign(self, node):
         self.current_node = node  # 현재 처리 중인 노드 저장
-        result = self._create_nodes(node)
+        result = self._create_nodes(node, node.targets)
         self.current_node = None  # 처리 완료 후 초기화
         return result
 
+    def visit_AugAssign(self, node):
+        # a += 5 등 복합 대입문도 대입 결과를 전달
+        self.current_node = node
+        result = self._create_nodes(node, [node.target])
+        self.current_node = None
+        return result
+
+    def visit_AnnAssign(self, node):
+        # 값이 없는 선언(a: int)은 대입이 아니므로 그대로 둔다
+        if node.value is None:
+            return node
+        self.current_node = node
+        result = self._create_nodes(node, [node.target])
+        self.current_node = None
+        return result
+
     def visit_FunctionDef(self, node):
         # 함수 정의 노드 방문
         self.generic_visit(node)
@@ -55,21 +70,23 @@ class AssignmentVisitor(ast.NodeTransformer):
         """대입문의 타겟 변수 이름들을 추출"""
         if isinstance(target, ast.Name):
             return [target.id]
-        elif isinstance(target, ast.Tuple):
+        elif isinstance(target, ast.Starred):
+            return self._get_target_ids(target.value)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            # 중첩된 언패킹(a, (b, c) = ...)도 왼쪽부터 순서대로
             ids = []
             for elt in target.elts:
-                if isinstance(elt, ast.Name):
-                    ids.append(elt.id)
+                ids.extend(self._get_target_ids(elt))
             return ids
         return []
 
-    def _create_nodes(self, node) -> list:
+    def _create_nodes(self, node, targets: List[ast.AST]) -> list:
         """노드 변환 로직"""
         result_nodes = [node]
         source_text = self.get_node_source(node)
 
         # 모든 타겟 변수에 대해 콜백 생성 (리스트도 전체를 한번에 전달)
-        for target in node.targets:
+        for target in targets:
             for var_name in self._get_target_ids(target):
                 result_nodes.append(
                     self._create_callback_node(var_name, source_text))
@@ -108,6 +125,16 @@ class RemoveDecoratorTransformer(ast.NodeTransformer):
         return node
 
 
+# 변환된 함수의 코드 객체 캐시:
+# (원본 코드 객체, 콜백 이름) -> (변환된 코드 객체, 소스를 직접 생성했는지 여부)
+_transformed_code_cache: Dict[tuple[types.CodeType, str], tuple[types.CodeType, bool]] = {}
+
+# 변환된 함수를 감싸는 팩토리 함수 이름.
+# 콜백과 원본 함수의 자유 변수를 팩토리의 인자로 두어, 변환된 함수가
+# 모듈 전역을 복사하지 않고도 클로저 셀로 이들을 참조하도록 한다.
+_FACTORY_NAME = '__transformed_function_factory__'
+
+
 def add_func_call_after_assign(
     func_to_modify: Callable,
     callback_func: CallbackFunc
@@ -127,6 +154,12 @@ def add_func_call_after_assign(
         - 이 함수는 @staticmethod, @classmethod를 제외한 커스텀 데코레이터를 지원하지 않습니다.
         - 커스텀 데코레이터가 적용된 함수를 변환하면 해당 데코레이터의 기능은 무시됩니다.
         - 대상 함수에 커스텀 데코레이터가 필요한 경우, 변환된 함수를 다시 데코레이터로 감싸서 사용해야 합니다.
+        - 변환된 코드 객체는 (원본 코드 객체, 콜백 이름) 단위로 캐시되므로,
+          같은 함수를 다시 변환하거나 인스턴스마다 바운드 메서드를 변환해도
+          소스 파싱, 코드 생성, 컴파일은 한 번만 수행됩니다.
+        - 변환된 함수는 원본 모듈의 전역 네임스페이스를 그대로 참조합니다.
+        - 지역 변수에 저장하는 대입문(+= 등 복합 대입, 값이 있는 주석 대입 포함)이 대상이며,
+          언패킹 대입은 대상이 적힌 순서대로 콜백을 호출합니다 (trace_assignments와 같음).
 
     Examples:
         >>> @my_decorator  # 이 데코레이터는 무시됨
@@ -138,25 +171,81 @@ def add_func_call_after_assign(
         >>> # 필요한 경우 다음과 같이 다시 적용
         >>> modified = my_decorator(modified)
     """
-    # 함수 분석
-    func_info = FunctionInfo(func_to_modify)
+    raw_func = _unwrap_function(func_to_modify)
+    callback_name = callback_func.__name__
+
+    # 변환된 코드 객체 (캐시 적중 시 소스 분석/파싱/코드 생성/컴파일 모두 생략)
+    cache_key = (raw_func.__code__, callback_name)
+    cached = _transformed_code_cache.get(cache_key)
+    if cached is None:
+        # 함수 분석
+        func_info = FunctionInfo(func_to_modify)
+        cached = (
+            _compile_transformed_code(func_info, raw_func, callback_name),
+            func_info.is_source_generated
+        )
+        _transformed_code_cache[cache_key] = cached
+    code, is_source_generated = cached
+
+    # 클로저 셀만 새로 만들어 함수 객체 생성
+    extra_cells = {callback_name: callback_func}
+    if is_source_generated:
+        extra_cells['func'] = func_to_modify
+    new_func = _create_function(code, raw_func, extra_cells)
+
+    # 함수 타입에 따라 다시 바인딩
+    return _bind_function(func_to_modify, new_func)
+
 
+def _unwrap_function(func: Callable) -> types.FunctionType:
+    """staticmethod/classmethod/바운드 메서드에서 원본 함수 추출"""
+    return getattr(func, '__func__', func)
+
+
+def _compile_transformed_code(
+    func_info: FunctionInfo,
+    raw_func: types.FunctionType,
+    callback_name: str
+) -> types.CodeType:
+    """소스를 변환하고 컴파일하여 변환된 함수의 코드 객체를 반환"""
     # 소스 코드 들여쓰기 처리
-    func_info.source = _normalize_indentation(func_info.source)
+    source = _normalize_indentation(func_info.source)
+
+    # 팩토리 인자: 콜백, 원본 함수의 자유 변수, (소스를 만들어낸 경우) 원본 함수
+    factory_args = [callback_name, *raw_func.__code__.co_freevars]
+    if func_info.is_source_generated:
+        factory_args.append('func')
 
-    # AST 변환 및 코드 생성
-    modified_source = _transform_source(
-        func_info.source, callback_func.__name__)
+    # AST 변환
+    modified_tree = _transform_source(source, callback_name, factory_args)
 
-    # 실행 컨텍스트 준비
-    namespace = _prepare_namespace(callback_func, func_info, modified_source)
+    if func_info.is_source_generated:
+        filename = f"<transformed {raw_func.__qualname__}>"
+    else:
+        # 원본 파일의 줄 번호가 되도록 이동 (트레이스백이 실제 소스 줄을 가리키도록)
+        ast.increment_lineno(modified_tree, raw_func.__code__.co_firstlineno - 1)
+        filename = raw_func.__code__.co_filename
 
-    # 변환된 함수 실행을 위한 래퍼 생성
-    return _create_wrapper(func_info, namespace)
+    module_code = compile(modified_tree, filename, 'exec')
+    factory_code = _find_code(module_code, _FACTORY_NAME)
+    return _find_code(factory_code, func_info.get_func_name())
 
 
-def _transform_source(source: str, callback_name: str) -> str:
-    """소스 코드 AST 변환"""
+def _find_code(code: types.CodeType, name: str) -> types.CodeType:
+    """상수 테이블에서 이름이 일치하는 코드 객체 찾기"""
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType) and const.co_name == name:
+            return const
+    raise ValueError(f"Code object '{name}' not found in transformed source")
+
+
+def _transform_source(source: str, callback_name: str, factory_args: List[str]) -> ast.Module:
+    """소스 코드 AST 변환
+
+    변환된 함수 정의를 팩토리 함수로 감싸서
+    factory_args의 이름들이 클로저 변수로 참조되도록 한다.
+    팩토리 노드는 함수 정의와 같은 위치를 가지므로 줄 번호는 source 기준 그대로이다.
+    """
     tree = ast.parse(source)
 
     # 데코레이터 제거
@@ -167,37 +256,50 @@ def _transform_source(source: str, callback_name: str) -> str:
     transformer.set_source(source)
     modified_tree = transformer.visit(tree)
 
-    ast.fix_missing_locations(modified_tree)
-    return astor.to_source(modified_tree)
-
-
-def _prepare_namespace(callback_func: Callable, func_info: FunctionInfo, modified_source: str) -> Dict:
-    """실행을 위한 네임스페이스 준비"""
-    namespace = {
-        callback_func.__name__: callback_func,
-        callback_func.__qualname__: callback_func,
-        'func': func_info.func  # 원본 함수를 네임스페이스에 추가
-    }
-
-    if hasattr(func_info.func, '__module__'):
-        try:
-            module = sys.modules[func_info.func.__module__]
-            module_dict = {k: v for k, v in module.__dict__.items()
-                           if not k.startswith('_')}
-            namespace.update(module_dict)
-        except (KeyError, AttributeError):
-            pass
-
-    if func_info.is_class_method:
-        namespace['cls'] = func_info.cls
-    elif func_info.is_bound_method:
-        namespace['self'] = func_info.instance
-
-    globals_copy = globals().copy()
-    globals_copy.update(namespace)
-
-    exec(modified_source, globals_copy, namespace)
-    return namespace
+    # 팩토리 함수로 감싸기
+    func_def = modified_tree.body[0]
+    factory = ast.FunctionDef(
+        name=_FACTORY_NAME,
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in factory_args],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[]
+        ),
+        body=[func_def, ast.Return(value=ast.Name(id=func_def.name, ctx=ast.Load()))],
+        decorator_list=[],
+        returns=None,
+        **({'type_params': []} if 'type_params' in ast.FunctionDef._fields else {})
+    )
+    ast.copy_location(factory, func_def)
+    ast.copy_location(factory.body[1], func_def)
+    modified_tree.body = [factory]
+
+    return ast.fix_missing_locations(modified_tree)
+
+
+def _create_function(
+    code: types.CodeType,
+    raw_func: types.FunctionType,
+    extra_cells: Dict[str, Any]
+) -> types.FunctionType:
+    """변환된 코드 객체로 원본 모듈 전역을 공유하는 함수 객체 생성"""
+    # 원본 함수의 클로저 셀은 그대로 공유
+    cells = dict(zip(raw_func.__code__.co_freevars, raw_func.__closure__ or ()))
+    cells.update((name, types.CellType(value)) for name, value in extra_cells.items())
+
+    new_func = types.FunctionType(
+        code,
+        raw_func.__globals__,
+        raw_func.__name__,
+        raw_func.__defaults__,
+        tuple(cells[name] for name in code.co_freevars)
+    )
+    new_func.__kwdefaults__ = raw_func.__kwdefaults__
+    new_func.__qualname__ = raw_func.__qualname__
+    new_func.__module__ = raw_func.__module__
+    return new_func
 
 
 def _normalize_indentation(source: str) -> str:
@@ -211,20 +313,11 @@ def _normalize_indentation(source: str) -> str:
     )
 
 
-def _create_wrapper(func_info: FunctionInfo, namespace: Dict) -> Callable:
-    """함수 타입에 따른 적절한 래퍼 함수 생성"""
-    def wrapper(*args, **kwargs):
-        func_name = func_info.get_func_name()
-
-        if func_info.is_class_method:
-            method = classmethod(namespace[func_name])
-            return method.__get__(None, func_info.cls)(*args, **kwargs)
-        elif func_info.is_bound_method:
-            method = types.MethodType(namespace[func_name], func_info.instance)
-            return method(*args, **kwargs)
-        elif func_info.is_static_method:
-            return namespace[func_name](*args, **kwargs)
-        else:
-            return namespace[func_name](*args, **kwargs)
-
-    return wrapper
+def _bind_function(func_to_modify: Callable, new_func: types.FunctionType) -> Callable:
+    """원본 함수 타입에 맞게 변환된 함수를 다시 바인딩"""
+    if isinstance(func_to_modify, classmethod):
+        return classmethod(new_func)
+    elif inspect.ismethod(func_to_modify):
+        # 인스턴스 메서드와 클래스에 바인딩된 클래스 메서드 모두 같은 대상에 다시 바인딩
+        return types.MethodType(new_func, func_to_modify.__self__)
+    return new_func
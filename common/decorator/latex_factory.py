@@ -7,16 +7,34 @@ from typing import Callable, Dict, Any, Union
 import datetime
 from json.decoder import JSONDecodeError
 import os
-from threading import Lock
+import atexit
+from threading import Event, Lock, Thread
 from contextlib import contextmanager
 from typing import Generator
 from .function_info import FunctionInfo
 from .function_transformer import add_func_call_after_assign
+from .assignment_tracer import trace_assignments
+
+try:
+    import fcntl  # 프로세스 간 파일 잠금 (POSIX)
+except ImportError:
+    fcntl = None
 
 # Configuration constants
 DEFAULT_OUTPUT_DIR = "latex_outputs"
 ENV_VAR_NAME = "LATEX_FACTORY_OUTPUT_DIR"
+BACKEND_ENV_VAR_NAME = "LATEX_FACTORY_TRACE_BACKEND"
 JSON_FILENAME = "latex_factory.json"
+JSONL_SUFFIX = ".jsonl"
+LOCK_SUFFIX = ".lock"
+DEFAULT_FLUSH_INTERVAL = 1.0  # 백그라운드 기록 주기 (초)
+DEFAULT_MAX_PENDING = 256  # 이 개수만큼 쌓이면 주기를 기다리지 않고 기록
+
+# 대입문 추적 백엔드
+BACKEND_AST = "ast"  # 소스를 AST로 변환하여 대입문 뒤에 콜백 호출 삽입
+BACKEND_TRACE = "trace"  # 소스 변환 없이 sys.monitoring/sys.settrace로 프레임 관찰
+BACKEND_AUTO = "auto"  # 소스를 읽을 수 있으면 AST, 아니면 trace
+TRACE_BACKENDS = (BACKEND_AST, BACKEND_TRACE, BACKEND_AUTO)
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO)
@@ -86,6 +104,180 @@ def save_json_data(json_path: Path, data: Dict[str, Any]) -> None:
         logger.error(f"Failed to save JSON file: {e}")
 
 
+class LatexRecordStore:
+    """latex_factory 기록을 JSON Lines 파일에 추가만 하는 저장소
+
+    데코레이트된 함수 호출은 메모리 큐에 기록만 추가하고,
+    백그라운드 스레드가 주기적으로 큐를 `latex_factory.jsonl`에 한 번에 덧붙인다.
+    읽을 때는 `latex_factory.json`(압축본) 위에 JSON Lines 기록과
+    아직 기록되지 않은 큐를 차례로 덮어쓴 병합 결과를 돌려준다.
+
+    프로세스 종료 시(또는 compact 호출 시) 병합 결과를 기존 형식의
+    `latex_factory.json`으로 다시 쓰고 JSON Lines 파일을 비운다.
+
+    여러 프로세스가 같은 파일을 쓰므로 `latex_factory.json.lock`에 flock을 건다.
+    덧붙이기와 읽기는 공유 잠금, compact는 배타 잠금을 사용한다 (fcntl이 없는 환경에서는 잠그지 않음).
+    """
+
+    def __init__(
+        self,
+        json_path: Path,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        compact_on_close: bool = True,
+    ):
+        self.json_path = Path(json_path)
+        self.log_path = self.json_path.with_suffix(JSONL_SUFFIX)
+        self.lock_path = self.json_path.with_name(self.json_path.name + LOCK_SUFFIX)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.compact_on_close = compact_on_close
+
+        self._pending: list[Dict[str, Any]] = []
+        self._pending_lock = Lock()  # 큐 접근용
+        self._write_lock = Lock()  # 파일 기록 직렬화용
+        self._wakeup = Event()
+        self._closed = False
+        self._thread: Thread | None = None
+
+        atexit.register(self.close)
+
+    def __enter__(self) -> "LatexRecordStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    def record(self, file_path: str, func_name: str, func_data: Dict[str, Any]) -> None:
+        """함수 호출 기록을 큐에 추가 (파일 I/O 없음)"""
+        with self._pending_lock:
+            self._pending.append(
+                {"file": file_path, "function": func_name, "data": func_data}
+            )
+            should_wake = len(self._pending) >= self.max_pending
+
+        self._ensure_flush_thread()
+        if should_wake:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """큐에 쌓인 기록을 JSON Lines 파일에 덧붙임"""
+        with self._write_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+
+            if not batch:
+                return
+
+            lines = "".join(
+                json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+                for entry in batch
+            )
+            try:
+                # 한 번의 write로 덧붙여 다른 프로세스의 기록과 줄 단위로 섞이지 않도록 함
+                with self._file_lock(exclusive=False), open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            except Exception as e:
+                logger.error(f"Failed to append JSON Lines file: {e}")
+
+    def load(self) -> Dict[str, Any]:
+        """압축본, JSON Lines 기록, 미기록 큐를 병합한 전체 데이터 반환"""
+        with self._file_lock(exclusive=False):
+            data = load_json_data(self.json_path)
+            self._apply_log(data, self.log_path)
+
+        with self._pending_lock:
+            pending = list(self._pending)
+        for entry in pending:
+            self._apply_entry(data, entry)
+
+        return data
+
+    def compact(self) -> None:
+        """병합 결과를 latex_factory.json으로 다시 쓰고 JSON Lines 파일을 비움"""
+        # 옮기기부터 삭제까지 배타 잠금을 유지하여 다른 프로세스의 compact나 덧붙이기와 겹치지 않도록 함
+        with self._write_lock, self._file_lock(exclusive=True):
+            if not self.log_path.exists():
+                return
+
+            claimed_path = self.log_path.with_name(
+                f"{self.log_path.name}.{os.getpid()}.compacting"
+            )
+            try:
+                os.replace(self.log_path, claimed_path)
+            except FileNotFoundError:
+                return
+
+            data = load_json_data(self.json_path)
+            self._apply_log(data, claimed_path)
+            save_json_data(self.json_path, data)
+            claimed_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Generator[None, None, None]:
+        """잠금 파일에 프로세스 간 flock (exclusive=False면 공유 잠금)"""
+        if fcntl is None:
+            yield
+            return
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 기록을 저장"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        self.flush()
+        if self.compact_on_close:
+            self.compact()
+
+    def _ensure_flush_thread(self) -> None:
+        if self._thread is None and not self._closed:
+            with self._write_lock:
+                if self._thread is None:
+                    self._thread = Thread(
+                        target=self._flush_loop,
+                        name=f"latex-factory-flush:{self.json_path.parent.name}",
+                        daemon=True,
+                    )
+                    self._thread.start()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    @staticmethod
+    def _apply_entry(data: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        data.setdefault(entry["file"], {})[entry["function"]] = entry["data"]
+
+    @classmethod
+    def _apply_log(cls, data: Dict[str, Any], log_path: Path) -> None:
+        try:
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        cls._apply_entry(data, json.loads(line))
+                    except (JSONDecodeError, KeyError, TypeError):
+                        # 기록 중이던 마지막 줄 등 불완전한 줄은 건너뜀
+                        continue
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to read JSON Lines file: {e}")
+
+
 class LatexFactory:
     def __init__(self):
         """기본 초기화"""
@@ -99,8 +291,20 @@ class LatexFactory:
                 logger.error(f"Failed to create directory: {e}")
                 raise RuntimeError(f"Failed to create directory: {self.save_dir}")
 
+        self.backend = os.getenv(BACKEND_ENV_VAR_NAME, BACKEND_AST)
+        if self.backend not in TRACE_BACKENDS:
+            logger.error(f"Unknown trace backend '{self.backend}', using '{BACKEND_AST}'")
+            self.backend = BACKEND_AST
+
         self.file_lock = Lock()
         self.config = self._load_config()
+        self._stores: Dict[Path, LatexRecordStore] = {}
+
+    def __enter__(self) -> "LatexFactory":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
 
     @contextmanager
     def _file_access(self) -> Generator[None, None, None]:
@@ -108,6 +312,29 @@ class LatexFactory:
         with self.file_lock:
             yield
 
+    def _get_store(self, save_dir: Path) -> LatexRecordStore:
+        """저장 디렉토리별 기록 저장소 반환"""
+        json_path = (Path(save_dir) / JSON_FILENAME).resolve()
+        with self._file_access():
+            store = self._stores.get(json_path)
+            if store is None:
+                store = self._stores[json_path] = LatexRecordStore(json_path)
+        return store
+
+    def flush(self) -> None:
+        """모든 저장소의 미기록 데이터를 파일에 기록"""
+        with self._file_access():
+            stores = list(self._stores.values())
+        for store in stores:
+            store.flush()
+
+    def load(self, save_dir: Union[str, Path, None] = None) -> Dict[str, Any]:
+        """저장된 전체 데이터를 병합하여 반환"""
+        effective_save_dir = Path(save_dir) if save_dir else self.save_dir
+        if effective_save_dir is None:
+            return {}
+        return self._get_store(effective_save_dir).load()
+
     def _load_config(self):
         # Configuration loading logic here
         return {}
@@ -117,6 +344,7 @@ class LatexFactory:
         save_dir: Union[str, Path, None] = None,
         auto_latex_str: bool = True,
         show_mul_dot: bool = True,
+        backend: str | None = None,
     ) -> Callable:
         """
         데코레이터 호출
@@ -124,7 +352,15 @@ class LatexFactory:
         Args:
             save_dir: JSON 파일을 저장할 디렉토리 경로
             auto_latex_str: True면 LaTeX 문자열로 변환하여 반환
+            backend: 대입문 추적 방식 ("ast", "trace", "auto").
+                None이면 LATEX_FACTORY_TRACE_BACKEND 환경 변수 또는 "ast" 사용
         """
+        backend = backend or self.backend
+        if backend not in TRACE_BACKENDS:
+            raise ValueError(
+                f"Unknown trace backend '{backend}', expected one of {TRACE_BACKENDS}"
+            )
+
         effective_save_dir = Path(save_dir) if save_dir else self.save_dir
         if effective_save_dir:
             try:
@@ -154,6 +390,10 @@ class LatexFactory:
         def decorator(func: Callable) -> Callable:
             # 함수 정보 객체 생성 (위치 정보 포함)
             func_info = FunctionInfo(func)
+            store = self._get_store(effective_save_dir)
+            file_path = os.path.abspath(func.__code__.co_filename)
+            # 시그너처 정보는 호출마다 바뀌지 않으므로 첫 호출 때 한 번만 계산
+            signature_info = {}
             # 대입문 데이터를 누적할 클로저 변수
             assignment_data = {"assignments": {}}
 
@@ -201,7 +441,13 @@ class LatexFactory:
                     logger.error(f"Failed to save assignment data: {e}")
                     logger.error(f"Exception details:", exc_info=True)
 
-            transformed_func = add_func_call_after_assign(func, save_assignment_data)
+            use_trace = backend == BACKEND_TRACE or (
+                backend == BACKEND_AUTO and func_info.is_source_generated
+            )
+            if use_trace:
+                transformed_func = trace_assignments(func, save_assignment_data)
+            else:
+                transformed_func = add_func_call_after_assign(func, save_assignment_data)
 
             @wraps(func)
             def wrapper(*args, **kwargs):
@@ -209,47 +455,28 @@ class LatexFactory:
                     # 변환된 함수 호출
                     return_value = transformed_func(*args, **kwargs)
 
-                    json_path = (
-                        Path(effective_save_dir) / JSON_FILENAME
-                        if effective_save_dir
-                        else None
-                    )
-
-                    # 리턴값과 대입문 데이터를 함께 저장
-                    if json_path:
-                        with self._file_access():
-                            data = load_json_data(json_path)
-                            file_path = os.path.abspath(func.__code__.co_filename)
-
-                            if file_path not in data:
-                                data[file_path] = {}
-
-                            # 함수 데이터 준비 (순서 변경)
-                            func_data = {
-                                "timestamp": datetime.datetime.now().isoformat(),
-                                "location": func_info.location,
-                                "signature": func_info.get_signature_info(),
-                                "arguments": {
-                                    "args": [str(arg) for arg in args] if args else [],
-                                    "kwargs": (
-                                        {k: str(v) for k, v in kwargs.items()}
-                                        if kwargs
-                                        else {}
-                                    ),
-                                },
-                                "assignments": assignment_data.get("assignments", {}),
-                                "return_latex": convert_to_latex(
-                                    return_value, show_mul_dot
-                                ),
-                            }
-
-                            # 전체 데이터 저장
-                            data[file_path][func.__name__] = func_data
-                            save_json_data(json_path, data)
-
-                            # 다음 호출을 위해 대입문 데이터 초기화
-                            assignment_data.clear()
-                            assignment_data["assignments"] = {}
+                    if not signature_info:
+                        signature_info.update(func_info.get_signature_info())
+
+                    # 리턴값과 대입문 데이터를 함께 기록 (파일 기록은 백그라운드에서 수행)
+                    func_data = {
+                        "timestamp": datetime.datetime.now().isoformat(),
+                        "location": func_info.location,
+                        "signature": signature_info,
+                        "arguments": {
+                            "args": [str(arg) for arg in args] if args else [],
+                            "kwargs": (
+                                {k: str(v) for k, v in kwargs.items()}
+                                if kwargs
+                                else {}
+                            ),
+                        },
+                        "assignments": dict(assignment_data.get("assignments", {})),
+                        "return_latex": convert_to_latex(
+                            return_value, show_mul_dot
+                        ),
+                    }
+                    store.record(file_path, func.__name__, func_data)
 
                     # 원본 함수의 리턴 타입을 보존하면서 latex 변환
                     if auto_latex_str:
@@ -278,24 +505,27 @@ class LatexFactory:
                 except Exception as e:
                     logger.error(f"Decorator execution failed: {e}")
                     try:
-                        # Load existing data for error entry
-                        with self._file_access():
-                            data = load_json_data(json_path)
-                            if file_path not in data:
-                                data[file_path] = {}
-
-                            # 오류 정보와 함께 assignments 데이터도 보존
-                            data[file_path][func.__name__] = {
+                        # 오류 정보와 함께 assignments 데이터도 보존
+                        store.record(
+                            file_path,
+                            func.__name__,
+                            {
                                 "timestamp": datetime.datetime.now().isoformat(),
                                 "location": func_info.location,  # 오류 시에도 위치 정보 포함
                                 "error": str(e),
-                                "assignments": assignment_data.get("assignments", {}),
-                            }
-                            save_json_data(json_path, data)
+                                "assignments": dict(assignment_data.get("assignments", {})),
+                            },
+                        )
                     except Exception as save_error:
                         logger.error(f"Failed to save error information: {save_error}")
                     raise e
 
+                finally:
+                    # 기록은 백그라운드에서 나중에 저장되므로 복사본을 넘기고,
+                    # 다음 호출을 위해 대입문 데이터 초기화 (실패한 호출의 값이 남지 않도록)
+                    assignment_data.clear()
+                    assignment_data["assignments"] = {}
+
             return wrapper
 
         return decorator
@@ -0,0 +1,66 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from common.decorator.latex_factory import LatexFactory
+
+
+def add_then_double(n, fail):
+    a = n + 1
+    b = a * 2
+    if fail:
+        c = b + 1
+        raise ValueError("fail")
+    return b
+
+
+class TestLatexFactoryRecords(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_dir = Path(self.temp_dir.name)
+        self.factory = LatexFactory()
+        self.store = self.factory._get_store(self.save_dir)
+        self.store.compact_on_close = False
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def read_records(self):
+        self.store.flush()
+        with open(self.store.log_path, encoding="utf-8") as f:
+            return [json.loads(line)["data"] for line in f]
+
+    def test_failed_call_record_not_changed_by_next_call(self):
+        func = self.factory(save_dir=self.save_dir, auto_latex_str=False)(add_then_double)
+
+        with self.assertRaises(ValueError), self.assertLogs("common.decorator.latex_factory", "ERROR"):
+            func(1, True)
+        self.assertEqual(func(10, False), 22)
+
+        error_record, success_record = self.read_records()
+        self.assertEqual(error_record["error"], "fail")
+        self.assertEqual(
+            {key: entry["latex"] for key, entry in error_record["assignments"].items()},
+            {"a = n + 1": "2", "b = a * 2": "4", "c = b + 1": "5"},
+        )
+        self.assertEqual(
+            {key: entry["latex"] for key, entry in success_record["assignments"].items()},
+            {"a = n + 1": "11", "b = a * 2": "22"},
+        )
+
+    def test_failed_call_assignments_not_carried_over(self):
+        func = self.factory(save_dir=self.save_dir, auto_latex_str=False)(add_then_double)
+
+        with self.assertRaises(ValueError), self.assertLogs("common.decorator.latex_factory", "ERROR"):
+            func(1, True)
+        # 실패한 호출의 대입문 데이터는 다음 호출 전에 비워진다
+        func(10, False)
+
+        _, success_record = self.read_records()
+        self.assertEqual(set(success_record["assignments"]), {"a = n + 1", "b = a * 2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from common.sympy_compiler import compile_derivative
+
+
+# 중앙 차분 기본 간격
+DEFAULT_DIFF_STEP = 1e-4
+
+
+class DescentMethod(Enum):
+    GRADIENT = 'gradient'  # 기본 경사 하강법
+    MOMENTUM = 'momentum'
+    ADAM = 'adam'
+
+
+def evaluate(f: Callable, points: np.ndarray) -> np.ndarray:
+    """f(x, y, ...) 형태의 함수를 (..., d) 점 배열에 한 번에 적용"""
+    points = np.asarray(points, dtype=float)
+    return np.asarray(f(*np.moveaxis(points, -1, 0)), dtype=float)
+
+
+def numerical_gradient(f: Callable, points: np.ndarray, h: float = DEFAULT_DIFF_STEP) -> np.ndarray:
+    """중앙 차분 그래디언트 (..., d) — 모든 점과 모든 방향의 2d번 평가를 함수 호출 한 번으로 처리
+
+    f는 좌표별 배열을 인자로 받는 벡터화된 함수여야 한다 (예: f(x, y) = x**2 + y**2).
+    """
+    points = np.asarray(points, dtype=float)
+    dim = points.shape[-1]
+
+    # offsets[k] = h e_k  ->  shifted: (2, d, ..., d)
+    offsets = (np.eye(dim) * h).reshape((dim,) + (1,) * (points.ndim - 1) + (dim,))
+    shifted = points + np.stack([offsets, -offsets])
+    values = evaluate(f, shifted)
+
+    grad = (values[0] - values[1]) / (2 * h)  # (d, ...)
+    return np.moveaxis(grad, 0, -1)
+
+
+def sympy_gradient(expr, symbols: Sequence) -> Callable[[np.ndarray], np.ndarray]:
+    """sympy 식의 해석적 그래디언트 함수 (점 배열 (..., d) -> (..., d))
+
+    편미분 식은 common.sympy_compiler 캐시를 거쳐 한 번만 컴파일된다.
+    """
+    partials = [compile_derivative(expr, symbol, symbols=symbols) for symbol in symbols]
+
+    def gradient(points: np.ndarray) -> np.ndarray:
+        coords = np.moveaxis(np.asarray(points, dtype=float), -1, 0)
+        return np.stack(
+            [np.broadcast_to(partial(*coords), coords.shape[1:]) for partial in partials],
+            axis=-1)
+    return gradient
+
+
+def grid_points(x_range: Sequence[float], y_range: Sequence[float], count: int | tuple[int, int]) -> np.ndarray:
+    """사각 영역을 고르게 채우는 시작점들 (count_x * count_y, 2) — 수렴 영역(basin) 시각화용"""
+    count_x, count_y = (count, count) if isinstance(count, int) else count
+    xs, ys = np.meshgrid(
+        np.linspace(x_range[0], x_range[1], count_x),
+        np.linspace(y_range[0], y_range[1], count_y))
+    return np.stack([xs.ravel(), ys.ravel()], axis=-1)
+
+
+def expand_runs(init_points, learning_rates) -> tuple[np.ndarray, np.ndarray]:
+    """시작점 n개 x 학습률 m개의 모든 조합 (n*m 실행)을 한 배치로 펼친다
+
+    Returns:
+        (n*m, d) 시작점, (n*m,) 학습률 — 학습률이 바깥 루프 (run = lr_index * n + point_index)
+    """
+    init_points = np.atleast_2d(np.asarray(init_points, dtype=float))
+    learning_rates = np.atleast_1d(np.asarray(learning_rates, dtype=float))
+    points = np.tile(init_points, (len(learning_rates), 1))
+    rates = np.repeat(learning_rates, len(init_points))
+    return points, rates
+
+
+@dataclass
+class DescentResult:
+    """배치 경사 하강 결과 (steps: 반복 횟수, runs: 동시 실행 수, d: 차원)"""
+    trajectories: np.ndarray  # (steps + 1, runs, d)
+    gradients: np.ndarray  # (steps, runs, d)
+    values: np.ndarray  # (steps + 1, runs)
+    learning_rates: np.ndarray  # (runs,)
+
+    @property
+    def final_points(self) -> np.ndarray:
+        return self.trajectories[-1]
+
+    def trajectory(self, run: int) -> np.ndarray:
+        """한 실행의 경로 (steps + 1, d)"""
+        return self.trajectories[:, run]
+
+    def converged(self, tolerance: float = 1e-3) -> np.ndarray:
+        """마지막 그래디언트 크기가 tolerance 이하인 실행 (runs,) bool"""
+        return np.linalg.norm(self.gradients[-1], axis=-1) <= tolerance
+
+
+class GradientDescent:
+    """여러 시작점/학습률의 경사 하강을 한 번의 NumPy 배치 계산으로 실행
+
+    - 그래디언트: 지정하지 않으면 벡터화된 중앙 차분 (numerical_gradient),
+      sympy 식이 있으면 sympy_gradient(...)로 해석적 그래디언트 사용
+    - 방법: 기본 경사 하강 / 모멘텀 / Adam
+    """
+
+    def __init__(self,
+                 f: Callable,
+                 gradient: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 method: DescentMethod = DescentMethod.GRADIENT,
+                 momentum: float = 0.9,
+                 beta1: float = 0.9,
+                 beta2: float = 0.999,
+                 epsilon: float = 1e-8,
+                 h: float = DEFAULT_DIFF_STEP):
+        self.f = f
+        self.gradient = gradient or (lambda points: numerical_gradient(f, points, h))
+        self.method = method
+        self.momentum = momentum
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def run(self, init_points, learning_rate, steps: int) -> DescentResult:
+        """
+        Args:
+            init_points: (runs, d) 시작점 (한 점이면 (d,)도 가능)
+            learning_rate: 스칼라 또는 실행별 (runs,) 학습률
+            steps: 반복 횟수
+        """
+        points = np.atleast_2d(np.array(init_points, dtype=float))
+        runs, dim = points.shape
+        rates = np.broadcast_to(np.asarray(learning_rate, dtype=float), (runs,)).copy()
+
+        trajectories = np.empty((steps + 1, runs, dim))
+        gradients = np.empty((steps, runs, dim))
+        trajectories[0] = points
+
+        velocity = np.zeros_like(points)  # 모멘텀 / Adam 1차 모멘트
+        second = np.zeros_like(points)  # Adam 2차 모멘트
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            for step in range(steps):
+                grad = self.gradient(points)
+                gradients[step] = grad
+
+                if self.method == DescentMethod.MOMENTUM:
+                    velocity = self.momentum * velocity - rates[:, None] * grad
+                    points = points + velocity
+                elif self.method == DescentMethod.ADAM:
+                    velocity = self.beta1 * velocity + (1 - self.beta1) * grad
+                    second = self.beta2 * second + (1 - self.beta2) * grad ** 2
+                    corrected = velocity / (1 - self.beta1 ** (step + 1))
+                    scale = np.sqrt(second / (1 - self.beta2 ** (step + 1))) + self.epsilon
+                    points = points - rates[:, None] * corrected / scale
+                else:
+                    points = points - rates[:, None] * grad
+
+                trajectories[step + 1] = points
+
+            values = evaluate(self.f, trajectories)
+
+        return DescentResult(trajectories, gradients, values, rates)
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from manim import config
+
+logger = logging.getLogger(__name__)
+
+
+# 디스크 캐시 전체 크기 상한 (LRU로 정리)
+DEFAULT_HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# 이 시간 안에 저장된 항목은 네트워크에 묻지 않고 그대로 사용 (초)
+DEFAULT_HTTP_CACHE_MAX_AGE = 24 * 60 * 60
+DEFAULT_HTTP_TIMEOUT = 30
+# 공유 세션의 호스트별 연결 풀 크기 (동시 다운로드 스레드 수 이상)
+DEFAULT_POOL_SIZE = 16
+
+# 환경 변수: 1이면 오프라인 모드 (캐시에 있는 것만 사용), 숫자면 max_age 초
+OFFLINE_ENV = "MANIM_WEB_OFFLINE"
+MAX_AGE_ENV = "MANIM_WEB_CACHE_MAX_AGE"
+
+# 조건부 요청 헤더 (소문자)
+VALIDATOR_HEADERS = ("if-none-match", "if-modified-since")
+
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """오프라인 모드에서 캐시에 없는 URL을 요청한 경우"""
+
+
+@dataclass
+class HttpCacheStats:
+    """캐시 적중/실패 횟수"""
+    fresh_hits: int = 0  # 네트워크 없이 사용
+    revalidated: int = 0  # 304 Not Modified
+    stale_hits: int = 0  # 네트워크 오류로 오래된 항목 사용
+    misses: int = 0  # 새로 내려받음
+
+    @property
+    def network_requests(self) -> int:
+        return self.revalidated + self.misses
+
+    def __str__(self) -> str:
+        return (f"fresh={self.fresh_hits}, revalidated={self.revalidated}, "
+                f"stale={self.stale_hits}, misses={self.misses}")
+
+
+@dataclass
+class CachedResponse:
+    """캐시를 거친 HTTP 응답 (본문 전체를 메모리에 보관)"""
+    url: str
+    content: bytes
+    headers: dict = field(default_factory=dict)  # 소문자 헤더 이름
+    encoding: str | None = None
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """연결 풀 크기를 늘린 requests 세션 (스레드들이 연결을 재사용)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class HttpCache:
+    """URL 별 응답 본문을 디스크에 저장하는 HTTP 캐시
+
+    - 신선도: 저장 후 max_age 초 안에는 네트워크를 사용하지 않음 (math.inf 이면 항상 신선)
+    - 재검증: 오래된 항목은 ETag / Last-Modified 조건부 요청으로 확인 (304면 본문 재사용,
+      재사용할 본문이 없으면 조건 없이 다시 요청)
+    - 오프라인: 캐시에 있는 항목만 사용, 없으면 OfflineCacheMiss
+    - 네트워크 오류: 오래된 항목이라도 있으면 경고 후 사용
+    - 디스크: cache_dir/<키 앞 2자리>/<키>.body, .json (원자적 교체로 프로세스/스레드 간 공유)
+    - 크기 제한: 파일 접근 시각(mtime) 기준 LRU로 max_bytes 이하 유지
+    """
+
+    def __init__(self,
+                 cache_dir: str | Path | None = None,
+                 session: requests.Session | None = None,
+                 offline: bool | None = None,
+                 max_age: float | None = None,
+                 max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES,
+                 timeout: float = DEFAULT_HTTP_TIMEOUT):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._session = session
+        self._offline = offline
+        self._max_age = max_age
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.stats = HttpCacheStats()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()  # 여러 스레드의 통계 갱신용
+        self._disk_bytes: int | None = None  # 첫 저장 시 계산
+
+    @property
+    def cache_dir(self) -> Path:
+        """디스크 캐시 위치 (기본값: <media_dir>/web_cache)"""
+        # config.media_dir는 렌더 시점에 확정되므로 지연 계산
+        return self._cache_dir or Path(config.media_dir) / "web_cache"
+
+    @property
+    def offline(self) -> bool:
+        """오프라인 모드 (지정하지 않으면 MANIM_WEB_OFFLINE 환경 변수)"""
+        return _env_flag(OFFLINE_ENV) if self._offline is None else self._offline
+
+    @offline.setter
+    def offline(self, value: bool | None) -> None:
+        self._offline = value
+
+    @property
+    def max_age(self) -> float:
+        """신선도 유지 시간 (지정하지 않으면 MANIM_WEB_CACHE_MAX_AGE 환경 변수, 기본 하루)"""
+        if self._max_age is not None:
+            return self._max_age
+        value = os.environ.get(MAX_AGE_ENV)
+        return float(value) if value else DEFAULT_HTTP_CACHE_MAX_AGE
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = create_session()
+        return self._session
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        """URL 본문을 캐시를 거쳐 가져온다 (kwargs는 session.get에 전달)"""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        meta = self._load_meta(key)
+
+        if meta is not None and (self.offline or self._is_fresh(meta)):
+            cached = self._load_response(key, meta)
+            if cached is not None:
+                self._count("fresh_hits")
+                return cached
+            meta = None
+
+        if self.offline:
+            raise OfflineCacheMiss(f"Offline mode: {url} is not cached")
+
+        timeout = kwargs.pop("timeout", self.timeout)
+        headers = dict(kwargs.pop("headers", None) or {})
+        conditional_headers = dict(headers)
+        if meta is not None:
+            if meta.get("etag"):
+                conditional_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                conditional_headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self._request(url, conditional_headers, timeout, kwargs)
+            if response.status_code == 304:
+                cached = self._load_response(key, meta) if meta is not None else None
+                if cached is not None:
+                    self._count("revalidated")
+                    self._touch(key, meta)
+                    return cached
+                # 재사용할 본문이 없으면(다른 프로세스가 지운 경우 등) 캐시 실패로 보고 조건 없이 다시 요청
+                meta = None
+                headers = {name: value for name, value in headers.items()
+                           if name.lower() not in VALIDATOR_HEADERS}
+                response = self._request(url, headers, timeout, kwargs)
+                if response.status_code == 304:
+                    raise requests.HTTPError(f"Unexpected 304 without validators for {url}",
+                                             response=response)
+        except requests.RequestException as e:
+            if meta is not None and not isinstance(e, requests.HTTPError):
+                cached = self._load_response(key, meta)
+                if cached is not None:
+                    logger.warning(f"Using stale cache entry for {url}: {e}")
+                    self._count("stale_hits")
+                    return cached
+            raise
+
+        content = response.content
+        encoding = response.encoding
+        response_headers = {name.lower(): value for name, value in response.headers.items()}
+
+        self._count("misses")
+        self._store(key, url, content, response_headers, encoding)
+        return CachedResponse(url, content, response_headers, encoding, from_cache=False)
+
+    def _request(self, url: str, headers: dict, timeout: float, kwargs: dict) -> requests.Response:
+        """GET 요청 (304 외의 오류 상태는 HTTPError, 본문은 읽어 둔 뒤 연결 반환)"""
+        with self.session.get(url, headers=headers, timeout=timeout, **kwargs) as response:
+            if response.status_code != 304:
+                response.raise_for_status()
+                _ = response.content  # 연결을 돌려주기 전에 본문을 읽어 둔다
+            return response
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def clear(self) -> None:
+        """디스크 캐시 비우기"""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.*"):
+                path.unlink(missing_ok=True)
+        self._disk_bytes = 0
+
+    def _is_fresh(self, meta: dict) -> bool:
+        return time.time() - meta.get("stored_at", 0) < self.max_age
+
+    def _paths_for(self, key: str) -> tuple[Path, Path]:
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.body", directory / f"{key}.json"
+
+    def _load_meta(self, key: str) -> dict | None:
+        _, meta_path = self._paths_for(key)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable web cache entry {meta_path.name}: {e}")
+            meta_path.unlink(missing_ok=True)
+            return None
+
+    def _load_response(self, key: str, meta: dict) -> CachedResponse | None:
+        body_path, _ = self._paths_for(key)
+        try:
+            content = body_path.read_bytes()
+            os.utime(body_path)  # LRU 갱신
+        except OSError:
+            return None
+        return CachedResponse(meta["url"], content, meta.get("headers", {}),
+                              meta.get("encoding"), from_cache=True)
+
+    def _touch(self, key: str, meta: dict) -> None:
+        """재검증된 항목의 저장 시각 갱신"""
+        meta = dict(meta, stored_at=time.time())
+        _, meta_path = self._paths_for(key)
+        try:
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Failed to update web cache entry {meta_path.name}: {e}")
+
+    def _store(self, key: str, url: str, content: bytes, headers: dict, encoding: str | None) -> None:
+        meta = {
+            "url": url,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "headers": {name: value for name, value in headers.items()
+                        if name in ("content-type", "etag", "last-modified")},
+            "encoding": encoding,
+            "stored_at": time.time(),
+        }
+        body_path, meta_path = self._paths_for(key)
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            # 본문을 먼저 쓰고 메타데이터를 나중에 써야 메타데이터가 있으면 본문도 있다
+            self._write_atomic(body_path, content)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Failed to write web cache entry {body_path.name}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(content)
+            if self._disk_bytes > self.max_bytes:
+                self._evict()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # 같은 디렉터리에 임시 파일로 쓴 뒤 교체 (다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*/*.body"))
+
+    def _evict(self) -> None:
+        """오래 사용하지 않은 항목부터 지워서 상한의 90% 이하로 줄임"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.body"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # 다른 프로세스가 먼저 지운 경우
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.with_suffix(".json").unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._disk_bytes = total
+
+
+# 모듈 전역 기본 캐시 (공유 세션 사용)
+default_http_cache = HttpCache()
@@ -0,0 +1,153 @@
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from common.http_cache import HttpCache, OfflineCacheMiss
+
+
+class FakeServerHandler(BaseHTTPRequestHandler):
+    """경로별 응답을 돌려주는 테스트 서버 (ETag가 맞으면 304)"""
+    server: "FakeServer"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+
+        etag = '"v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = b"hello"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeServerHandler)
+        self.requests: list[tuple[str, str | None]] = []
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.server = FakeServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.stop_server()
+        self.temp_dir.cleanup()
+
+    def stop_server(self):
+        if self.thread.is_alive():
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+
+    def make_cache(self, **kwargs) -> HttpCache:
+        return HttpCache(cache_dir=self.cache_dir, session=requests.Session(), offline=False, **kwargs)
+
+    def test_fresh_hit_skips_network(self):
+        cache = self.make_cache(max_age=60)
+        first = cache.get(self.server.url("/a"))
+        second = cache.get(self.server.url("/a"))
+
+        self.assertEqual((first.content, first.from_cache), (b"hello", False))
+        self.assertEqual((second.content, second.from_cache), (b"hello", True))
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((cache.stats.misses, cache.stats.fresh_hits), (1, 1))
+
+    def test_stale_entry_revalidated_with_304(self):
+        cache = self.make_cache(max_age=0)
+        cache.get(self.server.url("/a"))
+        response = cache.get(self.server.url("/a"))
+
+        self.assertEqual((response.content, response.from_cache), (b"hello", True))
+        self.assertEqual(self.server.requests[-1], ("/a", '"v1"'))
+        self.assertEqual((cache.stats.misses, cache.stats.revalidated), (1, 1))
+
+    def test_304_without_cached_body_refetches(self):
+        cache = self.make_cache(max_age=0)
+        cache.get(self.server.url("/a"))
+        for body_path in self.cache_dir.glob("*/*.body"):
+            body_path.unlink()
+
+        response = cache.get(self.server.url("/a"))
+
+        self.assertEqual((response.content, response.from_cache), (b"hello", False))
+        self.assertEqual(cache.stats.misses, 2)
+        self.assertIsNone(self.server.requests[-1][1])
+
+    def test_304_for_caller_validators_refetches(self):
+        cache = self.make_cache(max_age=0)
+        response = cache.get(self.server.url("/a"), headers={"If-None-Match": '"v1"'})
+
+        self.assertEqual(response.content, b"hello")
+        self.assertEqual(self.server.requests, [("/a", '"v1"'), ("/a", None)])
+
+    def test_offline_miss(self):
+        cache = HttpCache(cache_dir=self.cache_dir, offline=True)
+        with self.assertRaises(OfflineCacheMiss):
+            cache.get(self.server.url("/a"))
+        self.assertEqual(self.server.requests, [])
+
+    def test_offline_uses_cached_entry(self):
+        self.make_cache(max_age=0).get(self.server.url("/a"))
+        cache = HttpCache(cache_dir=self.cache_dir, offline=True, max_age=0)
+
+        self.assertEqual(cache.get(self.server.url("/a")).content, b"hello")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_http_error_is_raised(self):
+        cache = self.make_cache()
+        with self.assertRaises(requests.HTTPError):
+            cache.get(self.server.url("/missing"))
+        self.assertEqual(list(self.cache_dir.glob("*/*.body")), [])
+
+    def test_stale_fallback_on_connection_error(self):
+        cache = self.make_cache(max_age=0)
+        url = self.server.url("/a")
+        cache.get(url)
+        self.stop_server()
+
+        with self.assertLogs("common.http_cache", level="WARNING"):
+            response = cache.get(url, timeout=5)
+
+        self.assertEqual((response.content, response.from_cache), (b"hello", True))
+        self.assertEqual(cache.stats.stale_hits, 1)
+
+    def test_stats_counted_from_threads(self):
+        cache = self.make_cache(max_age=60)
+        url = self.server.url("/a")
+        cache.get(url)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: cache.get(url), range(200)))
+
+        self.assertEqual(cache.stats.fresh_hits, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
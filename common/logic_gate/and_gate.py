@@ -23,6 +23,11 @@ class AndGate(LogicGate):
 
         self.add(body, *self.input_ports, *self.output_ports)
 
+    @staticmethod
+    def logic_function(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """비트 단위 AND"""
+        return a & b
+
     def _create_gate_body(self) -> VMobject:
         """AND 게이트의 기본 도형 생성 (D 모양)"""
         stroke_color = interpolate_color(
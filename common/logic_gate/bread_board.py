@@ -1,4 +1,4 @@
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Sequence
 import numpy as np
 from manim import *
 from common.logic_gate.logic_gate import LogicGate
@@ -12,6 +12,40 @@ from common.logic_gate.wire import Wire
 from common.logic_gate.styles import LogicGateStyle
 
 
+class GateMoveAnimation(Animation):
+    """여러 게이트를 각자의 목표 위치로 동시에 이동하며 연결된 와이어를 갱신하는 애니메이션
+
+    시작 위치만 필요하므로 게이트 복사본(starting_mobject)을 만들지 않고,
+    매 프레임 게이트를 옮긴 뒤 포트가 움직인 와이어 끝점만 제자리에서 갱신한다.
+    """
+
+    def __init__(self,
+                 board: "BreadBoardPlane",
+                 gates: Sequence[LogicGate],
+                 target_points: np.ndarray,
+                 **kwargs) -> None:
+        self.gates = list(gates)
+        self.target_points = np.asarray(target_points, dtype=float).reshape(len(self.gates), 3)
+        # 보드 전체를 애니메이션 대상으로 두어 보드 위의 와이어도 매 프레임 다시 그려지도록 함
+        super().__init__(board, **kwargs)
+
+    def begin(self) -> None:
+        self.start_points = np.array([gate.get_center() for gate in self.gates])
+        super().begin()
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        positions = self.start_points + (self.target_points - self.start_points) * alpha
+        for gate, position in zip(self.gates, positions):
+            gate.move_to(position)
+        # 모든 게이트를 옮긴 뒤 갱신해야 양 끝이 모두 움직인 와이어를 한 번만 계산
+        for gate in self.gates:
+            gate.update_connected_wires()
+
+
 class BreadBoardPlane(NumberPlane):
     # 스타일 상수 정의
     AXIS_STYLE = {
@@ -95,22 +129,26 @@ class BreadBoardPlane(NumberPlane):
         return wire
 
     def move_gate(self, gate, target_pos, run_time=1):
-        """게이트를 새로운 위치로 이동하는 애니메이션들을 생성하여 반환"""
-        target_screen_pos = self.c2p(*target_pos) if len(target_pos) == 3 else self.c2p(
-            target_pos[0], target_pos[1], LogicGateStyle.DEFAULT_Z_COORD)
-
-        # 게이트와 와이어를 함께 움직이는 애니메이션 그룹 생성
-        wire_anims = []
-
-        # 게이트가 이동하면서 매 프레임마다 와이어도 업데이트
-        def update_wires(mob, alpha):
-            # 현재 위치와 목표 위치 사이를 보간
-            current_pos = mob.get_center() * (1 - alpha) + target_screen_pos * alpha
-            mob.move_to(current_pos)
-            # 연결된 와이어 업데이트
-            mob.update_connected_wires()
-
-        return UpdateFromAlphaFunc(gate, update_wires, run_time=run_time)
+        """게이트를 새로운 위치로 이동하는 애니메이션 반환"""
+        return self.move_gates([(gate, target_pos)], run_time=run_time)
+
+    def move_gates(self,
+                   moves: Sequence[Tuple[LogicGate, tuple[float, float] | tuple[float, float, float]]],
+                   run_time: float = 1,
+                   **kwargs) -> GateMoveAnimation:
+        """여러 게이트를 하나의 애니메이션으로 동시에 이동
+
+        Args:
+            moves: (게이트, 빵판 좌표계 목표 위치) 목록
+            run_time: 애니메이션 시간
+        """
+        gates = [gate for gate, _ in moves]
+        target_points = [
+            self.c2p(*pos) if len(pos) == 3 else self.c2p(
+                pos[0], pos[1], LogicGateStyle.DEFAULT_Z_COORD)
+            for _, pos in moves
+        ]
+        return GateMoveAnimation(self, gates, target_points, run_time=run_time, **kwargs)
 
     def get_gate_input_coords(self,
                               gate: LogicGate,
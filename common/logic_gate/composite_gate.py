@@ -37,7 +37,13 @@ class CompositeGate(LogicGate):
         return self.port_mappings.get(port_name)
 
     def update_connected_wires(self) -> None:
-        """모든 내부 게이트의 와이어 업데이트"""
-        super().update_connected_wires()
+        """포트가 움직인 경우 외부 와이어와 내부 게이트의 와이어 업데이트
+
+        내부 게이트도 각자 포트 이동 여부를 확인하므로 움직이지 않은 게이트는 건너뛰고,
+        복합 게이트와 함께 평행이동한 내부 와이어는 끝점을 다시 계산하지 않는다.
+        """
+        if not self._ports_moved():
+            return
+        self._update_own_wires()
         for gate in self.internal_gates:
             gate.update_connected_wires()
@@ -2,6 +2,8 @@ from manim import *
 from common.logic_gate.logic_gate import LogicGate
 from common.logic_gate.composite_gate import CompositeGate
 from common.logic_gate.styles import LogicGateStyle
+from common.logic_gate.wire import Wire
+from common.logic_gate.wire_router import WireRouter, Connection
 
 
 class CompositeGateBuilder:
@@ -53,42 +55,13 @@ class CompositeGateBuilder:
         composite.map_external_port('output_sum', output_sum)
         composite.map_external_port('output_carry', output_carry)
 
-        # 내부 와이어 연결
-        wires = [
-            # input_a에서 분기
-            self.board.create_wire(input_a.get_center(),
-                                   xor_gate.input_ports[0].get_center()),
-            # input_a에서 and_gate로의 꺾인 와이어
-            self.board.create_wire(
-                input_a.get_center() + RIGHT * 0.7,
-                and_gate.input_ports[0].get_center(),
-                mid_points=[(
-                    input_a.get_center()[0] + 0.7,  # x 좌표
-                    and_gate.input_ports[0].get_center()[1],  # y 좌표
-                    0  # z 좌표
-                )]
-            ),
-
-            # input_b에서 분기
-            self.board.create_wire(input_b.get_center(),
-                                   xor_gate.input_ports[1].get_center()),
-
-            self.board.create_wire(
-                input_b.get_center() + RIGHT * 0.3,
-                and_gate.input_ports[1].get_center(),
-                mid_points=[(
-                    input_b.get_center()[0] + 0.3,  # x 좌표
-                    and_gate.input_ports[1].get_center()[1],  # y 좌표
-                    0  # z 좌표
-                )]
-            ),
-
-            # 출력 연결
-            self.board.create_wire(
-                xor_gate.output_ports[0].get_center(), output_sum.get_center()),
-            self.board.create_wire(
-                and_gate.output_ports[0].get_center(), output_carry.get_center())
-        ]
+        # 내부 와이어 자동 배선
+        wires = self.route_wires([xor_gate, and_gate], [
+            (input_a, [xor_gate.input_ports[0], and_gate.input_ports[0]]),
+            (input_b, [xor_gate.input_ports[1], and_gate.input_ports[1]]),
+            (xor_gate.output_ports[0], [output_sum]),
+            (and_gate.output_ports[0], [output_carry]),
+        ])
 
         # 와이어 추가 및 연결
         for wire in wires:
@@ -148,84 +121,15 @@ class CompositeGateBuilder:
         composite.map_external_port('input_b', input_b)
         composite.map_external_port('output', output)
 
-        # 내부 와이어 연결
-        wires = [
-            # 입력 A 분기
-            self.board.create_wire(input_a.get_center(),
-                                   nand2.input_ports[0].get_center()),
-            self.board.create_wire(
-                input_a.get_center(),
-                nand1.input_ports[0].get_center(),
-                mid_points=[
-                    (input_a.get_center()[0] + spacing /
-                     2, input_a.get_center()[1], 0),
-                    (input_a.get_center()[0] + spacing/2,
-                     nand1.input_ports[0].get_center()[1], 0)
-                ]
-            ),
-
-            # 입력 B 분기
-            self.board.create_wire(
-                input_b.get_center(),
-                nand1.input_ports[1].get_center(),
-                mid_points=[
-                    (input_b.get_center()[0] + spacing /
-                     2, input_b.get_center()[1], 0),
-                    (input_b.get_center()[0] + spacing/2,
-                     nand1.input_ports[1].get_center()[1], 0)
-                ]
-            ),
-            self.board.create_wire(input_b.get_center(),
-                                   nand3.input_ports[1].get_center()),
-
-            # NAND1 출력 분기
-            self.board.create_wire(
-                nand1.output_ports[0].get_center(),
-                nand2.input_ports[1].get_center(),
-                mid_points=[
-                    (nand1.output_ports[0].get_center()[0] + spacing/2,
-                     nand1.output_ports[0].get_center()[1], 0),
-                    (nand1.output_ports[0].get_center()[0] + spacing/2,
-                     nand2.input_ports[1].get_center()[1], 0)
-                ]
-            ),
-            self.board.create_wire(
-                nand1.output_ports[0].get_center(),
-                nand3.input_ports[0].get_center(),
-                mid_points=[
-                    (nand1.output_ports[0].get_center()[0] + spacing/2,
-                     nand1.output_ports[0].get_center()[1], 0),
-                    (nand1.output_ports[0].get_center()[0] + spacing/2,
-                     nand3.input_ports[0].get_center()[1], 0)
-                ]
-            ),
-
-            # NAND2, NAND3 출력 -> NAND4 입력
-            self.board.create_wire(
-                nand2.output_ports[0].get_center(),
-                nand4.input_ports[0].get_center(),
-                mid_points=[
-                    (nand2.output_ports[0].get_center()[0] + spacing/2,
-                     nand2.output_ports[0].get_center()[1], 0),
-                    (nand2.output_ports[0].get_center()[0] + spacing/2,
-                     nand4.input_ports[0].get_center()[1], 0)
-                ]
-            ),
-            self.board.create_wire(
-                nand3.output_ports[0].get_center(),
-                nand4.input_ports[1].get_center(),
-                mid_points=[
-                    (nand3.output_ports[0].get_center()[0] + spacing/2,
-                     nand3.output_ports[0].get_center()[1], 0),
-                    (nand3.output_ports[0].get_center()[0] + spacing/2,
-                     nand4.input_ports[1].get_center()[1], 0)
-                ]
-            ),
-
-            # NAND4 출력
-            self.board.create_wire(
-                nand4.output_ports[0].get_center(), output.get_center())
-        ]
+        # 내부 와이어 자동 배선
+        wires = self.route_wires([nand1, nand2, nand3, nand4], [
+            (input_a, [nand2.input_ports[0], nand1.input_ports[0]]),
+            (input_b, [nand1.input_ports[1], nand3.input_ports[1]]),
+            (nand1.output_ports[0], [nand2.input_ports[1], nand3.input_ports[0]]),
+            (nand2.output_ports[0], [nand4.input_ports[0]]),
+            (nand3.output_ports[0], [nand4.input_ports[1]]),
+            (nand4.output_ports[0], [output]),
+        ])
 
         # 와이어 추가
         for wire in wires:
@@ -233,6 +137,93 @@ class CompositeGateBuilder:
 
         return composite
 
+    def build_ripple_carry_adder(self, pos: tuple[float, float], num_bits: int = 4,
+                                 **kwargs) -> CompositeGate:
+        """전가산기를 세로로 쌓은 리플 캐리 가산기 생성 (와이어는 자동 배선)
+
+        비트 i의 포트: input_a{i}, input_b{i}, output_s{i} / 공통: input_cin, output_cout
+        """
+        composite = CompositeGate(**kwargs)
+        base_x, base_y = pos
+        column = LogicGateStyle.COMPOSITE_GATE_SPACING * 2
+        row = LogicGateStyle.COMPOSITE_GATE_SPACING * 3
+        x_offset = column * 1.2
+
+        gates = []
+        connections: list[Connection] = []
+        carry = None
+        for bit in range(num_bits):
+            y = base_y - bit * row
+            xor1 = self.board.create_xor_gate((base_x, y + 0.6), **kwargs)
+            and1 = self.board.create_and_gate((base_x, y - 0.9), **kwargs)
+            xor2 = self.board.create_xor_gate((base_x + column, y + 0.9), **kwargs)
+            and2 = self.board.create_and_gate((base_x + column, y - 0.3), **kwargs)
+            or_gate = self.board.create_or_gate((base_x + column * 2, y - 0.9), **kwargs)
+            bit_gates = [xor1, and1, xor2, and2, or_gate]
+            for gate in bit_gates:
+                composite.add_internal_gate(gate)
+            gates.extend(bit_gates)
+
+            input_a = composite._create_port(self.board.c2p(
+                base_x - x_offset, self.board.get_gate_input_coords(xor1, 0)[1]))
+            input_b = composite._create_port(self.board.c2p(
+                base_x - x_offset, self.board.get_gate_input_coords(xor1, 1)[1]))
+            output_s = composite._create_port(self.board.c2p(
+                base_x + column * 2 + x_offset, self.board.get_gate_output_coords(xor2)[1]))
+            composite.map_external_port(f'input_a{bit}', input_a)
+            composite.map_external_port(f'input_b{bit}', input_b)
+            composite.map_external_port(f'output_s{bit}', output_s)
+
+            if carry is None:
+                carry = composite._create_port(self.board.c2p(base_x - x_offset, y + 1.6))
+                composite.map_external_port('input_cin', carry)
+
+            connections += [
+                (input_a, [xor1.input_ports[0], and1.input_ports[0]]),
+                (input_b, [xor1.input_ports[1], and1.input_ports[1]]),
+                (xor1.output_ports[0], [xor2.input_ports[0], and2.input_ports[0]]),
+                (carry, [xor2.input_ports[1], and2.input_ports[1]]),
+                (xor2.output_ports[0], [output_s]),
+                (and1.output_ports[0], [or_gate.input_ports[1]]),
+                (and2.output_ports[0], [or_gate.input_ports[0]]),
+            ]
+            carry = or_gate.output_ports[0]
+
+        output_cout = composite._create_port(self.board.c2p(
+            base_x + column * 2 + x_offset, self.board.p2c(carry.get_center())[1]))
+        composite.map_external_port('output_cout', output_cout)
+        connections.append((carry, [output_cout]))
+
+        for wire in self.route_wires(gates, connections):
+            composite.add_internal_wire(wire)
+
+        return composite
+
+    def route_wires(self,
+                    gates: list[LogicGate],
+                    connections: list[Connection],
+                    router: WireRouter | None = None) -> list[Wire]:
+        """게이트들을 피해 가는 직교 와이어를 자동 배선하여 빵판에 생성
+
+        Args:
+            gates: 장애물로 피해 갈 게이트들
+            connections: (출력 포트, [입력 포트들]) 목록
+            router: 재사용할 배선기 (gates 의 현재 위치로 장애물을 다시 등록한 뒤 배선)
+        """
+        if router is None:
+            router = WireRouter(self.board)
+            router.add_gates(gates)
+        else:
+            router.reset_layout(gates)
+
+        wires = []
+        for polylines in router.route_all(connections):
+            for polyline in polylines:
+                mid_points = [tuple(point) for point in polyline[1:-1]]
+                wires.append(self.board.create_wire(
+                    tuple(polyline[0]), tuple(polyline[-1]), mid_points=mid_points or None))
+        return wires
+
     def build_bounding_box(self,
                            gate: LogicGate,
                            padding: float = LogicGateStyle.COMPOSITE_GATE_BOX_PADDING,
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List
+from typing import Callable, List, Optional
 from manim import *
 from common.logic_gate.styles import LogicGateStyle
 from common.logic_gate.base_interfaces import LogicGateBase, WireBase
@@ -8,6 +8,10 @@ from common.logic_gate.base_interfaces import LogicGateBase, WireBase
 class LogicGate(VGroup, LogicGateBase):
     """논리 게이트들의 기본 클래스"""
 
+    # 입력 비트 벡터들을 받아 출력 비트 벡터를 반환하는 논리 함수 (시뮬레이터용)
+    # 비트 연산(&, |, ^, ~)만 사용하여 (게이트 수, 워드 수) 배열에도 그대로 적용되어야 한다.
+    logic_function: Optional[Callable[..., np.ndarray]] = None
+
     def __init__(self,
                  color: ManimColor = LogicGateStyle.DEFAULT_COLOR,
                  size: float = LogicGateStyle.DEFAULT_SIZE,
@@ -19,6 +23,8 @@ class LogicGate(VGroup, LogicGateBase):
         self.output_ports: List[Dot] = []
         self.input_wires: List[WireBase] = []    # 입력 와이어 목록
         self.output_wires: List[WireBase] = []   # 출력 와이어 목록
+        # 마지막 와이어 동기화 시점의 포트 기준점 (dirty 판정용)
+        self._wire_sync_anchor: Optional[np.ndarray] = None
 
     def _create_port(self, position: np.ndarray) -> Dot:
         """입출력 포트 생성"""
@@ -61,8 +67,30 @@ class LogicGate(VGroup, LogicGateBase):
         return self
 
     def update_connected_wires(self) -> None:
-        """연결된 모든 와이어의 위치 업데이트"""
+        """포트가 움직인 경우에만 연결된 와이어의 위치 업데이트"""
+        if self._ports_moved():
+            self._update_own_wires()
+
+    def _update_own_wires(self) -> None:
+        # 와이어마다 다시 한 번 포트 이동 여부를 확인하고 움직인 끝점만 갱신
         for wire in self.input_wires:
             wire.update_end_position()
         for wire in self.output_wires:
             wire.update_start_position()
+
+    def _ports_moved(self) -> bool:
+        """마지막 호출 이후 포트가 움직였는지 확인하고 기준점 갱신
+
+        첫 포트와 마지막 포트의 첫 점을 기준점으로 사용하므로
+        평행이동, 회전, 스케일을 모두 감지한다.
+        """
+        ports = self.input_ports + self.output_ports
+        if not ports:
+            return True
+
+        anchor = np.array([ports[0].points[0], ports[-1].points[0]])
+        if self._wire_sync_anchor is not None and \
+                np.abs(anchor - self._wire_sync_anchor).max() < LogicGateStyle.WIRE_SYNC_TOLERANCE:
+            return False
+        self._wire_sync_anchor = anchor
+        return True
@@ -3,6 +3,7 @@ from common.logic_gate.bread_board import BreadBoardPlane
 from common.logic_gate.wire import Wire
 from common.logic_gate.composite_gate import CompositeGate
 from common.logic_gate.composite_gate_builder import CompositeGateBuilder
+from common.logic_gate.simulator import LogicSimulator, SimulationResult
 
 
 class NandXorTestScene(Scene):
@@ -40,6 +41,31 @@ class NandXorTestScene(Scene):
         )
         self.wait(3)
 
+        # 시뮬레이터로 진리표를 한 번에 계산하고 행마다 와이어 신호 표시
+        result = LogicSimulator.from_composite(xor_gate).truth_table()
+        external_wires = dict(zip(
+            input_wires + [output_wire],
+            [xor_gate.get_port_by_name(name) for name in ('input_a', 'input_b', 'output')]
+        ))
+        self._play_truth_table(result, xor_gate.internal_wires, external_wires)
+
+    def _play_truth_table(self, result: SimulationResult, internal_wires: list[Wire],
+                          external_wires: dict[Wire, Dot]) -> None:
+        """진리표의 각 행에 대해 와이어 색상을 신호 값으로 변경"""
+        for row in range(result.num_rows):
+            wire_values = result.wire_values(row)
+            anims = [
+                wire.wire_line.animate.set_stroke(color=wire.get_signal_color(wire_values[wire]))
+                for wire in internal_wires
+            ]
+            anims += [
+                wire.wire_line.animate.set_stroke(
+                    color=wire.get_signal_color(result.port_value(port, row)))
+                for wire, port in external_wires.items()
+            ]
+            self.play(*anims, run_time=0.5)
+            self.wait(1)
+
     def _create_input_wires(self, plane: BreadBoardPlane, gate: CompositeGate) -> tuple[list[Wire], list[tuple]]:
         """입력 와이어 생성"""
         input_coords = {
@@ -18,3 +18,8 @@ class NorGate(OrGate, NotGateMixin):
         )
         self.add(circle)
         self.output_ports[0].move_to(circle.get_right())
+
+    @staticmethod
+    def logic_function(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """비트 단위 NOR"""
+        return ~(a | b)
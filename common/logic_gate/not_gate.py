@@ -18,6 +18,11 @@ class NotGate(LogicGate):
 
         self.add(triangle, circle, *self.input_ports, *self.output_ports)
 
+    @staticmethod
+    def logic_function(a: np.ndarray) -> np.ndarray:
+        """비트 단위 NOT"""
+        return ~a
+
     def _create_triangle(self) -> Polygon:
         stroke_color = interpolate_color(
             self.color, WHITE, LogicGateStyle.DEFAULT_STROKE_LIGHTEN)
@@ -18,6 +18,11 @@ class OrGate(LogicGate):
         # 모든 요소를 그룹에 추가
         self.add(body, *self.input_ports, *self.output_ports)
 
+    @staticmethod
+    def logic_function(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """비트 단위 OR"""
+        return a | b
+
     def _create_input_ports(self, body: VMobject) -> list[Dot]:
         """입력 포트들의 위치를 계산하고 생성"""
         h = self.size/2
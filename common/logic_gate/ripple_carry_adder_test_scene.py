@@ -0,0 +1,36 @@
+from manim import *
+from common.logic_gate.bread_board import BreadBoardPlane
+from common.logic_gate.composite_gate_builder import CompositeGateBuilder
+from common.logic_gate.simulator import LogicSimulator
+
+
+class RippleCarryAdderTestScene(Scene):
+    """자동 배선으로 생성한 4비트 리플 캐리 가산기 테스트 씬"""
+
+    NUM_BITS = 4
+
+    def construct(self):
+        # 가산기 전체가 들어가도록 넓은 빵판을 만들어 축소
+        plane = BreadBoardPlane(x_range=[-10, 10, 1], y_range=[-9, 7, 1]).scale(0.45)
+        self.add(plane)
+
+        builder = CompositeGateBuilder(plane)
+        adder = builder.build_ripple_carry_adder((0, 5), num_bits=self.NUM_BITS, color=BLUE)
+        builder.build_bounding_box(adder)
+        self.wait(2)
+
+        # 11 + 6 을 시뮬레이션하여 와이어 색상으로 신호 표시
+        simulator = LogicSimulator.from_composite(adder)
+        a, b = 0b1011, 0b0110
+        inputs = {'input_cin': 0}
+        for bit in range(self.NUM_BITS):
+            inputs[f'input_a{bit}'] = (a >> bit) & 1
+            inputs[f'input_b{bit}'] = (b >> bit) & 1
+        result = simulator.simulate(inputs)
+
+        wire_values = result.wire_values()
+        self.play(*[
+            wire.wire_line.animate.set_stroke(color=wire.get_signal_color(wire_values[wire]))
+            for wire in adder.internal_wires
+        ])
+        self.wait(3)
@@ -0,0 +1,411 @@
+from __future__ import annotations
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
+from manim import Dot
+from common.logic_gate.logic_gate import LogicGate
+from common.logic_gate.composite_gate import CompositeGate
+from common.logic_gate.wire import Wire
+
+# 같은 연결점으로 볼 화면 좌표 거리
+CONNECTION_TOLERANCE = 1e-3
+# 비트 병렬 평가의 워드 크기 (한 워드에 진리표 64행)
+WORD_BITS = 64
+
+# 입출력 지정: 포트(Dot) 또는 그 포트가 속한 와이어
+PortSpec = Union[Dot, Wire]
+
+
+class _UnionFind:
+    """연결점 병합용 union-find"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+def _wire_vertices(wire: Wire) -> np.ndarray:
+    """와이어 꺾은선의 꼭짓점들 (화면 좌표 x, y)"""
+    line = wire.wire_line
+    vertices = np.vstack([line.get_start_anchors(), line.points[-1:]])
+    return vertices[:, :2]
+
+
+def _point_key(point: np.ndarray) -> Tuple[int, int]:
+    return (int(round(point[0] / CONNECTION_TOLERANCE)),
+            int(round(point[1] / CONNECTION_TOLERANCE)))
+
+
+def _collect_components(composite: CompositeGate,
+                        gates: List[LogicGate],
+                        wires: List[Wire],
+                        junctions: List[Dot]) -> None:
+    """복합 게이트를 펼쳐 말단 게이트, 와이어, 내부 복합 게이트의 포트 수집"""
+    wires.extend(composite.internal_wires)
+    for gate in composite.internal_gates:
+        if isinstance(gate, CompositeGate):
+            junctions.extend(gate.port_mappings.values())
+            _collect_components(gate, gates, wires, junctions)
+        else:
+            gates.append(gate)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """(신호 수, 행 수) bool 배열을 (신호 수, 워드 수) uint64 배열로 압축"""
+    bits = np.atleast_2d(np.asarray(bits, dtype=bool))
+    num_rows = bits.shape[1]
+    padded = -(-num_rows // WORD_BITS) * WORD_BITS
+    if padded != num_rows:
+        bits = np.pad(bits, ((0, 0), (0, padded - num_rows)))
+    return np.packbits(bits, axis=1, bitorder='little').view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, num_rows: int) -> np.ndarray:
+    """pack_bits의 역변환"""
+    words = np.ascontiguousarray(words)
+    return np.unpackbits(words.view(np.uint8), axis=-1, bitorder='little')[..., :num_rows].astype(bool)
+
+
+class LogicSimulator:
+    """와이어 연결 그래프로 만든 넷리스트를 비트 병렬로 평가하는 시뮬레이터
+
+    - 넷: 좌표가 일치하는 포트/와이어 끝점, 다른 와이어 위에서 갈라지는 분기점,
+      connect_input_wire/connect_output_wire로 명시한 연결을 하나의 신호선으로 병합
+    - 레벨화: 게이트를 위상 정렬하여 같은 레벨의 같은 논리 함수 게이트들을 한 번에 평가
+    - 값: 넷마다 uint64 워드 배열 (비트 하나가 진리표 한 행)
+    """
+
+    def __init__(self,
+                 gates: List[LogicGate],
+                 wires: List[Wire],
+                 inputs: Dict[str, PortSpec],
+                 outputs: Dict[str, PortSpec],
+                 junctions: Optional[List[Dot]] = None):
+        """
+        Args:
+            gates: 말단 논리 게이트 (logic_function이 정의된 게이트)
+            wires: 게이트 사이를 잇는 와이어
+            inputs: 입력 이름 -> 입력 포트 또는 입력 와이어
+            outputs: 출력 이름 -> 출력 포트 또는 출력 와이어
+            junctions: 신호를 그대로 통과시키는 연결점 (내부 복합 게이트의 포트 등)
+        """
+        for gate in gates:
+            if gate.logic_function is None:
+                raise ValueError(f"{type(gate).__name__} has no logic_function")
+
+        self.gates: List[LogicGate] = list(gates)
+        self.wires: List[Wire] = list(wires)
+        self.input_names: List[str] = list(inputs)
+        self.output_names: List[str] = list(outputs)
+
+        self._build_nets(inputs, outputs, junctions or [])
+        self._build_schedule()
+
+    @classmethod
+    def from_composite(cls, composite: CompositeGate) -> LogicSimulator:
+        """복합 게이트의 외부 포트(input_*, output_*)를 입출력으로 하는 시뮬레이터 생성"""
+        gates: List[LogicGate] = []
+        wires: List[Wire] = []
+        junctions: List[Dot] = []
+        _collect_components(composite, gates, wires, junctions)
+
+        inputs = {name: port for name, port in composite.port_mappings.items()
+                  if name.startswith('input')}
+        outputs = {name: port for name, port in composite.port_mappings.items()
+                   if name.startswith('output')}
+        return cls(gates, wires, inputs, outputs, junctions)
+
+    @property
+    def num_nets(self) -> int:
+        return len(self.net_drivers)
+
+    @property
+    def num_levels(self) -> int:
+        return len(self.levels)
+
+    def _build_nets(self,
+                    inputs: Dict[str, PortSpec],
+                    outputs: Dict[str, PortSpec],
+                    junctions: List[Dot]) -> None:
+        """연결점을 병합하여 넷 번호 부여"""
+        # 항목: 0..P-1 포트(pin), P..P+W-1 와이어
+        pins: List[Tuple[str, object, int, Dot]] = []  # (종류, 소유자, 인덱스, 포트)
+        for gate in self.gates:
+            pins.extend(('gate_in', gate, i, port) for i, port in enumerate(gate.input_ports))
+            pins.extend(('gate_out', gate, i, port) for i, port in enumerate(gate.output_ports))
+        pins.extend(('junction', None, 0, port) for port in junctions)
+
+        num_pins_before_io = len(pins)
+        io_wires: List[Tuple[int, Wire]] = []
+        for kind, specs in (('input', inputs), ('output', outputs)):
+            for name, spec in specs.items():
+                if isinstance(spec, Wire):
+                    io_wires.append((len(pins), spec))
+                    pins.append((kind, name, 0, None))
+                else:
+                    pins.append((kind, name, 0, spec))
+
+        for _, wire in io_wires:
+            if wire not in self.wires:
+                self.wires.append(wire)
+        wire_ids = {wire: len(pins) + i for i, wire in enumerate(self.wires)}
+
+        uf = _UnionFind(len(pins) + len(self.wires))
+        for pin_id, wire in io_wires:
+            uf.union(pin_id, wire_ids[wire])
+
+        # 1) 같은 좌표의 포트/와이어 끝점 병합
+        point_groups: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for pin_id, (_, _, _, port) in enumerate(pins):
+            if port is not None:
+                point_groups[_point_key(port.get_center())].append(pin_id)
+
+        vertices = {wire: _wire_vertices(wire) for wire in self.wires}
+        endpoint_keys = []
+        for wire, points in vertices.items():
+            for point, attached_gate in ((points[0], wire.start_gate), (points[-1], wire.end_gate)):
+                key = _point_key(point)
+                point_groups[key].append(wire_ids[wire])
+                if attached_gate is None:
+                    endpoint_keys.append((wire, point, key))
+
+        for members in point_groups.values():
+            for member in members[1:]:
+                uf.union(members[0], member)
+
+        # 2) connect_*_wire로 명시한 연결 병합
+        pin_ids = {(kind, owner, index): pin_id
+                   for pin_id, (kind, owner, index, _) in enumerate(pins[:num_pins_before_io])}
+        for wire in self.wires:
+            if wire.start_gate is not None:
+                pin_id = pin_ids.get(('gate_out', wire.start_gate, wire.start_port_index))
+                if pin_id is not None:
+                    uf.union(pin_id, wire_ids[wire])
+            if wire.end_gate is not None:
+                pin_id = pin_ids.get(('gate_in', wire.end_gate, wire.end_port_index))
+                if pin_id is not None:
+                    uf.union(pin_id, wire_ids[wire])
+
+        # 3) 다른 연결점과 만나지 않는 끝점은 다른 와이어의 선분 위 분기점인지 검사
+        self._merge_branch_points(uf, vertices, wire_ids, endpoint_keys, point_groups, len(pins))
+
+        # 넷 번호: 입력 넷이 먼저 오도록 부여
+        roots = [uf.find(item) for item in range(len(pins) + len(self.wires))]
+        net_of_root: Dict[int, int] = {}
+        ordered_items = sorted(range(len(pins)), key=lambda pin_id: pins[pin_id][0] != 'input')
+        for item in ordered_items + list(range(len(pins), len(roots))):
+            net_of_root.setdefault(roots[item], len(net_of_root))
+
+        self.net_drivers: List[Optional[Tuple[str, object, int]]] = [None] * len(net_of_root)
+        self.gate_input_nets: Dict[LogicGate, List[int]] = {
+            gate: [0] * len(gate.input_ports) for gate in self.gates}
+        self.gate_output_nets: Dict[LogicGate, List[int]] = {
+            gate: [0] * len(gate.output_ports) for gate in self.gates}
+        self.input_nets: Dict[str, int] = {}
+        self.output_nets: Dict[str, int] = {}
+        self.port_nets: Dict[Dot, int] = {}
+
+        for pin_id, (kind, owner, index, port) in enumerate(pins):
+            net = net_of_root[roots[pin_id]]
+            if port is not None:
+                self.port_nets[port] = net
+            if kind in ('gate_out', 'input'):
+                if self.net_drivers[net] is not None:
+                    raise ValueError(
+                        f"Net {net} has multiple drivers: {self._describe(self.net_drivers[net])}, "
+                        f"{self._describe((kind, owner, index))}")
+                self.net_drivers[net] = (kind, owner, index)
+            if kind == 'gate_in':
+                self.gate_input_nets[owner][index] = net
+            elif kind == 'gate_out':
+                self.gate_output_nets[owner][index] = net
+            elif kind == 'input':
+                self.input_nets[owner] = net
+            elif kind == 'output':
+                self.output_nets[owner] = net
+
+        for gate, nets in self.gate_input_nets.items():
+            for index, net in enumerate(nets):
+                if self.net_drivers[net] is None:
+                    raise ValueError(
+                        f"Input {index} of {type(gate).__name__} is not driven by any gate or input")
+        for name, net in self.output_nets.items():
+            if self.net_drivers[net] is None:
+                raise ValueError(f"Output '{name}' is not driven by any gate or input")
+
+        self.wire_nets: Dict[Wire, int] = {
+            wire: net_of_root[roots[wire_id]] for wire, wire_id in wire_ids.items()}
+
+    @staticmethod
+    def _merge_branch_points(uf: _UnionFind,
+                             vertices: Dict[Wire, np.ndarray],
+                             wire_ids: Dict[Wire, int],
+                             endpoint_keys: List[Tuple[Wire, np.ndarray, Tuple[int, int]]],
+                             point_groups: Dict[Tuple[int, int], List[int]],
+                             first_wire_id: int) -> None:
+        # 게이트에 연결되지 않았고 포트와도 만나지 않는 끝점만 검사 (와이어 끝점끼리 만나는 T자 분기 포함)
+        dangling = [(wire, point) for wire, point, key in endpoint_keys
+                    if all(member >= first_wire_id for member in point_groups[key])]
+        if not dangling:
+            return
+
+        starts, ends, owners = [], [], []
+        for wire, points in vertices.items():
+            starts.append(points[:-1])
+            ends.append(points[1:])
+            owners.append(np.full(len(points) - 1, wire_ids[wire]))
+        starts, ends, owners = np.vstack(starts), np.vstack(ends), np.concatenate(owners)
+        directions = ends - starts
+        lengths_sq = np.maximum(np.einsum('ij,ij->i', directions, directions), 1e-12)
+
+        # 끝점 하나당 전체 선분에 대해 벡터화된 점-선분 거리 계산
+        for wire, point in dangling:
+            t = np.clip(np.einsum('ij,ij->i', point - starts, directions) / lengths_sq, 0, 1)
+            distances = np.linalg.norm(starts + t[:, None] * directions - point, axis=1)
+            own_id = wire_ids[wire]
+            for owner in np.unique(owners[(distances < CONNECTION_TOLERANCE) & (owners != own_id)]):
+                uf.union(own_id, int(owner))
+
+    @staticmethod
+    def _describe(driver: Tuple[str, object, int]) -> str:
+        kind, owner, index = driver
+        if kind == 'input':
+            return f"input '{owner}'"
+        return f"{type(owner).__name__} output {index}"
+
+    def _build_schedule(self) -> None:
+        """게이트를 레벨화하고 (레벨, 논리 함수)별 인덱스 배열 생성"""
+        driver_gate_of_net = {
+            net: driver[1] for net, driver in enumerate(self.net_drivers)
+            if driver is not None and driver[0] == 'gate_out'}
+
+        fanout: Dict[LogicGate, List[LogicGate]] = defaultdict(list)
+        pending_inputs: Dict[LogicGate, int] = {}
+        for gate in self.gates:
+            drivers = {driver_gate_of_net[net] for net in self.gate_input_nets[gate]
+                       if net in driver_gate_of_net}
+            pending_inputs[gate] = len(drivers)
+            for driver in drivers:
+                fanout[driver].append(gate)
+
+        # Kahn 알고리즘으로 레벨 단위 위상 정렬
+        self.levels: List[List[LogicGate]] = []
+        current = [gate for gate in self.gates if pending_inputs[gate] == 0]
+        visited = 0
+        while current:
+            self.levels.append(current)
+            visited += len(current)
+            next_level = []
+            for gate in current:
+                for successor in fanout[gate]:
+                    pending_inputs[successor] -= 1
+                    if pending_inputs[successor] == 0:
+                        next_level.append(successor)
+            current = next_level
+
+        if visited != len(self.gates):
+            raise ValueError("Combinational loop detected; feedback circuits are not supported")
+
+        # 같은 레벨, 같은 논리 함수의 게이트들은 한 번의 배열 연산으로 평가
+        self._schedule: List[Tuple[Callable[..., np.ndarray], np.ndarray, np.ndarray]] = []
+        for level in self.levels:
+            groups: Dict[tuple, List[LogicGate]] = defaultdict(list)
+            for gate in level:
+                key = (gate.logic_function, len(gate.input_ports), len(gate.output_ports))
+                groups[key].append(gate)
+            for (function, _, _), group in groups.items():
+                input_nets = np.array([self.gate_input_nets[g] for g in group], dtype=np.intp).T
+                output_nets = np.array([self.gate_output_nets[g] for g in group], dtype=np.intp).T
+                self._schedule.append((function, input_nets, output_nets))
+
+    def simulate(self, inputs: Dict[str, np.ndarray]) -> SimulationResult:
+        """입력 벡터들(이름 -> bool 배열)을 한 번에 평가
+
+        모든 입력은 같은 길이로 브로드캐스트되며, 각 위치가 하나의 입력 조합이다.
+        """
+        missing = set(self.input_names) - set(inputs)
+        if missing:
+            raise ValueError(f"Missing input values: {sorted(missing)}")
+
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(inputs[name], dtype=bool))
+                                       for name in self.input_names)) if self.input_names else []
+        num_rows = arrays[0].shape[0] if arrays else 1
+        input_words = pack_bits(np.array(arrays, dtype=bool).reshape(len(arrays), num_rows))
+        return self._run(input_words, num_rows)
+
+    def truth_table(self) -> SimulationResult:
+        """모든 입력 조합에 대한 진리표를 한 번의 패스로 평가
+
+        첫 번째 입력이 최상위 비트이다 (행 r의 입력 i = r의 (N-1-i)번째 비트).
+        """
+        num_inputs = len(self.input_names)
+        rows = np.arange(1 << num_inputs, dtype=np.int64)
+        shifts = np.arange(num_inputs - 1, -1, -1, dtype=np.int64)[:, None]
+        bits = (rows[None, :] >> shifts) & 1
+        return self._run(pack_bits(bits.reshape(num_inputs, len(rows))), len(rows))
+
+    def _run(self, input_words: np.ndarray, num_rows: int) -> SimulationResult:
+        num_words = input_words.shape[1] if input_words.size else max(1, -(-num_rows // WORD_BITS))
+        values = np.zeros((self.num_nets, num_words), dtype=np.uint64)
+        for i, name in enumerate(self.input_names):
+            values[self.input_nets[name]] = input_words[i]
+
+        for function, input_nets, output_nets in self._schedule:
+            outputs = function(*values[input_nets])
+            if not isinstance(outputs, tuple):
+                outputs = (outputs,)
+            for nets, output in zip(output_nets, outputs):
+                values[nets] = output
+
+        return SimulationResult(self, values, num_rows)
+
+
+class SimulationResult:
+    """시뮬레이션 결과 (넷별 비트 압축 값)"""
+
+    def __init__(self, simulator: LogicSimulator, values: np.ndarray, num_rows: int):
+        self.simulator = simulator
+        self.values = values
+        self.num_rows = num_rows
+        self._bytes = values.view(np.uint8)
+
+    def net_bits(self, net: int) -> np.ndarray:
+        """넷의 행별 값 (bool 배열)"""
+        return unpack_bits(self.values[net], self.num_rows)
+
+    def input(self, name: str) -> np.ndarray:
+        return self.net_bits(self.simulator.input_nets[name])
+
+    def output(self, name: str) -> np.ndarray:
+        return self.net_bits(self.simulator.output_nets[name])
+
+    def net_value(self, net: int, row: int = 0) -> bool:
+        """넷의 특정 행 값"""
+        return bool((self._bytes[net, row >> 3] >> (row & 7)) & 1)
+
+    def wire_value(self, wire: Wire, row: int = 0) -> bool:
+        return self.net_value(self.simulator.wire_nets[wire], row)
+
+    def port_value(self, port: Dot, row: int = 0) -> bool:
+        return self.net_value(self.simulator.port_nets[port], row)
+
+    def wire_values(self, row: int = 0) -> Dict[Wire, bool]:
+        """행 하나에 대한 모든 와이어의 값 (와이어 색칠용)"""
+        return {wire: self.net_value(net, row) for wire, net in self.simulator.wire_nets.items()}
+
+    def as_table(self) -> np.ndarray:
+        """(행 수, 입력 수 + 출력 수) 0/1 배열"""
+        columns = [self.input(name) for name in self.simulator.input_names]
+        columns += [self.output(name) for name in self.simulator.output_names]
+        return np.array(columns, dtype=np.uint8).T.reshape(self.num_rows, len(columns))
@@ -24,6 +24,9 @@ class LogicGateStyle:
     WIRE_COLOR = YELLOW
     WIRE_STROKE_WIDTH = 2
     WIRE_OPACITY = 0.8
+    WIRE_HIGH_COLOR = YELLOW     # 신호 1인 와이어 색상
+    WIRE_LOW_COLOR = GREY_D      # 신호 0인 와이어 색상
+    WIRE_SYNC_TOLERANCE = 1e-9   # 포트 이동 판정 허용 오차 (이보다 작으면 와이어 갱신 생략)
 
     # 도형 위치 조정 관련 상수
     CIRCLE_OFFSET_RATIO = 0.025  # 원의 오프셋 비율 (size * CIRCLE_OFFSET_RATIO)
@@ -56,6 +59,12 @@ class LogicGateStyle:
     XOR_GATE_EXTRA_CURVE_OFFSET = 0.08  # 추가 곡선의 오프셋 비율 (0.15 -> 0.08로 축소)
     XOR_GATE_EXTRA_CURVE_WIDTH = 3.0   # 추가 곡선의 선 두께
 
+    # 와이어 자동 배선 관련 상수
+    ROUTER_CELL_SIZE = 0.125        # 배선 격자 한 칸 크기 (빵판 좌표)
+    ROUTER_GATE_PADDING = 1         # 게이트 바운딩 박스 주변 여백 (셀 수)
+    ROUTER_BEND_PENALTY = 4.0       # 꺾일 때마다 더하는 비용 (셀 길이 단위)
+    ROUTER_CROSSING_PENALTY = 6.0   # 다른 넷의 와이어와 교차할 때 더하는 비용
+
     # 조합 게이트 관련 상수
     COMPOSITE_GATE_SPACING = 1.2  # 조합 게이트 내부의 게이트 간 수직 간격 비율
 
@@ -26,6 +26,9 @@ class Wire(VGroup, WireBase):
         self.end_gate: Optional[LogicGateBase] = None
         self.start_port_index: int = 0
         self.end_port_index: int = 0
+        # 마지막 동기화 시점의 (와이어 끝점 - 포트 기준점) 오프셋 (dirty 판정용)
+        self._start_port_offset: Optional[np.ndarray] = None
+        self._end_port_offset: Optional[np.ndarray] = None
         self.add(self.wire_line)
 
     def _create_wire(self) -> VMobject:
@@ -55,6 +58,15 @@ class Wire(VGroup, WireBase):
         self.wire_line.set_stroke(width=self.wire_stroke_width)
         return self
 
+    def get_signal_color(self, value: bool) -> ManimColor:
+        """신호 값에 해당하는 와이어 색상 반환"""
+        return LogicGateStyle.WIRE_HIGH_COLOR if value else LogicGateStyle.WIRE_LOW_COLOR
+
+    def set_signal(self, value: bool) -> Wire:
+        """신호 값(0/1)에 맞춰 와이어 색상 변경"""
+        self.wire_line.set_stroke(color=self.get_signal_color(value))
+        return self
+
     def get_start_point(self) -> np.ndarray:
         """와이어의 시작점 위치 반환"""
         return self.wire_line.points[0]  # get_start() 대신 직접 points 배열 접근
@@ -76,19 +88,43 @@ class Wire(VGroup, WireBase):
         self.update_end_position()
 
     def update_start_position(self) -> None:
-        """시작점 위치 업데이트"""
+        """시작점 위치 업데이트 (출력 포트가 움직인 경우에만)"""
         if self.start_gate:
-            new_start = self.start_gate.get_output_point(self.start_port_index)
-            old_points = self.wire_line.points
-            if len(old_points) > 1:
-                self.wire_line.points[0] = new_start  # 첫 점만 업데이트
-                self.wire_line.refresh_triangulation()  # 꼭 호출해야 함
+            port = self.start_gate.output_ports[self.start_port_index]
+            self._start_port_offset = self._sync_endpoint(0, port, self._start_port_offset)
 
     def update_end_position(self) -> None:
-        """끝점 위치 업데이트"""
+        """끝점 위치 업데이트 (입력 포트가 움직인 경우에만)"""
         if self.end_gate:
-            new_end = self.end_gate.get_input_point(self.end_port_index)
-            old_points = self.wire_line.points
-            if len(old_points) > 1:
-                self.wire_line.points[-1] = new_end  # 마지막 점만 업데이트
-                self.wire_line.refresh_triangulation()  # 꼭 호출해야 함
+            port = self.end_gate.input_ports[self.end_port_index]
+            self._end_port_offset = self._sync_endpoint(-1, port, self._end_port_offset)
+
+    def _sync_endpoint(self, end: int, port: Dot,
+                       offset: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """끝점(0: 시작, -1: 끝)을 포트 중심으로 옮기고 새 오프셋 반환
+
+        포트 기준점(첫 점)과 와이어 끝점의 상대 위치가 지난 동기화 때와 같으면
+        (둘 다 움직이지 않았거나 복합 게이트와 함께 평행이동한 경우) 아무것도 하지 않는다.
+        """
+        points = self.wire_line.points
+        if len(points) < 2:
+            return offset
+
+        port_anchor = port.points[0]
+        if offset is not None and \
+                np.abs(points[end] - port_anchor - offset).max() < LogicGateStyle.WIRE_SYNC_TOLERANCE:
+            return offset
+
+        self._set_endpoint(end, port.get_center())
+        return points[end] - port_anchor
+
+    def _set_endpoint(self, end: int, point: np.ndarray) -> None:
+        """첫/마지막 선분의 점 배열만 제자리에서 다시 계산 (핸들 포함)"""
+        points = self.wire_line.points
+        n = getattr(self.wire_line, 'n_points_per_cubic_curve', 4)
+        segment = slice(0, n) if end == 0 else slice(len(points) - n, len(points))
+        start, stop = (point, points[n - 1]) if end == 0 else (points[-n], point)
+        # 꺾은선의 각 선분은 직선이므로 핸들을 양 끝점 사이에 균등 배치
+        points[segment] = start + np.linspace(0, 1, n)[:, None] * (stop - start)
+        if hasattr(self.wire_line, 'refresh_triangulation'):  # OpenGL 렌더러
+            self.wire_line.refresh_triangulation()
@@ -0,0 +1,360 @@
+from __future__ import annotations
+import heapq
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from manim import *
+from common.logic_gate.logic_gate import LogicGate
+from common.logic_gate.styles import LogicGateStyle
+
+# 진행 방향: 오른쪽, 왼쪽, 위, 아래
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIR_RIGHT, DIR_LEFT, DIR_UP, DIR_DOWN = range(4)
+# 점유 셀의 와이어 방향 비트
+AXIS_HORIZONTAL = 1
+AXIS_VERTICAL = 2
+
+Cell = Tuple[int, int]
+# 연결: (출력 포트, [입력 포트들]) - 포트는 게이트 포트 또는 복합 게이트의 외부 포트(Dot)
+Connection = Tuple[Dot, Sequence[Dot]]
+
+
+def _axis_of(direction: int) -> int:
+    return AXIS_HORIZONTAL if direction < 2 else AXIS_VERTICAL
+
+
+class RoutingGrid:
+    """빵판 좌표계 위의 배선 격자와 점유 셀 인덱스
+
+    - blocked: 게이트 바운딩 박스(여백 포함)로 막힌 셀
+    - owner: 셀을 지나가는 와이어의 넷 번호 (-1이면 비어 있음)
+    - axes: 셀을 지나가는 와이어 방향 비트 (가로/세로)
+    """
+
+    def __init__(self,
+                 x_range: Sequence[float],
+                 y_range: Sequence[float],
+                 cell_size: float = LogicGateStyle.ROUTER_CELL_SIZE):
+        self.cell_size = cell_size
+        # 셀 중심이 cell_size의 정수배에 오도록 원점 정렬
+        self.origin = np.array([np.floor(x_range[0] / cell_size),
+                                np.floor(y_range[0] / cell_size)]) * cell_size
+        self.shape = (int(np.ceil((x_range[1] - self.origin[0]) / cell_size)) + 1,
+                      int(np.ceil((y_range[1] - self.origin[1]) / cell_size)) + 1)
+        self.blocked = np.zeros(self.shape, dtype=bool)
+        self.owner = np.full(self.shape, -1, dtype=np.int32)
+        self.axes = np.zeros(self.shape, dtype=np.uint8)
+        self._net_cells: Dict[int, List[Cell]] = {}
+
+    def to_cell(self, point: Sequence[float]) -> Cell:
+        """좌표를 가장 가까운 셀로 변환 (격자 밖이면 가장자리 셀)"""
+        i = int(round((point[0] - self.origin[0]) / self.cell_size))
+        j = int(round((point[1] - self.origin[1]) / self.cell_size))
+        return (min(max(i, 0), self.shape[0] - 1), min(max(j, 0), self.shape[1] - 1))
+
+    def to_point(self, cell: Cell) -> np.ndarray:
+        return self.origin + np.array(cell, dtype=float) * self.cell_size
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        return 0 <= i < self.shape[0] and 0 <= j < self.shape[1]
+
+    def block_box(self, min_point: Sequence[float], max_point: Sequence[float],
+                  padding: int = 0) -> Tuple[Cell, Cell]:
+        """사각형 영역을 장애물로 표시하고 (여백 포함) 셀 범위 반환"""
+        i0, j0 = self.to_cell(min_point)
+        i1, j1 = self.to_cell(max_point)
+        i0, j0 = max(i0 - padding, 0), max(j0 - padding, 0)
+        i1, j1 = min(i1 + padding, self.shape[0] - 1), min(j1 + padding, self.shape[1] - 1)
+        self.blocked[i0:i1 + 1, j0:j1 + 1] = True
+        return (i0, j0), (i1, j1)
+
+    def occupy(self, net_id: int, path: List[Cell]) -> None:
+        """경로 셀들을 넷이 점유한 것으로 기록"""
+        cells = self._net_cells.setdefault(net_id, [])
+        for index, (i, j) in enumerate(path):
+            axes = 0
+            for neighbor in (path[index - 1] if index > 0 else None,
+                             path[index + 1] if index + 1 < len(path) else None):
+                if neighbor is not None:
+                    axes |= AXIS_HORIZONTAL if neighbor[1] == j else AXIS_VERTICAL
+            self.owner[i, j] = net_id
+            self.axes[i, j] |= axes
+            cells.append((i, j))
+
+    def release(self, net_id: int) -> None:
+        """넷이 점유한 셀 해제 (재배선용)"""
+        for i, j in self._net_cells.pop(net_id, []):
+            if self.owner[i, j] == net_id:
+                self.owner[i, j] = -1
+                self.axes[i, j] = 0
+
+    def net_cells(self, net_id: int) -> List[Cell]:
+        return self._net_cells.get(net_id, [])
+
+
+class WireRouter:
+    """게이트를 피해 가는 직교 와이어 자동 배선기
+
+    격자 위에서 (셀, 진행 방향) 상태의 A* 탐색으로 길이 + 꺾임 벌점이 최소인 경로를 찾는다.
+    다른 넷의 와이어는 직각으로 교차만 할 수 있고(교차 벌점), 겹치거나 교차점에서 꺾을 수 없다.
+    여러 입력을 가진 넷은 이미 배선한 트리의 모든 셀에서 출발하여 분기 와이어를 만든다.
+    """
+
+    def __init__(self,
+                 board: NumberPlane,
+                 cell_size: float = LogicGateStyle.ROUTER_CELL_SIZE,
+                 gate_padding: int = LogicGateStyle.ROUTER_GATE_PADDING,
+                 bend_penalty: float = LogicGateStyle.ROUTER_BEND_PENALTY,
+                 crossing_penalty: float = LogicGateStyle.ROUTER_CROSSING_PENALTY):
+        self.board = board
+        self.cell_size = cell_size
+        self.gate_padding = gate_padding
+        self.bend_penalty = bend_penalty
+        self.crossing_penalty = crossing_penalty
+        self.grid = RoutingGrid(board.x_range[:2], board.y_range[:2], cell_size)
+        self.gates: List[LogicGate] = []
+        # 게이트 포트 -> (포트에서 빠져나가는 방향, 게이트 밖으로 이어지는 통로 셀)
+        self._port_exits: Dict[Dot, Tuple[int, List[Cell]]] = {}
+        # 넷 번호 -> 배선된 꺾은선들 (빵판 좌표)
+        self.net_polylines: Dict[int, List[np.ndarray]] = {}
+        self._next_net_id = 0
+
+    def _board_point(self, point: np.ndarray) -> np.ndarray:
+        return np.array(self.board.p2c(point)[:2], dtype=float)
+
+    def add_gates(self, gates: Sequence[LogicGate]) -> None:
+        """게이트들을 장애물로 등록하고 포트마다 바깥으로 나가는 통로 확보"""
+        for gate in gates:
+            self.gates.append(gate)
+            box_min, box_max = self.grid.block_box(
+                self._board_point(gate.get_corner(DL)),
+                self._board_point(gate.get_corner(UR)),
+                self.gate_padding)
+            for port in gate.input_ports:
+                self._port_exits[port] = (DIR_LEFT, self._corridor(port, DIR_LEFT, box_min, box_max))
+            for port in gate.output_ports:
+                self._port_exits[port] = (DIR_RIGHT, self._corridor(port, DIR_RIGHT, box_min, box_max))
+
+    def _corridor(self, port: Dot, direction: int, box_min: Cell, box_max: Cell) -> List[Cell]:
+        """포트 셀에서 게이트 박스 밖까지 이어지는 전용 통로 셀 목록"""
+        i, j = self.grid.to_cell(self._board_point(port.get_center()))
+        di, dj = DIRECTIONS[direction]
+        cells = [(i, j)]
+        # 박스를 벗어난 뒤 한 칸 더 (포트 앞에서 다른 넷이 지나가 진입로를 막지 않도록)
+        outside = 0
+        while outside < 2 and self.grid.in_bounds(i + di, j + dj):
+            i, j = i + di, j + dj
+            cells.append((i, j))
+            if not (box_min[0] <= i <= box_max[0] and box_min[1] <= j <= box_max[1]):
+                outside += 1
+        # 통로는 해당 포트의 넷만 지나갈 수 있도록 막아 둔다 (route에서 allowed로 허용)
+        for cell in cells:
+            self.grid.blocked[cell] = True
+        return cells
+
+    def reset_wires(self) -> None:
+        """배선 결과만 지우기 (게이트 배치는 그대로 두고 연결만 바꿔 재배선할 때)"""
+        for net_id in list(self.net_polylines):
+            self.grid.release(net_id)
+        self.net_polylines.clear()
+
+    def reset_layout(self, gates: Sequence[LogicGate]) -> None:
+        """격자를 새로 만들고 현재 위치의 게이트들로 장애물과 포트 통로를 다시 등록
+
+        게이트를 옮긴 뒤 재배선할 때 사용한다 (이전 위치의 장애물/통로가 남지 않도록).
+        """
+        self.grid = RoutingGrid(self.board.x_range[:2], self.board.y_range[:2], self.cell_size)
+        self.gates = []
+        self._port_exits.clear()
+        self.net_polylines.clear()
+        self.add_gates(gates)
+
+    def route_all(self, connections: Sequence[Connection]) -> List[List[np.ndarray]]:
+        """여러 넷을 배선하고 입력 순서대로 넷별 꺾은선 목록 반환
+
+        짧은 넷을 먼저 배선하여 긴 넷이 우회하도록 한다.
+        """
+        spans = []
+        for source, sinks in connections:
+            points = np.array([self._board_point(p.get_center()) for p in (source, *sinks)])
+            spans.append(np.ptp(points, axis=0).sum())
+
+        results: List[Optional[List[np.ndarray]]] = [None] * len(connections)
+        for index in np.argsort(spans, kind='stable'):
+            source, sinks = connections[index]
+            results[index] = self.route(source, sinks)
+        return results
+
+    def route(self, source: Dot, sinks: Sequence[Dot]) -> List[np.ndarray]:
+        """출력 포트 하나에서 입력 포트들로 가는 넷을 배선하고 꺾은선들(빵판 좌표) 반환
+
+        첫 꺾은선은 source에서 시작하고, 이후 꺾은선은 앞선 꺾은선 위의 분기점에서 시작한다.
+        """
+        net_id = self._next_net_id
+        self._next_net_id += 1
+        allowed: Set[Cell] = set()
+        for port in (source, *sinks):
+            if port in self._port_exits:
+                allowed.update(self._port_exits[port][1])
+
+        source_point = self._board_point(source.get_center())
+        source_cell = self.grid.to_cell(source_point)
+        allowed.add(source_cell)
+        source_exit = self._port_exits.get(source, (None, []))[0]
+
+        polylines: List[np.ndarray] = []
+        tree_cells: List[Cell] = []
+        # 가까운 입력부터 연결해야 분기 트리가 짧아진다
+        ordered_sinks = sorted(
+            sinks, key=lambda p: np.abs(self._board_point(p.get_center()) - source_point).sum())
+
+        for sink in ordered_sinks:
+            sink_point = self._board_point(sink.get_center())
+            sink_cell = self.grid.to_cell(sink_point)
+            allowed.add(sink_cell)
+            # 입력 포트에는 빠져나가는 방향의 반대 방향으로 들어와야 한다
+            sink_exit = self._port_exits.get(sink, (None, []))[0]
+            goal_direction = None if sink_exit is None else sink_exit ^ 1
+
+            if not tree_cells:
+                starts = [(source_cell, source_exit)]
+            else:
+                starts = [(cell, None) for cell in tree_cells]
+
+            path = self._search(net_id, starts, sink_cell, goal_direction, allowed, strict=True) \
+                or self._search(net_id, starts, sink_cell, goal_direction, allowed, strict=False)
+            if path is None:
+                raise ValueError(f"No route found to sink at {tuple(sink_point)}")
+
+            if not tree_cells:
+                start_point = source_point
+            else:
+                start_point = self._project_on_polylines(self.grid.to_point(path[0]), polylines)
+            polylines.append(self._to_polyline(path, start_point, sink_point))
+            self.grid.occupy(net_id, path)
+            tree_cells.extend(path)
+
+        self.net_polylines[net_id] = polylines
+        return polylines
+
+    def _search(self,
+                net_id: int,
+                starts: List[Tuple[Cell, Optional[int]]],
+                goal: Cell,
+                goal_direction: Optional[int],
+                allowed: Set[Cell],
+                strict: bool) -> Optional[List[Cell]]:
+        """(셀, 방향) 상태 A* 탐색
+
+        strict=False이면 다른 넷의 와이어와 겹치는 것도 벌점을 주고 허용한다 (배선 실패 시 재시도용).
+        """
+        grid = self.grid
+        blocked, owner, axes = grid.blocked, grid.owner, grid.axes
+        width, height = grid.shape
+        goal_i, goal_j = goal
+        bend_penalty, crossing_penalty = self.bend_penalty, self.crossing_penalty
+
+        def heuristic(i: int, j: int) -> int:
+            return abs(i - goal_i) + abs(j - goal_j)
+
+        best: Dict[Tuple[int, int, int], float] = {}
+        parents: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {}
+        heap: List[Tuple[float, float, Tuple[int, int, int]]] = []
+        for (i, j), direction in starts:
+            for d in (range(4) if direction is None else (direction,)):
+                state = (i, j, d)
+                best[state] = 0.0
+                parents[state] = None
+                heapq.heappush(heap, (heuristic(i, j), 0.0, state))
+
+        while heap:
+            _, cost, state = heapq.heappop(heap)
+            if cost > best.get(state, np.inf):
+                continue
+            i, j, d = state
+            if (i, j) == goal and (goal_direction is None or d == goal_direction):
+                return self._reconstruct(parents, state)
+
+            foreign = owner[i, j] not in (-1, net_id) and parents[state] is not None
+            for nd, (di, dj) in enumerate(DIRECTIONS):
+                if nd == d ^ 1:  # 되돌아가기 금지
+                    continue
+                if foreign and nd != d:  # 다른 넷의 와이어 위에서는 꺾지 않음
+                    continue
+                ni, nj = i + di, j + dj
+                if not (0 <= ni < width and 0 <= nj < height):
+                    continue
+                if blocked[ni, nj] and (ni, nj) not in allowed:
+                    continue
+
+                step = 1.0 if nd == d else 1.0 + bend_penalty
+                other = owner[ni, nj]
+                if other != -1 and other != net_id:
+                    if axes[ni, nj] & _axis_of(nd):  # 같은 방향으로 겹침
+                        if strict:
+                            continue
+                        step += crossing_penalty * 4
+                    step += crossing_penalty
+                    if (ni, nj) == goal:  # 다른 넷과 만나는 지점에서 끝나면 단락
+                        continue
+
+                new_state = (ni, nj, nd)
+                new_cost = cost + step
+                if new_cost < best.get(new_state, np.inf):
+                    best[new_state] = new_cost
+                    parents[new_state] = state
+                    heapq.heappush(heap, (new_cost + heuristic(ni, nj), new_cost, new_state))
+        return None
+
+    @staticmethod
+    def _reconstruct(parents: Dict, state: Tuple[int, int, int]) -> List[Cell]:
+        path = []
+        while state is not None:
+            path.append(state[:2])
+            state = parents[state]
+        path.reverse()
+        return path
+
+    def _to_polyline(self, path: List[Cell], start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """셀 경로를 꺾이는 점만 남긴 직교 꺾은선으로 변환 (양 끝은 정확한 포트 좌표)"""
+        corners = [self.grid.to_point(path[k]) for k in range(1, len(path) - 1)
+                   if (path[k][0] - path[k - 1][0], path[k][1] - path[k - 1][1]) !=
+                   (path[k + 1][0] - path[k][0], path[k + 1][1] - path[k][1])]
+
+        if not corners:
+            if abs(start[1] - end[1]) < 1e-9 or abs(start[0] - end[0]) < 1e-9:
+                return np.array([start, end])
+            # 한 줄 경로지만 포트 높이가 셀 안에서 어긋난 경우 가운데에서 한 번 꺾음
+            if len(path) > 1 and path[0][1] == path[-1][1]:
+                mid_x = (start[0] + end[0]) / 2
+                return np.array([start, [mid_x, start[1]], [mid_x, end[1]], end])
+            mid_y = (start[1] + end[1]) / 2
+            return np.array([start, [start[0], mid_y], [end[0], mid_y], end])
+
+        # 첫 구간과 마지막 구간이 포트 좌표와 정확히 직교하도록 모서리 보정
+        first_horizontal = path[1][1] == path[0][1]
+        last_horizontal = path[-1][1] == path[-2][1]
+        if first_horizontal:
+            corners[0][1] = start[1]
+        else:
+            corners[0][0] = start[0]
+        if last_horizontal:
+            corners[-1][1] = end[1]
+        else:
+            corners[-1][0] = end[0]
+        return np.array([start, *corners, end])
+
+    @staticmethod
+    def _project_on_polylines(point: np.ndarray, polylines: List[np.ndarray]) -> np.ndarray:
+        """이미 배선된 꺾은선 위에서 point에 가장 가까운 점 (분기 시작점)"""
+        best_point, best_distance = point, np.inf
+        for polyline in polylines:
+            starts, ends = polyline[:-1], polyline[1:]
+            directions = ends - starts
+            lengths_sq = np.maximum(np.einsum('ij,ij->i', directions, directions), 1e-12)
+            t = np.clip(np.einsum('ij,ij->i', point - starts, directions) / lengths_sq, 0, 1)
+            candidates = starts + t[:, None] * directions
+            distances = np.linalg.norm(candidates - point, axis=1)
+            index = int(np.argmin(distances))
+            if distances[index] < best_distance:
+                best_point, best_distance = candidates[index], distances[index]
+        return best_point
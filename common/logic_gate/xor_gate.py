@@ -10,6 +10,11 @@ class XorGate(OrGate):
         super().__init__(**kwargs)
         self._setup_extra_curve()
 
+    @staticmethod
+    def logic_function(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """비트 단위 XOR"""
+        return a ^ b
+
     def _setup_extra_curve(self) -> None:
         """추가 곡선 설정 및 입력 포트 재배치"""
         extra_curve = self._create_extra_curve()
@@ -1,4 +1,5 @@
 import re  # 정규표현식 지원 추가
+import copy
 from manim import *
 
 from .number_plane_group_impl.number_plane_group_base import (
@@ -69,13 +70,13 @@ class NumberPlaneGroup(BasicShapeMixin,
             marker.set_opacity(1 if show else 0)
 
     def find_mobject(self, name, obj_type=None):
-        """이름과 타입으로 객체 찾기"""
-        for mob in self.submobjects:
-            self._ensure_metadata(mob)
-            if (mob.metadata.get("name") == name and
-                    (obj_type is None or mob.metadata.get("type") == obj_type)):
-                return mob
-        return None
+        """이름과 타입으로 객체 찾기 (같은 조건이면 submobjects 순서상 첫 객체)"""
+        self._ensure_mobject_index()
+        if obj_type is not None:
+            bucket = self._mobject_index.get((obj_type, name))
+        else:
+            bucket = self._name_index.get(name)
+        return next(iter(bucket)) if bucket else None
 
     def iter_mobjects(self, name_pattern=None, obj_type=None):
         """이름 패턴과 타입으로 객체들을 필터링하여 이터레이션
@@ -87,22 +88,33 @@ class NumberPlaneGroup(BasicShapeMixin,
         Yields:
             Mobject: 조건에 맞는 객체들
         """
-        pattern = re.compile(name_pattern) if name_pattern else None
-
-        for mob in self.submobjects:
-            self._ensure_metadata(mob)
-
-            # 타입 체크
-            if obj_type and mob.metadata.get("type") != obj_type:
+        # 타입이 지정되면 해당 타입의 객체만 순회 (순회 중 추가/제거에 대비해 복사)
+        if obj_type:
+            self._ensure_mobject_index()
+            candidates = list(self._type_index.get(obj_type, ()))
+        else:
+            candidates = list(self.submobjects)
+
+        if not name_pattern:
+            yield from candidates
+            return
+
+        # 이름별 매칭 결과를 패턴 단위로 캐시
+        pattern, matches = self._name_match_cache.get(name_pattern, (None, None))
+        if pattern is None:
+            pattern, matches = re.compile(name_pattern), {}
+            self._name_match_cache[name_pattern] = (pattern, matches)
+
+        for mob in candidates:
+            name = self._ensure_metadata(mob).metadata.get("name")
+            if not name:
                 continue
 
-            # 이름 패턴 체크
-            if pattern:
-                name = mob.metadata.get("name")
-                if not name or not pattern.match(name):
-                    continue
-
-            yield mob
+            matched = matches.get(name)
+            if matched is None:
+                matched = matches[name] = bool(pattern.match(name))
+            if matched:
+                yield mob
 
     def get_all_points(self):
         """모든 점 객체 이터레이터"""
@@ -130,10 +142,20 @@ class NumberPlaneGroup(BasicShapeMixin,
                                     y_range=None,
                                     x_length=None,
                                     y_length=None,
+                                    use_affine=True,
+                                    scale_stroke_width=False,
                                     **kwargs):
-        """좌표계 변환 복사 메서드 개선"""
-        new_group = super().copy()
+        """좌표계 변환 복사 메서드 개선
+
+        Args:
+            use_affine: True면 이전 평면 -> 새 평면 아핀 변환을 points 배열에 직접 적용
+                (False면 각 객체를 add_*/plot_* 로 다시 생성)
+            scale_stroke_width: 아핀 변환 복사 시 선 두께도 단위 길이 비율로 조절
+        """
+        # 기존 자식 객체들은 곧 버려지므로 깊은 복사하지 않고 공유한 뒤 비운다
+        new_group = copy.deepcopy(self, {id(mob): mob for mob in self.submobjects})
         new_group.submobjects.clear()  # 기존 submobjects 제거
+        new_group._clear_mobject_index()
 
         # background_line_style이 명시적으로 지정되지 않은 경우 원본의 스타일을 사용
         if 'background_line_style' not in kwargs:
@@ -157,6 +179,9 @@ class NumberPlaneGroup(BasicShapeMixin,
         self._copy_origin_marker(new_group)
 
         # 다른 객체들 복사
-        self._copy_mobjects_with_transform(new_group)
+        if use_affine:
+            self._copy_mobjects_with_affine(new_group, scale_stroke_width)
+        else:
+            self._copy_mobjects_with_transform(new_group)
 
         return new_group
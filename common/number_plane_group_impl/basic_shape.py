@@ -32,7 +32,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                   font_size=36):
         """점 추가 메서드"""
         if name is None:
-            name = f"point_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.POINT])}"
+            name = f"point_{self._count_mobjects(MobjectType.POINT)}"
 
         point_group = VGroup()
         point_group.metadata = {"type": MobjectType.POINT, "name": name}
@@ -85,7 +85,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                 dash_length=None):  # None이면 실선, 값이 있으면 점선
         """호 추가 메서드"""
         if name is None:
-            name = f"arc_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.ARC])}"
+            name = f"arc_{self._count_mobjects(MobjectType.ARC)}"
 
         # 중심점 좌표 변환
         arc_center = self.plane.c2p(*center_point)
@@ -134,7 +134,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
     ):
         """선 추가 메서드"""
         if name is None:
-            name = f"line_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.LINE])}"
+            name = f"line_{self._count_mobjects(MobjectType.LINE)}"
 
         # 시작점과 끝점의 좌표를 변환
         start = self.plane.c2p(*start_point)
@@ -187,7 +187,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                     stroke_width=2):
         """다각형 추가 메서드"""
         if name is None:
-            name = f"polygon_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.POLYGON])}"
+            name = f"polygon_{self._count_mobjects(MobjectType.POLYGON)}"
 
         # 좌표들을 화면 좌표계로 변환
         vertices = [self.plane.c2p(*point) for point in points]
@@ -215,7 +215,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                      stroke_width=2):
         """삼각형 추가 메서드"""
         if name is None:
-            name = f"triangle_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.POLYGON])}"
+            name = f"triangle_{self._count_mobjects(MobjectType.POLYGON)}"
 
         # 좌표들을 화면 좌표계로 변환
         vertices = [self.plane.c2p(*p) for p in [p1, p2, p3]]
@@ -247,7 +247,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                             start_angle=0):  # 시작 각도
         """정다각형 추가 메서드"""
         if name is None:
-            name = f"regular_polygon_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.POLYGON])}"
+            name = f"regular_polygon_{self._count_mobjects(MobjectType.POLYGON)}"
 
         # 중심점 좌표 변환
         center = self.plane.c2p(*center_point)
@@ -284,7 +284,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                              start_angle=0):
         """정삼각형 추가 메서드"""
         if name is None:
-            name = f"regular_triangle_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.POLYGON])}"
+            name = f"regular_triangle_{self._count_mobjects(MobjectType.POLYGON)}"
 
         # 중심점과 반지름 변환
         center = self.plane.c2p(*center_point)
@@ -319,7 +319,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
                    stroke_opacity=1.0):  # stroke_opacity 파라미터 추가
         """원 추가 메서드"""
         if name is None:
-            name = f"circle_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.CIRCLE])}"
+            name = f"circle_{self._count_mobjects(MobjectType.CIRCLE)}"
 
         # 중심점 좌표 변환
         center = self.plane.c2p(*center_point)
@@ -460,7 +460,7 @@ class BasicShapeMixin(NumberPlaneGroupBase):
     def add_vector(self, vec, name=None, color=RED, start_point=None, **kwargs):
         """벡터 추가 메서드 개선"""
         if name is None:
-            name = f"vector_{len(list(self.iter_mobjects(obj_type=MobjectType.VECTOR)))}"
+            name = f"vector_{self._count_mobjects(MobjectType.VECTOR)}"
 
         # 시작점 처리
         if start_point is None:
@@ -8,6 +8,143 @@ from .number_plane_group_base import (
 )
 
 
+# 적응형 샘플링 기본값
+ADAPTIVE_COARSE_RATIO = 4       # 초기 샘플 수 = 균일 샘플 수 / 비율
+ADAPTIVE_MIN_SAMPLES = 16       # 구간별 초기 샘플 수의 최소값
+ADAPTIVE_MAX_DEPTH = 6          # 최대 세분화 단계
+ADAPTIVE_ANGLE_TOLERANCE = 0.1  # 세분화 기준 꺾임각 (라디안, 화면 좌표계)
+
+
+def evaluate_function(func, x_values):
+    """x값 배열 전체에 대해 함수를 한 번에 계산
+
+    함수가 NumPy 배열을 받을 수 있으면 한 번의 호출로 계산하고,
+    그렇지 않으면(math 모듈 함수, 조건문 등) 샘플별 호출로 대체한다.
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    try:
+        with np.errstate(all="ignore"):
+            y_values = np.asarray(func(x_values), dtype=float)
+        if y_values.shape == x_values.shape:
+            return y_values
+    except (TypeError, ValueError):
+        pass
+    return np.array([func(x) for x in x_values], dtype=float)
+
+
+def _split_by_sizes(values, sizes):
+    """이어 붙인 배열을 구간별 크기대로 다시 나눔"""
+    return np.split(values, np.cumsum(sizes)[:-1])
+
+
+def _refinement_points(x_values, y_values, unit_size, y_limit,
+                       angle_tolerance, min_edge_length):
+    """더 조밀한 샘플이 필요한 간선들의 중점 계산
+
+    화면 좌표계에서 꺾임각이 큰 꼭짓점에 붙은 간선과,
+    y값 제한(불연속점 근처)을 넘나드는 간선을 세분화 대상으로 한다.
+    """
+    if len(x_values) < 3:
+        return np.empty(0)
+
+    inside = np.isfinite(y_values) & (np.abs(y_values) <= y_limit)
+    clipped = np.clip(
+        np.nan_to_num(y_values, nan=0.0, posinf=y_limit, neginf=-y_limit),
+        -y_limit, y_limit
+    )
+
+    dx = np.diff(x_values) * unit_size[0]
+    dy = np.diff(clipped) * unit_size[1]
+
+    # 연속한 두 간선 사이의 꺾임각
+    heading = np.arctan2(dy, dx)
+    turn = np.abs((np.diff(heading) + PI) % TAU - PI)
+    sharp = turn > angle_tolerance
+
+    refine = inside[:-1] != inside[1:]
+    refine[:-1] |= sharp
+    refine[1:] |= sharp
+    refine &= dx > min_edge_length
+
+    return ((x_values[:-1] + x_values[1:]) / 2)[refine]
+
+
+def sample_function_segments(func,
+                             ranges,
+                             num_samples,
+                             total_range,
+                             y_limit,
+                             unit_size=(1.0, 1.0),
+                             adaptive=True,
+                             max_depth=ADAPTIVE_MAX_DEPTH,
+                             angle_tolerance=ADAPTIVE_ANGLE_TOLERANCE,
+                             min_samples=50):
+    """여러 연속구간을 한 번에 샘플링
+
+    모든 구간의 x값을 이어 붙여 함수를 한 번에 계산하고,
+    adaptive가 True이면 곡률이 큰 곳과 불연속점 근처에만 샘플을 추가한다.
+
+    Args:
+        func: 그릴 함수 (x -> y), NumPy 배열을 받을 수 있으면 일괄 계산
+        ranges: [(x_min, x_max), ...] 형태의 연속구간 리스트
+        num_samples: 전체 x 범위에 대한 균일 샘플 수
+        total_range: 전체 x 범위의 길이
+        y_limit: y값의 절대값 제한
+        unit_size: (x, y) 단위 길이의 화면상 크기
+        adaptive: 적응형 세분화 사용 여부
+        max_depth: 최대 세분화 단계
+        angle_tolerance: 세분화 기준 꺾임각 (라디안)
+        min_samples: 균일 샘플링 시 구간별 최소 샘플 수
+
+    Returns:
+        list: [(x_values, y_values), ...] y값 제한을 벗어난 샘플은 제외
+    """
+    if not ranges:
+        return []
+
+    sizes = []
+    for x_min, x_max in ranges:
+        # 구간의 길이에 비례하여 샘플 수 계산
+        interval_samples = int(num_samples * ((x_max - x_min) / total_range))
+        interval_samples = max(interval_samples, min_samples)  # 최소 샘플 수 보장
+        if adaptive:
+            interval_samples = max(interval_samples // ADAPTIVE_COARSE_RATIO,
+                                   ADAPTIVE_MIN_SAMPLES)
+        sizes.append(interval_samples)
+
+    xs = [np.linspace(x_min, x_max, n)
+          for (x_min, x_max), n in zip(ranges, sizes)]
+    ys = _split_by_sizes(evaluate_function(func, np.concatenate(xs)), sizes)
+
+    # 화면상 한 픽셀보다 짧은 간선은 더 나누지 않음
+    min_edge_length = config["frame_width"] / config["pixel_width"]
+
+    for _ in range(max_depth if adaptive else 0):
+        new_xs = [
+            _refinement_points(x, y, unit_size, y_limit,
+                               angle_tolerance, min_edge_length)
+            for x, y in zip(xs, ys)
+        ]
+        new_sizes = [len(x) for x in new_xs]
+        if not any(new_sizes):
+            break
+
+        new_ys = _split_by_sizes(
+            evaluate_function(func, np.concatenate(new_xs)), new_sizes)
+        for i, (new_x, new_y) in enumerate(zip(new_xs, new_ys)):
+            if len(new_x):
+                index = np.searchsorted(xs[i], new_x)
+                xs[i] = np.insert(xs[i], index, new_x)
+                ys[i] = np.insert(ys[i], index, new_y)
+
+    # y값 범위 제한
+    samples = []
+    for x, y in zip(xs, ys):
+        mask = np.isfinite(y) & (np.abs(y) <= y_limit)
+        samples.append((x[mask], y[mask]))
+    return samples
+
+
 class FunctionPlotMixIn(NumberPlaneGroupBase):
     def __init__(self, **kwargs):
         if not hasattr(self, '_init_called'):
@@ -32,7 +169,7 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
                         stroke_width=2):
         """파라메트릭 함수 그래프 추가"""
         if name is None:
-            name = f"parametric_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.PARAMETRIC])}"
+            name = f"parametric_{self._count_mobjects(MobjectType.PARAMETRIC)}"
 
         graph = self.plane.plot_parametric_curve(
             func,
@@ -58,7 +195,7 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
             x_range = self.plane.x_range[:2]
 
         if name is None:
-            name = f"function_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.FUNCTION])}"
+            name = f"function_{self._count_mobjects(MobjectType.FUNCTION)}"
 
         graph = self.plane.plot(
             func,
@@ -93,6 +230,9 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
         stroke_width=2,
         show_discontinuities=True,  # 불연속점 표시 여부
         discontinuity_config=None,  # 점근선 스타일 설정
+        adaptive=True,              # 적응형 샘플링 여부
+        max_refine_depth=ADAPTIVE_MAX_DEPTH,
+        angle_tolerance=ADAPTIVE_ANGLE_TOLERANCE,
         **kwargs
     ):
         """불연속 구간을 포함하는 함수 그래프 추가
@@ -108,6 +248,9 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
             stroke_width: 선 두께
             show_discontinuities: 불연속점 표시 여부
             discontinuity_config: 점근선 설정 (color, dash_length, stroke_width 등)
+            adaptive: True이면 곡률이 큰 곳과 불연속점 근처에만 샘플을 추가
+            max_refine_depth: 적응형 샘플링의 최대 세분화 단계
+            angle_tolerance: 세분화 기준 꺾임각 (라디안, 화면 좌표계)
             **kwargs: plot_function에 전달할 추가 인자
 
         Returns:
@@ -117,7 +260,7 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
             x_range = self.plane.x_range[:2]
 
         if name is None:
-            name = f"discontinuous_function_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.FUNCTION])}"
+            name = f"discontinuous_function_{self._count_mobjects(MobjectType.FUNCTION)}"
 
         if discontinuity_config is None:
             discontinuity_config = {
@@ -169,17 +312,32 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
             "base_plane": self.plane,
             "x_range": x_range,
             "is_discontinuous": True,
-            "discontinuities": discontinuity_finder(x_range[0], x_range[1]) if discontinuity_finder else None
+            "discontinuities": discontinuities
         }
 
         num_samples = calculate_enough_number_of_samples(self.plane.x_length)
 
+        # 모든 연속구간을 한 번에 샘플링
+        origin = self.plane.c2p(0, 0)
+        unit_size = (
+            self._get_unit_length(),
+            np.linalg.norm(self.plane.c2p(0, 1) - origin)
+        )
+        samples = sample_function_segments(
+            func, ranges, num_samples,
+            total_range=self.plane.x_range[1] - self.plane.x_range[0],
+            y_limit=y_limit,
+            unit_size=unit_size,
+            adaptive=adaptive,
+            max_depth=max_refine_depth,
+            angle_tolerance=angle_tolerance
+        )
+
         # 연속구간별 그래프 생성
         graph_segments = VGroup()
-        for x_min, x_max in ranges:
+        for (x_min, x_max), (x_values, y_values) in zip(ranges, samples):
             segment = self._plot_function_segment(
-                func, x_min, x_max, num_samples,
-                y_limit, color, stroke_width, **kwargs
+                x_values, y_values, color, stroke_width, **kwargs
             )
             # 세그먼트도 메타데이터 포함
             self._ensure_metadata(segment)
@@ -209,24 +367,8 @@ class FunctionPlotMixIn(NumberPlaneGroupBase):
         self.add(result_group)
         return result_group
 
-    def _plot_function_segment(self, func, x_min, x_max, num_samples, y_limit, color, stroke_width, **kwargs):
-        """함수의 한 구간을 그리는 헬퍼 메서드"""
-        # 구간의 길이에 비례하여 샘플 수 계산
-        total_range = self.plane.x_range[1] - self.plane.x_range[0]
-        interval_length = x_max - x_min
-        interval_samples = int(num_samples * (interval_length / total_range))
-        interval_samples = max(interval_samples, 50)  # 최소 샘플 수 보장
-
-        # 샘플링
-        x_values = np.linspace(x_min, x_max, interval_samples)
-        y_values = [func(x) for x in x_values]
-
-        # y값 범위 제한
-        mask = np.abs(y_values) <= y_limit
-        x_values = x_values[mask]
-        y_values = np.array(y_values)[mask]
-
-        # 구간 그래프 생성
+    def _plot_function_segment(self, x_values, y_values, color, stroke_width, **kwargs):
+        """샘플링된 한 구간을 그리는 헬퍼 메서드"""
         return self.plane.plot_line_graph(
             x_values=x_values,
             y_values=y_values,
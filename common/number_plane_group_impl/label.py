@@ -23,7 +23,7 @@ class LabelMixIn(NumberPlaneGroupBase):
                   buff=0.1):          # 기본 간격
         """임의의 위치에 라벨 추가"""
         if name is None:
-            name = f"label_{len([m for m in self.submobjects if m.metadata.get('type') == MobjectType.LABEL])}"
+            name = f"label_{self._count_mobjects(MobjectType.LABEL)}"
 
         # LaTeX 수식 여부에 따라 적절한 객체 생성
         if tex_template:
@@ -108,7 +108,7 @@ class LabelMixIn(NumberPlaneGroupBase):
             tuple: (Brace, MathTex or None) - 브레이스와 텍스트 객체 튜플
         """
         if name is None:
-            name = f"brace_{len(list(self.iter_mobjects(obj_type='BRACE')))}"
+            name = f"brace_{self._count_mobjects('BRACE')}"
 
         # Brace 객체 생성
         brace = Brace(
@@ -1,3 +1,4 @@
+import copy
 from enum import Enum, auto
 from manim import *
 
@@ -67,6 +68,8 @@ class NumberPlaneGroupBase(VGroup):
                  background_line_style={"stroke_opacity": 0.4},
                  origin_config=None,
                  **kwargs):
+        # (type, name) 인덱스는 VGroup 초기화 중의 add 호출보다 먼저 준비
+        self._clear_mobject_index()
         super().__init__(**kwargs)
         self._init_called = False  # 중복 초기화 방지
 
@@ -115,6 +118,128 @@ class NumberPlaneGroupBase(VGroup):
             setattr(mob, "metadata", {})
         return mob
 
+    @property
+    def submobjects(self):
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, value):
+        # add_to_back, become 등 목록 자체를 바꾸는 경우 다음 조회 때 인덱스 재구성
+        self._submobjects = value
+        self._mobject_index_stale = True
+
+    # submobjects를 제자리에서 바꾸는 메서드들: 다음 조회 때 인덱스 재구성
+    def insert(self, index, mobject):
+        super().insert(index, mobject)
+        self._mobject_index_stale = True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._mobject_index_stale = True
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._mobject_index_stale = True
+        return self
+
+    def shuffle(self, *args, **kwargs):
+        super().shuffle(*args, **kwargs)
+        self._mobject_index_stale = True
+
+    def invert(self, *args, **kwargs):
+        super().invert(*args, **kwargs)
+        self._mobject_index_stale = True
+
+    def add(self, *mobjects):
+        """객체 추가 (type, name 인덱스도 함께 갱신)"""
+        # Mobject.add는 submobjects를 다시 대입하지만 아래에서 인덱스를 직접 갱신하므로 재구성 표시는 유지
+        stale = self._mobject_index_stale
+        super().add(*mobjects)
+        self._mobject_index_stale = stale
+        for mob in mobjects:
+            self._index_mobject(mob)
+        return self
+
+    def remove(self, *mobjects):
+        """객체 제거 (type, name 인덱스도 함께 갱신)"""
+        super().remove(*mobjects)
+        for mob in mobjects:
+            self._unindex_mobject(mob)
+        return self
+
+    def _clear_mobject_index(self):
+        """(type, name) 인덱스 초기화
+
+        - _mobject_index: (type, name) -> {mob: None} (submobjects 순서 유지)
+        - _type_index: type -> {mob: None}
+        - _name_index: name -> {mob: None}
+        - _indexed_keys: mob -> 인덱싱 당시의 (type, name)
+        - _name_match_cache: 정규표현식 패턴 -> {name: 매칭 여부}
+        """
+        self._mobject_index = {}
+        self._type_index = {}
+        self._name_index = {}
+        self._indexed_keys = {}
+        self._name_match_cache = {}
+        self._mobject_index_stale = False
+
+    def _ensure_mobject_index(self):
+        """add/remove를 거치지 않고 submobjects가 바뀌었으면 인덱스 재구성"""
+        if self._mobject_index_stale or len(self._indexed_keys) != len(self.submobjects):
+            self.reindex_mobjects()
+
+    def _index_mobject(self, mob):
+        """객체를 인덱스에 등록
+
+        Mobject.add는 이미 있는 객체를 맨 뒤로 옮기므로,
+        인덱스에서도 먼저 제거한 뒤 다시 등록해 순서를 맞춘다.
+        """
+        self._unindex_mobject(mob)
+        self._ensure_metadata(mob)
+        key = (mob.metadata.get("type"), mob.metadata.get("name"))
+        self._mobject_index.setdefault(key, {})[mob] = None
+        self._type_index.setdefault(key[0], {})[mob] = None
+        self._name_index.setdefault(key[1], {})[mob] = None
+        self._indexed_keys[mob] = key
+
+    def _unindex_mobject(self, mob):
+        """객체를 인덱스에서 제거"""
+        key = self._indexed_keys.pop(mob, None)
+        if key is None:
+            return
+
+        bucket = self._mobject_index.get(key)
+        if bucket is not None:
+            bucket.pop(mob, None)
+            if not bucket:
+                del self._mobject_index[key]
+
+        bucket = self._type_index.get(key[0])
+        if bucket is not None:
+            bucket.pop(mob, None)
+            if not bucket:
+                del self._type_index[key[0]]
+
+        bucket = self._name_index.get(key[1])
+        if bucket is not None:
+            bucket.pop(mob, None)
+            if not bucket:
+                del self._name_index[key[1]]
+
+    def reindex_mobjects(self):
+        """submobjects를 기준으로 인덱스 전체 재구성
+
+        객체를 추가한 뒤 metadata의 type/name을 직접 바꾼 경우에 호출한다.
+        """
+        self._clear_mobject_index()
+        for mob in self.submobjects:
+            self._index_mobject(mob)
+
+    def _count_mobjects(self, obj_type):
+        """특정 타입의 객체 수 (자동 이름 생성용)"""
+        self._ensure_mobject_index()
+        return len(self._type_index.get(obj_type, ()))
+
     def _create_origin_marker(self, style_type, config):
         """원점 표시 생성 헬퍼 메서드"""
         color = config.get("color", RED)
@@ -384,3 +509,134 @@ class NumberPlaneGroupBase(VGroup):
             elif mob.metadata.get("type") == MobjectType.BRACE_TEXT:
                 # TODO: Brace Text 객체 복사
                 pass
+
+    @staticmethod
+    def _get_plane_matrix(plane):
+        """평면 좌표 -> 화면 좌표 아핀 변환의 3x3 동차 행렬"""
+        origin = plane.c2p(0, 0)
+        x_unit = plane.c2p(1, 0) - origin
+        y_unit = plane.c2p(0, 1) - origin
+        return np.array([
+            [x_unit[0], y_unit[0], origin[0]],
+            [x_unit[1], y_unit[1], origin[1]],
+            [0.0, 0.0, 1.0],
+        ])
+
+    def _get_transform_matrix(self, target_plane):
+        """현재 평면의 화면 좌표를 대상 평면의 화면 좌표로 옮기는 3x3 동차 행렬
+
+        두 평면 모두 아핀 사상이므로 (대상 평면 행렬) @ (현재 평면 행렬)^-1 로
+        한 번만 계산해 두면 모든 점에 그대로 적용할 수 있다.
+        """
+        return self._get_plane_matrix(target_plane) @ np.linalg.inv(
+            self._get_plane_matrix(self.plane))
+
+    @staticmethod
+    def _apply_matrix_to_points(points, matrix):
+        """(N, 3) 화면 좌표 배열에 3x3 동차 행렬 적용 (z 좌표는 유지)"""
+        result = points.copy()
+        result[:, :2] = points[:, :2] @ matrix[:2, :2].T + matrix[:2, 2]
+        return result
+
+    def _apply_matrix_to_family(self, mob, matrix):
+        """객체와 하위 객체들의 points 전체를 한 번의 행렬 연산으로 변환"""
+        members = mob.family_members_with_points()
+        if not members:
+            return mob
+
+        sizes = [len(member.points) for member in members]
+        all_points = self._apply_matrix_to_points(
+            np.concatenate([member.points for member in members]), matrix)
+        for member, points in zip(members, np.split(all_points, np.cumsum(sizes)[:-1])):
+            member.points = points
+        return mob
+
+    def _move_with_matrix(self, mob, matrix, scale_factor, about_point=None):
+        """모양은 유지한 채 about_point만 아핀 변환된 위치로 옮기고 크기를 균등 조절
+
+        원/점/호는 비균등 변환에서도 원 모양을 유지해야 하므로(기존 add_* 와 같이
+        x축 단위 길이 비율로 반지름을 조절) 점 배열 전체에 행렬을 적용하지 않는다.
+        """
+        if about_point is None:
+            about_point = mob.get_center()
+        target = self._apply_matrix_to_points(about_point.reshape(1, 3), matrix)[0]
+        for member in mob.family_members_with_points():
+            member.points = (member.points - about_point) * scale_factor + target
+        return mob
+
+    # 빠른 경로로 복사하는 객체 타입 (기존 복사 방식이 지원하는 타입과 동일)
+    _AFFINE_COPY_TYPES = (
+        MobjectType.CIRCLE,
+        MobjectType.VECTOR,
+        MobjectType.POINT,
+        MobjectType.FUNCTION,
+        MobjectType.PARAMETRIC,
+        MobjectType.LABEL,
+        MobjectType.ARC,
+        MobjectType.LINE,
+        MobjectType.POLYGON,
+    )
+
+    def _copy_mobjects_with_affine(self, new_group, scale_stroke_width=False):
+        """_copy_mobjects_with_transform의 빠른 경로
+
+        add_*/plot_* 로 다시 만들거나 함수를 재샘플링하지 않고, 이전 평면 -> 새 평면
+        아핀 변환 행렬을 한 번 계산하여 각 객체의 points 배열에 그대로 적용한다.
+        메타데이터는 깊은 복사로 보존되며, 메타데이터가 가리키던 이전 평면은
+        새 평면으로 치환된다.
+
+        Args:
+            new_group: 새 평면이 설정된 대상 그룹
+            scale_stroke_width: True면 선 두께도 x축 단위 길이 비율로 조절
+                (기본값은 기존 복사 방식과 같이 화면 기준 두께 유지)
+        """
+        matrix = self._get_transform_matrix(new_group.plane)
+        # 반지름 등 길이 조절 비율 (기존 add_* 와 같이 x축 단위 길이 기준)
+        scale_factor = np.linalg.norm(matrix[:2, 0])
+
+        for mob in self.submobjects:
+            if not hasattr(mob, 'metadata'):
+                continue
+
+            mob_type = mob.metadata.get('type')
+            if mob_type not in self._AFFINE_COPY_TYPES:
+                continue
+
+            new_mob = copy.deepcopy(mob, {id(self.plane): new_group.plane})
+
+            if mob_type in (MobjectType.CIRCLE, MobjectType.ARC) and hasattr(new_mob, 'radius'):
+                # 원 모양 유지: 중심만 변환하고 반지름은 균등하게 조절
+                # (arc_center 속성은 그룹 scale/shift 후 갱신되지 않으므로 점에서 계산)
+                about_point = (mob.get_arc_center() if mob_type == MobjectType.ARC
+                               else mob.get_center())
+                self._move_with_matrix(new_mob, matrix, scale_factor, about_point)
+                new_mob.radius *= scale_factor
+                new_mob.arc_center = self._apply_matrix_to_points(
+                    about_point.reshape(1, 3), matrix)[0]
+            elif mob_type == MobjectType.POINT:
+                # 점은 원 모양 유지, 라벨은 크기 유지한 채 위치만 이동
+                dot = new_mob.submobjects[0]
+                self._move_with_matrix(dot, matrix, scale_factor)
+                dot.radius *= scale_factor
+                for label in new_mob.submobjects[1:]:
+                    self._move_with_matrix(label, matrix, 1.0)
+            elif mob_type == MobjectType.LABEL:
+                # 글꼴 크기는 유지한 채 위치만 이동
+                self._move_with_matrix(new_mob, matrix, 1.0)
+            elif mob_type == MobjectType.VECTOR:
+                # 화살표 끝 모양(tip_length)은 유지한 채 시작/끝점만 변환
+                start, end = self._apply_matrix_to_points(
+                    np.array([mob.get_start(), mob.get_end()]), matrix)
+                new_mob.put_start_and_end_on(start, end)
+            else:
+                # 함수/파라메트릭/선/다각형은 아핀 변환에 대해 정확히 닫혀 있음
+                self._apply_matrix_to_family(new_mob, matrix)
+
+            if scale_stroke_width:
+                for member in new_mob.get_family():
+                    if isinstance(member, VMobject):
+                        member.set_stroke(
+                            width=member.get_stroke_width() * scale_factor, family=False)
+
+            new_group.add(new_mob)
+
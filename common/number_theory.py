@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+# 분할 체의 구간 하나가 다루는 홀수 개수 (L2 캐시에 들어가는 크기)
+DEFAULT_SEGMENT_SIZE = 1 << 18
+# 기본 소인수 테이블(SPF) 크기 — 이보다 큰 수는 Pollard rho 로 분해
+DEFAULT_FACTOR_TABLE_LIMIT = 1 << 20
+
+# 바이트 값별 1비트 개수 (비트 압축된 체에서 소수 개수 세기용)
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+# 64비트 정수 범위 밀러-라빈 판정에 충분한 밑
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def simple_sieve(n: int) -> np.ndarray:
+    """n 이하의 소수 배열 (작은 n 용 기본 체)"""
+    if n < 2:
+        return np.zeros(0, dtype=np.int64)
+    is_prime = np.ones(n + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, math.isqrt(n) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    return np.flatnonzero(is_prime)
+
+
+def _sieve_odd_segment(low: int, high: int, base_primes: np.ndarray) -> np.ndarray:
+    """[low, high) 구간 홀수들의 소수 여부 (low 는 홀수, 인덱스 i <-> low + 2i)"""
+    is_prime = np.ones((high - low + 1) // 2, dtype=bool)
+    for p in base_primes:
+        p = int(p)
+        if p * p >= high:
+            break
+        # 구간 안의 첫 홀수 배수 (p*p 이전의 배수는 더 작은 소수가 이미 지움)
+        start = max(p * p, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        is_prime[(start - low) // 2::p] = False
+    return is_prime
+
+
+def iter_odd_segments(n: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> Iterator[tuple[int, np.ndarray]]:
+    """n 이하의 홀수를 구간별로 체로 걸러 (구간 시작 홀수, 소수 여부 배열)을 차례로 반환
+
+    1 은 소수가 아니므로 첫 구간에서 지워 둔다. 2 는 홀수가 아니므로 포함되지 않는다.
+    """
+    base_primes = simple_sieve(math.isqrt(n))[1:]  # 홀수 소수만
+    for low in range(1, n + 1, 2 * segment_size):
+        high = min(low + 2 * segment_size, n + 1)
+        is_prime = _sieve_odd_segment(low, high, base_primes)
+        if low == 1:
+            is_prime[0] = False
+        yield low, is_prime
+
+
+def count_primes(n: int, segment_size: int = DEFAULT_SEGMENT_SIZE) -> int:
+    """n 이하의 소수 개수 (구간별로 세므로 메모리는 구간 크기만큼만 사용)"""
+    if n < 2:
+        return 0
+    return 1 + sum(int(np.count_nonzero(is_prime)) for _, is_prime in iter_odd_segments(n, segment_size))
+
+
+class PrimeSieve:
+    """n 이하 소수를 홀수 하나당 1비트로 압축해 저장하는 분할 에라토스테네스의 체
+
+    홀수 2i + 1 의 소수 여부가 i 번째 비트이다 (짝수는 저장하지 않으므로 n / 16 바이트).
+    """
+
+    def __init__(self, n: int, segment_size: int = DEFAULT_SEGMENT_SIZE):
+        self.n = max(n, 0)
+        # 구간 크기를 8의 배수로 맞추면 구간마다 바이트 경계에서 압축이 끝난다
+        segment_size = max(8, segment_size - segment_size % 8)
+        chunks = [
+            np.packbits(is_prime, bitorder='little')
+            for _, is_prime in iter_odd_segments(self.n, segment_size)
+        ]
+        self.bits = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+
+    def is_prime(self, k: int) -> bool:
+        if k > self.n:
+            raise ValueError(f"{k} 는 체의 범위({self.n})를 벗어납니다")
+        if k < 2:
+            return False
+        if k % 2 == 0:
+            return k == 2
+        index = k // 2
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def __contains__(self, k: int) -> bool:
+        return 0 <= k <= self.n and self.is_prime(k)
+
+    def count(self, m: int | None = None) -> int:
+        """m (기본: n) 이하의 소수 개수 — 압축된 바이트의 1비트 개수 합"""
+        m = self.n if m is None else min(m, self.n)
+        if m < 2:
+            return 0
+        odd_count = (m + 1) // 2  # m 이하 홀수 개수 (1 포함)
+        full_bytes, remainder = divmod(odd_count, 8)
+        total = int(_POPCOUNT[self.bits[:full_bytes]].sum())
+        if remainder:
+            total += bin(int(self.bits[full_bytes]) & ((1 << remainder) - 1)).count('1')
+        return total + 1  # 2
+
+    def primes(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """[start, stop] 범위의 소수 배열"""
+        stop = self.n if stop is None else min(stop, self.n)
+        if stop < max(start, 2):
+            return np.zeros(0, dtype=np.int64)
+        odd_flags = np.unpackbits(self.bits, bitorder='little')[: (stop + 1) // 2]
+        odds = 2 * np.flatnonzero(odd_flags) + 1
+        odds = odds[odds >= start]
+        return np.concatenate([[2], odds]) if start <= 2 else odds
+
+
+@dataclass
+class SieveStep:
+    """체의 한 단계: 소수 prime 이 새로 지운 수들 (이전 단계에서 지워진 수는 제외)"""
+    prime: int
+    crossed_out: np.ndarray
+
+
+def sieve_steps(n: int) -> list[SieveStep]:
+    """에라토스테네스의 체 애니메이션용 단계별 데이터 (√n 이하 소수마다 한 단계)"""
+    crossed = np.zeros(n + 1, dtype=bool)
+    steps = []
+    for p in simple_sieve(math.isqrt(n)):
+        p = int(p)
+        multiples = np.arange(p * p, n + 1, p)
+        steps.append(SieveStep(p, multiples[~crossed[multiples]]))
+        crossed[multiples] = True
+    return steps
+
+
+def smallest_prime_factors(n: int) -> np.ndarray:
+    """0..n 각 수의 가장 작은 소인수 테이블 (0, 1 은 0)"""
+    dtype = np.int32 if n < 2 ** 31 else np.int64
+    spf = np.zeros(n + 1, dtype=dtype)
+    for p in range(2, math.isqrt(n) + 1):
+        if spf[p] == 0:
+            multiples = spf[p * p::p]
+            multiples[multiples == 0] = p
+    # 아직 0 인 수(2 이상)는 소수이므로 자기 자신
+    unset = np.flatnonzero(spf == 0)
+    spf[unset] = unset
+    spf[:2] = 0
+    return spf
+
+
+def is_probable_prime(n: int) -> bool:
+    """밀러-라빈 소수 판정 (n < 3.3 * 10^24 범위에서는 결정적)"""
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(n: int, rng: random.Random | None = None) -> int:
+    """합성수 n 의 자명하지 않은 약수 하나 (Brent 변형)"""
+    if n % 2 == 0:
+        return 2
+    rng = rng or random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved_y = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # 곱을 모으다 지나친 경우 한 걸음씩 다시 진행
+            g = 1
+            while g == 1:
+                saved_y = (saved_y * saved_y + c) % n
+                g = math.gcd(abs(x - saved_y), n)
+        if g != n:
+            return g
+
+
+class Factorizer:
+    """가장 작은 소인수 테이블(SPF)을 이용한 소인수분해
+
+    - limit 이하: 테이블을 따라 나누기만 하면 된다 (소인수 개수만큼의 연산)
+    - limit 초과: Pollard rho 로 약수를 찾아 나누고, 조각이 limit 이하가 되면 테이블 사용
+    """
+
+    def __init__(self, limit: int = DEFAULT_FACTOR_TABLE_LIMIT):
+        self.limit = limit
+        self.spf = smallest_prime_factors(limit)
+
+    def factorize(self, n: int) -> list[int]:
+        """n 의 소인수 리스트 (오름차순, 중복 포함)"""
+        if n < 2:
+            return []
+        if n <= self.limit:
+            return self._factorize_small(n)
+        return sorted(self._factorize_large(n))
+
+    def factorize_many(self, numbers: Iterable[int]) -> list[list[int]]:
+        """여러 수를 한 번에 소인수분해 (테이블 범위의 수는 배열 연산으로 함께 처리)"""
+        numbers = [int(number) for number in numbers]
+        results: list[list[int]] = [[] for _ in numbers]
+
+        small = np.array(
+            [index for index, number in enumerate(numbers) if 2 <= number <= self.limit],
+            dtype=np.int64,
+        )
+        remaining = np.array([numbers[index] for index in small], dtype=np.int64)
+        while len(small):
+            factors = self.spf[remaining]
+            for index, factor in zip(small.tolist(), factors.tolist()):
+                results[index].append(factor)
+            remaining = remaining // factors
+            active = remaining > 1
+            small, remaining = small[active], remaining[active]
+
+        for index, number in enumerate(numbers):
+            if number > self.limit:
+                results[index] = self.factorize(number)
+        return results
+
+    def _factorize_small(self, n: int) -> list[int]:
+        factors = []
+        while n > 1:
+            p = int(self.spf[n])
+            factors.append(p)
+            n //= p
+        return factors
+
+    def _factorize_large(self, n: int) -> list[int]:
+        if n <= self.limit:
+            return self._factorize_small(n)
+        if is_probable_prime(n):
+            return [n]
+        divisor = pollard_rho(n)
+        return self._factorize_large(divisor) + self._factorize_large(n // divisor)
+
+
+_default_factorizer: Factorizer | None = None
+
+
+def get_default_factorizer() -> Factorizer:
+    """모듈 전역 기본 소인수분해기 (처음 사용할 때 테이블 생성)"""
+    global _default_factorizer
+    if _default_factorizer is None:
+        _default_factorizer = Factorizer()
+    return _default_factorizer
+
+
+def factorize(n: int) -> list[int]:
+    """n 의 소인수 리스트 (기본 소인수분해기 사용)"""
+    return get_default_factorizer().factorize(n)
+
+
+def factor_counts(n: int) -> Counter:
+    """n 의 소인수별 지수 {소인수: 지수}"""
+    return Counter(factorize(n))
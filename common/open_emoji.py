@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
+
+from PIL import Image
 from manim import *
-from .web import WebImageMobject
+from .http_cache import OfflineCacheMiss, default_http_cache
+from .web import DEFAULT_FETCH_WORKERS, WebImageMobject
 
 import requests
 
@@ -9,6 +18,9 @@ import requests
 OPENMOJI_BASE_URL = "https://raw.githubusercontent.com/hfg-gmuend/openmoji/master"
 OPENMOJI_COLOR_SIZE = "618x618"
 
+# 환경 변수: 로컬 OpenMoji 미러 디렉터리 (openmoji 저장소를 clone한 경로도 그대로 사용 가능)
+OPENMOJI_DIR_ENV = "OPENMOJI_DIR"
+
 
 class OpenMojiMixin:
     """OpenMoji 이모지 처리를 위한 공통 기능을 제공하는 Mixin 클래스"""
@@ -18,47 +30,131 @@ class OpenMojiMixin:
         """이모지를 하이픈으로 구분된 16진수 코드 시퀀스로 변환"""
         return '-'.join(f'{ord(c):x}' for c in emoji)
 
+    @classmethod
+    def _get_hex_code(cls, emoji: str | int) -> str:
+        """이모지 문자 또는 코드 포인트를 OpenMoji 파일 이름(대문자 16진수 코드)으로 변환"""
+        if isinstance(emoji, int):
+            return f"{emoji:X}"
+        return cls._convert_emoji_to_hex_codes(emoji).upper()
+
+
+class OpenMojiStore(OpenMojiMixin):
+    """OpenMoji 에셋(SVG, PNG)의 로컬 미러
+
+    - 디렉터리 구조는 openmoji 저장소와 같다: <root>/color/svg/<코드>.svg, <root>/color/618x618/<코드>.png
+    - 미러에 없는 파일만 내려받아 저장하고, 이후에는 네트워크를 사용하지 않는다
+      (OpenMoji 에셋은 코드별로 내용이 바뀌지 않으므로 재검증하지 않음)
+    - 오프라인 모드(MANIM_WEB_OFFLINE)에서는 미러에 없으면 OfflineCacheMiss
+    """
+
+    def __init__(self, root: str | Path | None = None, session: requests.Session | None = None):
+        self._root = Path(root) if root else None
+        self._session = session
+
+    @property
+    def root(self) -> Path:
+        """미러 위치 (기본값: OPENMOJI_DIR 환경 변수, 없으면 <media_dir>/openmoji)"""
+        if self._root is not None:
+            return self._root
+        env_dir = os.environ.get(OPENMOJI_DIR_ENV)
+        # config.media_dir는 렌더 시점에 확정되므로 지연 계산
+        return Path(env_dir) if env_dir else Path(config.media_dir) / "openmoji"
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session or default_http_cache.session
+
+    @staticmethod
+    def _relative_path(hex_code: str, kind: str) -> str:
+        if kind == "svg":
+            return f"color/svg/{hex_code}.svg"
+        if kind == "png":
+            return f"color/{OPENMOJI_COLOR_SIZE}/{hex_code}.png"
+        raise ValueError(f"지원하지 않는 형식입니다: {kind}")
+
+    def get_url(self, emoji: str | int, kind: str = "svg") -> str:
+        """이모지 에셋의 원격 URL"""
+        return f"{OPENMOJI_BASE_URL}/{self._relative_path(self._get_hex_code(emoji), kind)}"
+
+    def get_path(self, emoji: str | int, kind: str = "svg") -> Path:
+        """이모지 에셋의 로컬 경로 (미러에 없으면 내려받아 저장)"""
+        return self._get_path_for_hex(self._get_hex_code(emoji), kind)
+
+    def _get_path_for_hex(self, hex_code: str, kind: str) -> Path:
+        relative_path = self._relative_path(hex_code, kind)
+        path = self.root / relative_path
+        if path.exists():
+            return path
+
+        url = f"{OPENMOJI_BASE_URL}/{relative_path}"
+        if default_http_cache.offline:
+            raise OfflineCacheMiss(f"Offline mode: {url} is not in the OpenMoji mirror {self.root}")
+
+        with self.session.get(url, timeout=default_http_cache.timeout) as response:
+            response.raise_for_status()
+            content = response.content
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 디렉터리에 임시 파일로 쓴 뒤 교체 (동시에 내려받는 다른 스레드/프로세스와 충돌하지 않도록)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            f.write(content)
+        os.replace(f.name, path)
+        return path
+
+    def prefetch(
+        self,
+        emojis: Iterable[str | int],
+        kinds: Iterable[str] = ("svg",),
+        max_workers: int = DEFAULT_FETCH_WORKERS
+    ) -> list[Path]:
+        """여러 이모지 에셋을 동시에 미러에 받아 둔다 (실패한 항목은 출력 후 건너뜀)"""
+        requests_to_fetch = list(dict.fromkeys(
+            (self._get_hex_code(emoji), kind) for emoji in emojis for kind in kinds
+        ))
+
+        def fetch(item: tuple[str, str]) -> Path | None:
+            hex_code, kind = item
+            try:
+                return self._get_path_for_hex(hex_code, kind)
+            except (requests.RequestException, IOError) as e:
+                print(f"Error fetching emoji {hex_code} ({kind}): {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [path for path in executor.map(fetch, requests_to_fetch) if path is not None]
+
+
+# 모듈 전역 기본 미러
+default_openmoji_store = OpenMojiStore()
+
+
+def prefetch_emojis(
+    emojis: Iterable[str | int],
+    kinds: Iterable[str] = ("svg",),
+    store: OpenMojiStore | None = None,
+    **kwargs
+) -> list[Path]:
+    """장면을 만들기 전에 이모지 에셋을 동시에 미러에 받아 둔다"""
+    return (store or default_openmoji_store).prefetch(emojis, kinds, **kwargs)
+
 
 class EmojiImageMobject(WebImageMobject, OpenMojiMixin):
     """이모지를 Manim 애니메이션에서 사용할 수 있는 이미지 객체로 변환"""
 
-    def __init__(self, emoji: str | int, **kwargs):
-        if isinstance(emoji, int):
-            img_url = self._get_emoji_url_from_hex(emoji)
-        else:
-            img_url = self._get_emoji_url(emoji)
-            
-        WebImageMobject.__init__(self, img_url, **kwargs)
+    def __init__(self, emoji: str | int, store: OpenMojiStore | None = None, **kwargs):
+        path = (store or default_openmoji_store).get_path(emoji, "png")
+        with Image.open(path) as im:
+            WebImageMobject.__init__(self, im.copy(), **kwargs)
 
-    @classmethod
-    def _get_emoji_url(cls, emoji: str) -> str:
-        """이모지 문자에 해당하는 PNG URL 반환"""
-        emoji_code = cls._convert_emoji_to_hex_codes(emoji).upper()
-        return f'{OPENMOJI_BASE_URL}/color/{OPENMOJI_COLOR_SIZE}/{emoji_code}.png'
 
-    @classmethod
-    def _get_emoji_url_from_hex(cls, hex_code: str | int) -> str:
-        """16진수 코드에 해당하는 PNG URL 반환"""
-        if isinstance(hex_code, int):
-            hex_code = f"{hex_code:x}"
-        hex_code = str(hex_code).upper()
-        return f'{OPENMOJI_BASE_URL}/color/{OPENMOJI_COLOR_SIZE}/{hex_code}.png'
+class EmojiSVGMobject(SVGMobject, OpenMojiMixin):
+    """이모지를 Manim 애니메이션에서 사용할 수 있는 SVG 객체로 변환
 
+    SVG 파일은 로컬 미러에서 읽는다. 같은 파일을 다시 파싱하지 않도록
+    SVGMobject의 기본 캐시(use_svg_cache)를 그대로 사용한다.
+    """
 
-class EmojiSVGMobject(SVGMobject, OpenMojiMixin):
-    """이모지를 Manim 애니메이션에서 사용할 수 있는 SVG 객체로 변환"""
-
-    def __init__(self, emoji, **kwargs):
-        try:
-            # 임시 파일 생성
-            path_svg = Path.cwd() / f'{self._convert_emoji_to_hex_codes(emoji).upper()}.svg'
-            # requests 사용하여 다운로드
-            url = f'{OPENMOJI_BASE_URL}/color/svg/{path_svg.stem}.svg'
-            with requests.get(url, stream=True) as response:
-                response.raise_for_status()
-                path_svg.write_bytes(response.content)
-            
-            SVGMobject.__init__(self, str(path_svg), **kwargs)
-        finally:
-            if path_svg.exists():
-                path_svg.unlink()
+    def __init__(self, emoji: str | int, store: OpenMojiStore | None = None, **kwargs):
+        self.hex_code = self._get_hex_code(emoji)
+        path_svg = (store or default_openmoji_store).get_path(emoji, "svg")
+        SVGMobject.__init__(self, str(path_svg), **kwargs)
@@ -0,0 +1,273 @@
+"""next_section 으로 나뉜 씬을 구간별로 여러 프로세스에서 동시에 렌더링한 뒤 이어 붙인다
+
+- 구간 렌더링: 작업자는 construct 를 처음부터 실행하되, 대상 구간 이전은 skip_animations 로
+  건너뛰며 상태만 재현하고(seek), 대상 구간이 끝나면 EndSceneEarlyException 으로 멈춘다.
+- 조사(probe): 먼저 씬을 dry_run 으로 한 번 실행해 구간 목록과 구간별 재생 시간을 얻는다.
+  재생 시간이 0 이거나 skip_animations=True 로 표시된 구간은 렌더링하지 않는다.
+- 이어 붙이기: 구간 동영상을 순서대로 재인코딩 없이 패킷 복사로 합쳐 <씬 이름>.mp4 를 만든다.
+- 구간이 하나뿐인 씬(또는 --no-split)은 씬 전체를 작업 하나로 렌더링한다.
+
+NOTE: 작업자마다 construct 를 따로 실행하므로, 시드 없이 난수를 쓰는 씬은 구간 사이가 어긋날 수 있다.
+
+실행 (저장소 루트에서):
+    python -m common.parallel_render animation/029/convolutional_product.py [씬 이름 ...] [-j 8] [-q h]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import inspect
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+import av
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+
+# -q 옵션 -> manim 품질 이름 (manim CLI 와 같은 글자)
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# 작업자 프로세스 안에서 불러온 씬 모듈 (파일 경로 -> {씬 이름: 클래스})
+_loaded_scene_classes: dict[str, dict[str, type[Scene]]] = {}
+
+
+@dataclass
+class SectionInfo:
+    """조사 단계에서 기록한 구간 정보 (0번은 첫 next_section 이전의 자동 생성 구간)"""
+    index: int
+    name: str
+    skip_animations: bool = False
+    run_time: float = 0.0
+
+    @property
+    def renderable(self) -> bool:
+        return not self.skip_animations and self.run_time > 0
+
+
+def load_scene_classes(file_path: str | Path) -> dict[str, type[Scene]]:
+    """파일에 정의된 씬 클래스들 (추상 클래스와 다른 모듈에서 가져온 클래스는 제외)"""
+    file_path = Path(file_path).resolve()
+    key = str(file_path)
+    if key not in _loaded_scene_classes:
+        # manim CLI 처럼 씬 파일의 디렉터리를 모듈 검색 경로에 추가 (같은 폴더의 공용 모듈 import)
+        if str(file_path.parent) not in sys.path:
+            sys.path.insert(0, str(file_path.parent))
+        module_name = file_path.stem.replace(".", "_")
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_scene_classes[key] = {
+            name: obj for name, obj in vars(module).items()
+            if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == module_name
+            and not inspect.isabstract(obj)
+        }
+    return _loaded_scene_classes[key]
+
+
+def make_seek_scene(scene_class: type[Scene], target_section: int | None) -> type[Scene]:
+    """target_section 구간만 렌더링하는 씬 클래스 (None 이면 모든 구간을 건너뛰며 구간 정보만 기록)
+
+    출력 경로가 원래 씬과 같도록 클래스 이름을 그대로 유지한다.
+    """
+
+    class SeekScene(scene_class):
+        section_records: list[SectionInfo]
+
+        def setup(self):
+            super().setup()
+            self.section_records = [SectionInfo(0, "autocreated")]
+            self._section_start_time = 0.0
+            if target_section != 0:
+                # 자동 생성 구간도 건너뛰도록 건너뛰는 구간을 하나 더 연다
+                super().next_section("seek", skip_animations=True)
+
+        def next_section(self, name: str = "unnamed", section_type: str = DefaultSectionType.NORMAL,
+                         skip_animations: bool = False) -> None:
+            self.close_section_record()
+            index = len(self.section_records)
+            if target_section is not None and index > target_section:
+                raise EndSceneEarlyException()
+
+            self.section_records.append(SectionInfo(index, name, skip_animations))
+            super().next_section(name, section_type, skip_animations or index != target_section)
+
+        def close_section_record(self) -> None:
+            """현재 구간의 재생 시간 기록"""
+            self.section_records[-1].run_time = self.renderer.time - self._section_start_time
+            self._section_start_time = self.renderer.time
+
+    SeekScene.__name__ = scene_class.__name__
+    SeekScene.__qualname__ = scene_class.__qualname__
+    return SeekScene
+
+
+def probe_sections(file_path: str, scene_name: str, config_overrides: dict) -> list[SectionInfo]:
+    """씬을 dry_run 으로 끝까지 실행해 구간 목록과 구간별 재생 시간을 얻는다 (작업자 프로세스에서 실행)"""
+    with tempconfig({**config_overrides, "input_file": file_path, "dry_run": True}):
+        scene = make_seek_scene(load_scene_classes(file_path)[scene_name], None)()
+        scene.render()
+        scene.close_section_record()
+        return scene.section_records
+
+
+def render_section(file_path: str, scene_name: str, section: int | None, config_overrides: dict) -> Path:
+    """구간 하나(section=None 이면 씬 전체)를 렌더링하고 동영상 경로 반환 (작업자 프로세스에서 실행)"""
+    overrides = {**config_overrides, "input_file": file_path}
+    if section is not None:
+        overrides["output_file"] = f"{scene_name}_section_{section:03d}"
+        # 구간마다 부분 동영상 폴더를 나눠 같은 해시의 파일을 여러 프로세스가 동시에 쓰지 않도록
+        overrides["partial_movie_dir"] = f"{{video_dir}}/partial_movie_files/{{scene_name}}/section_{section:03d}"
+
+    with tempconfig(overrides):
+        scene_class = load_scene_classes(file_path)[scene_name]
+        scene = (scene_class if section is None else make_seek_scene(scene_class, section))()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_movies(input_files: list[Path], output_file: Path) -> Path:
+    """동영상들을 순서대로 재인코딩 없이 이어 붙인다 (모든 파일의 스트림 구성이 같아야 함)"""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file_list:
+        for path in input_files:
+            file_list.write(f"file 'file:{Path(path).resolve()}'\n")
+
+    try:
+        with av.open(file_list.name, format="concat", options={"safe": "0"}) as source, \
+                av.open(str(output_file), mode="w") as target:
+            streams = {
+                stream.index: _add_stream_from_template(target, stream)
+                for stream in source.streams if stream.type in ("video", "audio")
+            }
+            for packet in source.demux():
+                # 스트림 끝을 알리는 빈 패킷은 건너뜀
+                if packet.dts is None or packet.stream.index not in streams:
+                    continue
+                packet.stream = streams[packet.stream.index]
+                target.mux(packet)
+    finally:
+        os.unlink(file_list.name)
+
+    return output_file
+
+
+def _add_stream_from_template(container, stream):
+    # PyAV 14 부터 add_stream(template=...) 대신 add_stream_from_template 사용
+    if hasattr(container, "add_stream_from_template"):
+        return container.add_stream_from_template(stream)
+    return container.add_stream(template=stream)
+
+
+class ParallelSceneRenderer:
+    """씬 파일의 씬들을 구간 단위 작업으로 나눠 프로세스 풀에서 렌더링
+
+    조사가 끝난 씬부터 구간 작업을 재생 시간이 긴 순서로 넣고,
+    한 씬의 구간이 모두 끝나면 바로 이어 붙인다.
+    """
+
+    def __init__(self,
+                 file_path: str | Path,
+                 scene_names: list[str] | None = None,
+                 max_workers: int | None = None,
+                 split_sections: bool = True,
+                 config_overrides: dict | None = None):
+        self.file_path = str(Path(file_path).resolve())
+        self.scene_names = scene_names or list(load_scene_classes(self.file_path))
+        self.max_workers = max_workers or os.cpu_count()
+        self.split_sections = split_sections
+        self.config_overrides = config_overrides or {}
+
+    def render(self) -> dict[str, Path]:
+        """모든 씬을 렌더링하고 {씬 이름: 동영상 경로} 반환"""
+        results: dict[str, Path] = {}
+        section_movies: dict[str, dict[int, Path]] = {}
+        pending_sections: dict[str, int] = {}
+        start = time.perf_counter()
+
+        # 작업자마다 manim 전역 설정을 따로 갖도록 fork 대신 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as pool:
+            futures: dict[Future, tuple[str, str, int | None]] = {}
+
+            def submit(kind: str, scene_name: str, section: int | None = None) -> None:
+                if kind == "probe":
+                    future = pool.submit(probe_sections, self.file_path, scene_name, self.config_overrides)
+                else:
+                    future = pool.submit(render_section, self.file_path, scene_name, section,
+                                         self.config_overrides)
+                futures[future] = (kind, scene_name, section)
+
+            for scene_name in self.scene_names:
+                submit("probe" if self.split_sections else "render", scene_name)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, scene_name, section = futures.pop(future)
+                    result = future.result()
+
+                    if kind == "probe":
+                        sections = [info for info in result if info.renderable]
+                        if len(sections) <= 1:
+                            # 나눌 구간이 없으면 seek 없이 씬 전체를 렌더링
+                            submit("render", scene_name)
+                            continue
+                        print(f"{scene_name}: {len(sections)} sections "
+                              f"({', '.join(f'{info.name} {info.run_time:.1f}s' for info in sections)})")
+                        section_movies[scene_name] = {}
+                        pending_sections[scene_name] = len(sections)
+                        for info in sorted(sections, key=lambda info: info.run_time, reverse=True):
+                            submit("render", scene_name, info.index)
+
+                    elif section is None:
+                        results[scene_name] = result
+                        print(f"{scene_name}: {result} ({time.perf_counter() - start:.1f}s)")
+
+                    else:
+                        section_movies[scene_name][section] = result
+                        pending_sections[scene_name] -= 1
+                        if pending_sections[scene_name] == 0:
+                            movies = [path for _, path in sorted(section_movies[scene_name].items())]
+                            output_file = movies[0].with_name(f"{scene_name}{movies[0].suffix}")
+                            results[scene_name] = concat_movies(movies, output_file)
+                            print(f"{scene_name}: {output_file} ({time.perf_counter() - start:.1f}s)")
+
+        return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="씬을 구간별로 병렬 렌더링한 뒤 이어 붙인다")
+    parser.add_argument("file", help="씬 파일 경로")
+    parser.add_argument("scenes", nargs="*", help="렌더링할 씬 이름 (생략하면 파일의 모든 씬)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default=None, help="렌더링 품질")
+    parser.add_argument("--no-split", action="store_true", help="구간으로 나누지 않고 씬 단위로만 병렬 렌더링")
+    args = parser.parse_args(argv)
+
+    config_overrides = {}
+    if args.quality:
+        config_overrides["quality"] = QUALITY_FLAGS[args.quality]
+
+    renderer = ParallelSceneRenderer(
+        args.file,
+        scene_names=args.scenes,
+        max_workers=args.jobs,
+        split_sections=not args.no_split,
+        config_overrides=config_overrides,
+    )
+    renderer.render()
+
+
+if __name__ == "__main__":
+    main()
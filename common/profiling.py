@@ -0,0 +1,323 @@
+"""렌더링 시간 분석: 애니메이션 보간, 업데이터, Tex/Text 생성에 걸린 시간을 씬 구간별로 집계
+
+켜져 있는 동안만 manim 클래스의 메서드를 감싸고, 끄면 원래 메서드로 되돌리므로
+사용하지 않을 때의 추가 비용은 없다.
+
+측정 대상:
+- 모든 Animation 하위 클래스의 interpolate_mobject (CreateWithTracer, RotateVectorWithAngularVelocity 등)
+- Mobject.update 가 호출하는 업데이터 함수
+- Text, MarkupText, Tex, MathTex, SingleStringMathTex 생성과 TexCache.get_or_create
+- Scene.play (위 항목에 포함되지 않는 프레임 렌더링/기록 시간 확인용)
+
+결과:
+- 요약: 항목별 호출 횟수, 누적 시간, 자기 시간(하위 항목 제외)
+- <씬 이름>.folded: flamegraph.pl / speedscope 에서 읽는 접힌 스택 형식
+  (씬;구간;항목;하위 항목 자기시간(마이크로초))
+
+사용:
+    with profile_render("profiles/sawtooth.folded"):
+        scene.render()
+
+    python -m common.profiling -ql animation/015/015_seven_deadly_sines.py SawtoothWave
+    MANIM_PROFILE=out/profiles python -m common.profiling -ql animation/015/015_seven_deadly_sines.py SawtoothWave
+
+python -m common.profiling 은 manim CLI 를 같은 프로세스에서 실행하며 씬마다 측정한다.
+MANIM_PROFILE 이 없으면 <media_dir>/profiles, 있으면 해당 디렉터리(1 이면 기본 위치)에 씬별 결과를 저장한다.
+import 만으로는 아무것도 바뀌지 않으며, 다른 실행 방식에서는 MANIM_PROFILE 을 설정하고 렌더링 전에 install_from_env() 를 직접 호출한다.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from manim import *
+
+# 환경 변수: 1이면 <media_dir>/profiles, 그 외의 값이면 결과를 저장할 디렉터리
+PROFILE_ENV = "MANIM_PROFILE"
+
+# 생성 시간을 재는 텍스트 클래스
+TEXT_CLASSES = (Text, MarkupText, SingleStringMathTex, MathTex, Tex)
+
+
+@dataclass
+class ProfileEntry:
+    """항목 하나의 집계 (total: 하위 항목 포함, self_time: 하위 항목 제외)"""
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+
+
+class _TimedUpdater:
+    """업데이터 함수를 감싸서 시간을 재는 호출 객체
+
+    remove_updater 가 원래 함수로 찾을 수 있도록 원래 함수와 같은 값으로 비교되고,
+    Mobject.update 가 dt 인자 여부를 확인할 수 있도록 __wrapped__ 로 원래 시그니처를 노출한다.
+    """
+
+    def __init__(self, updater: Callable, profiler: RenderProfiler):
+        self.updater = updater
+        self.__wrapped__ = updater
+        self.profiler = profiler
+        self.label = f"updater:{getattr(updater, '__qualname__', type(updater).__name__)}"
+
+    def __call__(self, *args):
+        return self.profiler.call(self.label, self.updater, *args)
+
+    def __eq__(self, other) -> bool:
+        return self.updater == (other.updater if isinstance(other, _TimedUpdater) else other)
+
+    def __hash__(self) -> int:
+        return hash(self.updater)
+
+
+class RenderProfiler:
+    """enable()부터 disable()까지 측정 대상 메서드를 감싸서 시간을 집계"""
+
+    def __init__(self):
+        self.entries: dict[tuple[str, str, str], ProfileEntry] = defaultdict(ProfileEntry)
+        self.folded: dict[tuple[str, ...], float] = defaultdict(float)
+        self.scene_name = "<no scene>"
+        self.section_name = "autocreated"
+        self._stack: list[list] = []  # [항목 이름, 하위 항목 시간]
+        self._patches: list[tuple[type, str, object]] = []
+        self._updater_wrappers: dict[Callable, _TimedUpdater] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patches)
+
+    def __enter__(self) -> RenderProfiler:
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def call(self, label: str, func: Callable, *args, **kwargs):
+        """func 를 호출하며 label 항목으로 시간 기록 (호출 중인 항목의 하위 항목이 됨)"""
+        frame = [label, 0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+            entry = self.entries[self.scene_name, self.section_name, label]
+            entry.calls += 1
+            entry.total += elapsed
+            entry.self_time += elapsed - frame[1]
+            stack = (self.scene_name, self.section_name, *(parent[0] for parent in self._stack), label)
+            self.folded[stack] += elapsed - frame[1]
+
+    def begin_scene(self, scene_name: str) -> None:
+        self.scene_name = scene_name
+        self.section_name = "autocreated"
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        from .tex_cache import TexCache
+
+        profiler = self
+
+        # 하위 클래스가 각자 정의한 interpolate_mobject 를 모두 감쌈 (super() 호출은 하위 항목으로 기록)
+        for animation_class in _iter_subclasses(Animation):
+            if "interpolate_mobject" in vars(animation_class):
+                self._wrap_method(animation_class, "interpolate_mobject",
+                                  f"{animation_class.__qualname__}.interpolate_mobject")
+
+        for text_class in TEXT_CLASSES:
+            self._wrap_method(text_class, "__init__", f"{text_class.__qualname__}.__init__")
+        self._wrap_method(TexCache, "get_or_create", "TexCache.get_or_create")
+        self._wrap_method(Scene, "play", "Scene.play")
+
+        original_update = vars(Mobject)["update"]
+
+        @functools.wraps(original_update)
+        def update(mobject, dt: float = 0, recursive: bool = True):
+            updaters = mobject.updaters
+            if not updaters or mobject.updating_suspended:
+                return original_update(mobject, dt, recursive)
+
+            mobject.updaters = [profiler._get_timed_updater(updater) for updater in updaters]
+            try:
+                return original_update(mobject, dt, recursive)
+            finally:
+                # 업데이터 안에서 추가/제거된 항목을 유지한 채 원래 함수로 되돌림
+                mobject.updaters = [
+                    updater.updater if isinstance(updater, _TimedUpdater) else updater
+                    for updater in mobject.updaters
+                ]
+
+        original_next_section = vars(Scene)["next_section"]
+
+        @functools.wraps(original_next_section)
+        def next_section(scene, name: str = "unnamed", *args, **kwargs):
+            profiler.section_name = name
+            return original_next_section(scene, name, *args, **kwargs)
+
+        original_render = vars(Scene)["render"]
+
+        @functools.wraps(original_render)
+        def render(scene, *args, **kwargs):
+            profiler.begin_scene(type(scene).__name__)
+            return original_render(scene, *args, **kwargs)
+
+        self._patch(Mobject, "update", update)
+        self._patch(Scene, "next_section", next_section)
+        self._patch(Scene, "render", render)
+
+    def disable(self) -> None:
+        """감싼 메서드를 모두 원래대로 되돌림"""
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+        self._updater_wrappers.clear()
+
+    def _patch(self, owner: type, name: str, replacement) -> None:
+        self._patches.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, replacement)
+
+    def _wrap_method(self, owner: type, name: str, label: str) -> None:
+        original = vars(owner).get(name)
+        if original is None:  # 상위 클래스의 메서드를 그대로 쓰는 경우 (상위 클래스에서 측정됨)
+            return
+        profiler = self
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            return profiler.call(label, original, *args, **kwargs)
+
+        self._patch(owner, name, wrapper)
+
+    def _get_timed_updater(self, updater: Callable) -> _TimedUpdater:
+        if isinstance(updater, _TimedUpdater):
+            return updater
+        wrapper = self._updater_wrappers.get(updater)
+        if wrapper is None:
+            wrapper = self._updater_wrappers[updater] = _TimedUpdater(updater, self)
+        return wrapper
+
+    def get_label_totals(self) -> dict[str, ProfileEntry]:
+        """구간을 합친 항목별 집계"""
+        totals: dict[str, ProfileEntry] = defaultdict(ProfileEntry)
+        for (_, _, label), entry in self.entries.items():
+            total = totals[label]
+            total.calls += entry.calls
+            total.total += entry.total
+            total.self_time += entry.self_time
+        return totals
+
+    def format_summary(self, top: int = 20) -> str:
+        """자기 시간이 긴 항목과 구간별 시간 요약"""
+        lines = [f"{'item':<60}{'calls':>9}{'total(s)':>10}{'self(s)':>10}"]
+        totals = sorted(self.get_label_totals().items(), key=lambda item: -item[1].self_time)
+        for label, entry in totals[:top]:
+            lines.append(f"{label:<60}{entry.calls:>9}{entry.total:>10.3f}{entry.self_time:>10.3f}")
+
+        section_times: dict[tuple[str, str], float] = defaultdict(float)
+        for (scene_name, section_name, _), entry in self.entries.items():
+            section_times[scene_name, section_name] += entry.self_time
+        lines.append("")
+        lines.append(f"{'scene / section':<60}{'self(s)':>29}")
+        for (scene_name, section_name), seconds in section_times.items():
+            lines.append(f"{scene_name + ' / ' + section_name:<60}{seconds:>29.3f}")
+        return "\n".join(lines)
+
+    def write_folded(self, path: str | Path, scene_name: str | None = None) -> Path:
+        """접힌 스택 형식으로 저장 (값: 자기 시간, 마이크로초)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            for stack, seconds in self.folded.items():
+                if scene_name is not None and stack[0] != scene_name:
+                    continue
+                microseconds = round(seconds * 1e6)
+                if microseconds > 0:
+                    f.write(f"{';'.join(frame.replace(';', ':') for frame in stack)} {microseconds}\n")
+        return path
+
+
+def _iter_subclasses(cls: type) -> Iterator[type]:
+    seen = set()
+    pending = [cls]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        yield current
+        pending.extend(current.__subclasses__())
+
+
+@contextmanager
+def profile_render(output: str | Path | None = None, summary: bool = True) -> Iterator[RenderProfiler]:
+    """블록 안의 렌더링을 측정 (output 을 주면 접힌 스택 파일 저장, summary 면 요약 출력)"""
+    profiler = RenderProfiler()
+    with profiler:
+        yield profiler
+    if output is not None:
+        profiler.write_folded(output)
+    if summary:
+        print(profiler.format_summary())
+
+
+def get_profile_dir() -> Path | None:
+    """MANIM_PROFILE 환경 변수에 따른 결과 디렉터리 (설정되지 않았으면 None)"""
+    value = os.environ.get(PROFILE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return Path(config.media_dir) / "profiles"
+    return Path(value)
+
+
+def install_from_env() -> None:
+    """MANIM_PROFILE 이 설정되어 있으면 Scene.render 마다 측정하고 결과를 저장하도록 설치
+
+    여러 모듈에서 호출해도 한 번만 설치된다. 환경 변수가 없으면 아무것도 바꾸지 않는다.
+    """
+    if os.environ.get(PROFILE_ENV) is None or getattr(Scene.render, "profiling_hook", False):
+        return
+
+    original_render = Scene.render
+
+    @functools.wraps(original_render)
+    def render(scene, *args, **kwargs):
+        profile_dir = get_profile_dir()
+        if profile_dir is None:
+            return original_render(scene, *args, **kwargs)
+
+        scene_name = type(scene).__name__
+        profiler = RenderProfiler()
+        with profiler:
+            profiler.begin_scene(scene_name)
+            result = original_render(scene, *args, **kwargs)
+        path = profiler.write_folded(profile_dir / f"{scene_name}.folded")
+        print(profiler.format_summary())
+        print(f"profile: {path}")
+        return result
+
+    render.profiling_hook = True
+    Scene.render = render
+
+
+if __name__ == "__main__":
+    # manim CLI 를 같은 프로세스에서 실행하며 측정 (인자는 manim 과 같음)
+    os.environ.setdefault(PROFILE_ENV, "1")
+    install_from_env()
+    from manim.__main__ import main
+
+    sys.argv = ["manim", *sys.argv[1:]]
+    main()
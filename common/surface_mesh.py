@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+from manim import *
+
+from common.gradient_descent import numerical_gradient
+
+
+# 프로세스 내 메시 캐시 항목 수 상한
+DEFAULT_MESH_CACHE_ENTRIES = 32
+
+
+@dataclass
+class SurfaceMeshData:
+    """z = f(u, v) 격자 메시의 좌표 공간 데이터 (화면 변환 전)"""
+    u_values: np.ndarray  # (nu + 1,)
+    v_values: np.ndarray  # (nv + 1,)
+    vertices: np.ndarray  # (nu + 1, nv + 1, 3) — (u, v, f(u, v))
+    normals: np.ndarray  # (nu + 1, nv + 1, 3) — 위를 향하는 단위 법선
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        return len(self.u_values) - 1, len(self.v_values) - 1
+
+
+def choose_resolution(screen_size: Sequence[float],
+                      face_pixels: float,
+                      min_resolution: int,
+                      max_resolution: int | Sequence[int]) -> tuple[int, int]:
+    """화면에 투영된 크기(픽셀)와 목표 면 크기(픽셀)로 u/v 방향 분할 수 결정
+
+    Args:
+        screen_size: (가로, 세로) 투영 크기 (픽셀)
+        face_pixels: 면 하나가 차지할 목표 크기 (픽셀) — 작을수록 매끄럽다
+        min_resolution: 최소 분할 수
+        max_resolution: 최대 분할 수 (정수 또는 (u, v))
+    """
+    if isinstance(max_resolution, int):
+        max_resolution = (max_resolution, max_resolution)
+    return tuple(
+        int(np.clip(math.ceil(size / face_pixels), min_resolution, limit))
+        for size, limit in zip(screen_size, max_resolution)
+    )
+
+
+def projected_screen_size(axes, u_range: Sequence[float], v_range: Sequence[float]) -> tuple[float, float]:
+    """u/v 범위가 화면에서 차지하는 크기 (픽셀) — 카메라 회전은 무시한 상한값"""
+    origin = np.array(axes.c2p(0, 0, 0))
+    u_length = np.linalg.norm(np.array(axes.c2p(1, 0, 0)) - origin) * (u_range[1] - u_range[0])
+    v_length = np.linalg.norm(np.array(axes.c2p(0, 1, 0)) - origin) * (v_range[1] - v_range[0])
+    pixels_per_unit = config.pixel_width / config.frame_width
+    return float(u_length * pixels_per_unit), float(v_length * pixels_per_unit)
+
+
+class SurfaceMeshBuilder:
+    """z = f(u, v) 곡면을 벡터화된 격자 평가로 만드는 메시 빌더
+
+    manim Surface는 면마다 점 16개를 func로 하나씩 변환하므로(apply_function)
+    해상도가 올라가면 파이썬 호출 수가 급격히 늘어난다.
+    이 빌더는 격자 전체를 한 번에 평가하고, 모든 면의 점 배열도 한 번에 만든다.
+
+    - 캐시: (함수, 추가 인자, u/v 범위, 해상도)별 꼭짓점/법선 배열 (좌표 공간)
+    - 화면 변환: 좌표축의 아핀 변환을 꼭짓점 배열 전체에 한 번에 적용
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MESH_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._meshes: OrderedDict = OrderedDict()
+
+    def get_mesh_data(self,
+                      func: Callable,
+                      u_range: Sequence[float],
+                      v_range: Sequence[float],
+                      resolution: tuple[int, int],
+                      args: tuple = ()) -> SurfaceMeshData:
+        """func(u, v, *args) 격자 메시 데이터 (캐시 사용)"""
+        key = (func, tuple(args), tuple(u_range[:2]), tuple(v_range[:2]), tuple(resolution))
+        mesh = self._meshes.get(key)
+        if mesh is not None:
+            self._meshes.move_to_end(key)
+            return mesh
+
+        u_values = np.linspace(u_range[0], u_range[1], resolution[0] + 1)
+        v_values = np.linspace(v_range[0], v_range[1], resolution[1] + 1)
+        U, V = np.meshgrid(u_values, v_values, indexing="ij")
+        Z = np.broadcast_to(func(U, V, *args), U.shape)
+        vertices = np.stack([U, V, Z], axis=-1)
+
+        # 법선: (-df/du, -df/dv, 1) 정규화
+        grad = numerical_gradient(lambda u, v: func(u, v, *args), vertices[..., :2])
+        normals = np.concatenate([-grad, np.ones(U.shape + (1,))], axis=-1)
+        normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+
+        mesh = SurfaceMeshData(u_values, v_values, vertices, normals)
+        self._meshes[key] = mesh
+        if len(self._meshes) > self.max_entries:
+            self._meshes.popitem(last=False)
+        return mesh
+
+    def build(self,
+              axes,
+              func: Callable,
+              u_range: Sequence[float],
+              v_range: Sequence[float],
+              resolution: tuple[int, int],
+              args: tuple = (),
+              fill_opacity: float = 1.0,
+              checkerboard_colors: Sequence = (BLUE_D, BLUE_E),
+              stroke_color=LIGHT_GREY,
+              stroke_width: float = 0.5) -> VGroup:
+        """좌표축 axes 위의 곡면 메시 (Surface와 같은 면 구성/기본 스타일)"""
+        mesh = self.get_mesh_data(func, u_range, v_range, resolution, args)
+        face_points = self._get_face_points(axes, mesh.vertices)
+
+        nu, nv = mesh.resolution
+        faces = VGroup()
+        for i in range(nu):
+            for j in range(nv):
+                face = ThreeDVMobject()
+                face.points = face_points[i, j]
+                face.u_index, face.v_index = i, j
+                faces.add(face)
+
+        faces.set_fill(color=checkerboard_colors[0], opacity=fill_opacity)
+        faces.set_stroke(color=stroke_color, width=stroke_width)
+        if len(checkerboard_colors) > 1:
+            for face in faces:
+                face.set_fill(
+                    checkerboard_colors[(face.u_index + face.v_index) % len(checkerboard_colors)],
+                    opacity=fill_opacity)
+
+        faces.mesh_data = mesh
+        return faces
+
+    def clear(self) -> None:
+        self._meshes.clear()
+
+    @staticmethod
+    def _get_face_points(axes, vertices: np.ndarray) -> np.ndarray:
+        """모든 면의 베지어 점 배열 (nu, nv, 16, 3) — 네 변을 직선 3차 베지어로"""
+        origin = np.array(axes.c2p(0, 0, 0))
+        basis = np.array([
+            np.array(axes.c2p(1, 0, 0)) - origin,
+            np.array(axes.c2p(0, 1, 0)) - origin,
+            np.array(axes.c2p(0, 0, 1)) - origin,
+        ])
+        screen = origin + vertices @ basis
+
+        # 면 꼭짓점 순서: (u1,v1) -> (u2,v1) -> (u2,v2) -> (u1,v2) -> (u1,v1)
+        corners = np.stack([
+            screen[:-1, :-1],
+            screen[1:, :-1],
+            screen[1:, 1:],
+            screen[:-1, 1:],
+            screen[:-1, :-1],
+        ], axis=2)
+        starts, ends = corners[:, :, :-1], corners[:, :, 1:]
+        edges = np.stack([
+            starts,
+            starts + (ends - starts) / 3,
+            starts + (ends - starts) * 2 / 3,
+            ends,
+        ], axis=3)
+        return edges.reshape(edges.shape[0], edges.shape[1], 16, 3)
+
+
+# 모듈 전역 기본 메시 빌더
+default_surface_mesh_builder = SurfaceMeshBuilder()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import sympy as sp
+
+
+# 프로세스 내 컴파일 결과 캐시 항목 수 상한
+DEFAULT_COMPILE_CACHE_ENTRIES = 256
+
+
+@dataclass
+class SympyCompilerStats:
+    """컴파일 캐시 적중/실패 횟수"""
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        return f"hits={self.hits}, misses={self.misses}"
+
+
+def _normalize_modules(modules) -> tuple:
+    """lambdify modules 인자를 캐시 키로 쓸 수 있는 튜플로 정규화"""
+    if isinstance(modules, str):
+        return (modules,)
+    return tuple(modules)
+
+
+def _default_symbols(expr: sp.Expr) -> tuple:
+    """인자 순서를 지정하지 않았을 때는 자유 기호를 이름순으로 사용"""
+    return tuple(sorted(expr.free_symbols, key=lambda symbol: symbol.name))
+
+
+class SympyCompiler:
+    """sympy 식을 lambdify로 한 번만 컴파일하고 결과 함수를 캐시
+
+    subs(...)로 점마다 식을 대입하는 대신 컴파일된 함수를 호출하므로,
+    NumberPlaneGroup.plot_function, plane.plot, 구적법 시각화 등에
+    그대로 넘길 수 있다. numpy 모듈로 컴파일한 함수는 배열 입력을 받는다.
+
+    - 키: (식, 인자 기호들, modules) — sympy 식은 구조적으로 해시/비교된다
+    - 도함수: (식, 기호, 차수)별로 diff 결과도 캐시한 뒤 같은 방식으로 컴파일
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_COMPILE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.stats = SympyCompilerStats()
+        self._functions: OrderedDict = OrderedDict()
+        self._derivatives: dict = {}
+
+    def compile(self, expr, *symbols, modules="numpy") -> Callable:
+        """expr를 symbols 순서의 인자를 받는 함수로 컴파일 (캐시 사용)"""
+        expr = sp.sympify(expr)
+        symbols = symbols or _default_symbols(expr)
+        modules = _normalize_modules(modules)
+        key = (expr, symbols, modules)
+
+        func = self._functions.get(key)
+        if func is not None:
+            self._functions.move_to_end(key)
+            self.stats.hits += 1
+            return func
+
+        self.stats.misses += 1
+        func = self._lambdify(expr, symbols, modules)
+        self._functions[key] = func
+        if len(self._functions) > self.max_entries:
+            self._functions.popitem(last=False)
+        return func
+
+    def derivative(self, expr, symbol, order: int = 1) -> sp.Expr:
+        """expr를 symbol로 order번 미분한 식 (캐시 사용)"""
+        expr = sp.sympify(expr)
+        key = (expr, symbol, order)
+        derived = self._derivatives.get(key)
+        if derived is None:
+            derived = self._derivatives[key] = sp.diff(expr, symbol, order)
+        return derived
+
+    def compile_derivative(self, expr, symbol, order: int = 1, *,
+                           symbols: tuple | None = None, modules="numpy") -> Callable:
+        """도함수를 컴파일 (인자 순서 symbols를 생략하면 원래 식의 자유 기호를 사용)"""
+        expr = sp.sympify(expr)
+        symbols = tuple(symbols) if symbols else _default_symbols(expr)
+        return self.compile(self.derivative(expr, symbol, order), *symbols, modules=modules)
+
+    def clear(self) -> None:
+        self._functions.clear()
+        self._derivatives.clear()
+
+    @staticmethod
+    def _lambdify(expr: sp.Expr, symbols: tuple, modules: tuple) -> Callable:
+        unbound = expr.free_symbols - set(symbols)
+        if unbound:
+            names = ", ".join(sorted(symbol.name for symbol in unbound))
+            raise ValueError(f"Expression {expr} has free symbols not in the argument list: {names}")
+
+        func = sp.lambdify(symbols, expr, modules=list(modules))
+        if "numpy" not in modules or expr.free_symbols:
+            return func
+
+        # 상수식은 lambdify 결과가 스칼라를 돌려주므로 입력 배열 모양으로 맞춤
+        value = float(expr) if expr.is_real else complex(expr)
+
+        def constant(*args):
+            shape = np.broadcast(*args).shape if args else ()
+            return np.full(shape, value) if shape else value
+        return constant
+
+
+# 모듈 전역 기본 컴파일러
+default_sympy_compiler = SympyCompiler()
+
+
+def compile_expr(expr, *symbols, modules="numpy", compiler: SympyCompiler | None = None) -> Callable:
+    """sympy 식을 컴파일한 함수 (기본 컴파일러 캐시 사용)"""
+    return (compiler or default_sympy_compiler).compile(expr, *symbols, modules=modules)
+
+
+def compile_derivative(expr, symbol, order: int = 1, *, symbols: tuple | None = None,
+                       modules="numpy", compiler: SympyCompiler | None = None) -> Callable:
+    """sympy 식의 도함수를 컴파일한 함수 (기본 컴파일러 캐시 사용)"""
+    return (compiler or default_sympy_compiler).compile_derivative(
+        expr, symbol, order, symbols=symbols, modules=modules)
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from manim import *
 from .scrolling_group import ScrollingGroup
 from .proof_scene_config import ProofSceneConfig
+from ...tex_cache import cached_math_tex
 
 type ProofStepItem = str | dict
 
@@ -99,7 +100,7 @@ class BaseProofScene(Scene, ABC):
         title_group = VGroup(glowing_title2, glowing_title, title)
 
         # 증명하고자 하는 공식
-        formula = MathTex(
+        formula = cached_math_tex(
             self.get_intro_formula(),
             font_size=self.config.title_intro_formula_size,
             color=self.config.formula_color,
@@ -135,7 +136,7 @@ class BaseProofScene(Scene, ABC):
 
         for i, part in enumerate(parts):
             tex_color = color or self.config.formula_color
-            tex_part = MathTex(
+            tex_part = cached_math_tex(
                 ("=" if i > 0 else "") + part.strip(),
                 font_size=font_size or self.config.font_size,
                 color=tex_color,
@@ -234,7 +235,7 @@ class BaseProofScene(Scene, ABC):
         color = color or self.config.conclusion_color
 
         qed_box = (
-            MathTex(r"\blacksquare", font_size=self.config.qed_font_size, color=color)
+            cached_math_tex(r"\blacksquare", font_size=self.config.qed_font_size, color=color)
             .next_to(formula_group, qed_position, buff=self.config.qed_buff)
             .shift(self.config.qed_shift)
         )
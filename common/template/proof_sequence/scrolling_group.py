@@ -1,6 +1,7 @@
 from enum import Enum, auto
 from numpy import ndarray
 from manim import *
+from ...tex_cache import cached_math_tex
 
 
 class ScrollDirection(Enum):
@@ -176,7 +177,7 @@ class ScrollingGroup(VGroup):
         animation_type: AddAnimation = AddAnimation.FADE_IN
     ) -> None:
         if is_latex:
-            latex_obj: MathTex = MathTex(*text, font_size=font_size)
+            latex_obj: MathTex = cached_math_tex(*text, font_size=font_size)
             if color is not None:
                 latex_obj.set_color(color)
             text_obj = latex_obj
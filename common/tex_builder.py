@@ -2,6 +2,8 @@
 from manim import *
 from typing import List, Tuple, Any, Optional
 
+from .tex_cache import cached_math_tex
+
 class TexBuilder:
     """Tex 객체 생성을 위한 유틸리티 클래스
 
@@ -50,7 +52,7 @@ class TexBuilder:
             part, str) else part for part in eq_parts]
         formulas = self.extract_items(eq_parts, 0)
 
-        tex = MathTex(
+        tex = cached_math_tex(
             *formulas,
             **kwargs
         )
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import manim
+from manim import *  # logger: manim이 설정한 로거 (렌더링 로그와 함께 출력)
+
+
+# 디스크 캐시 전체 크기 상한 (LRU로 정리)
+DEFAULT_TEX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# 프로세스 내 메모리 캐시 항목 수 상한
+DEFAULT_TEX_MEMORY_ENTRIES = 512
+
+
+@dataclass
+class TexCacheStats:
+    """캐시 적중/실패 횟수"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0  # 키를 만들 수 없어 캐시를 거치지 않은 경우
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def __str__(self) -> str:
+        return (f"hits={self.hits} (memory={self.memory_hits}, disk={self.disk_hits}), "
+                f"misses={self.misses}, bypassed={self.bypassed}")
+
+
+def _is_stable_value(value) -> bool:
+    """repr이 실행마다 동일한 값인지 확인 (캐시 키에 사용 가능한지)"""
+    if isinstance(value, (str, int, float, bool, type(None), ManimColor)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_stable_value(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_stable_value(k) and _is_stable_value(v)
+                   for k, v in value.items())
+    return False
+
+
+class TexCache:
+    """MathTex 컴파일 결과를 수식, 템플릿, 폰트 크기 등으로 캐시
+
+    LaTeX 컴파일과 SVG 파싱이 끝난 Mobject(경로의 점 데이터 포함)를
+    pickle로 디스크에 저장하므로, 다른 프로세스나 다음 렌더에서도
+    LaTeX와 SVG 파싱을 모두 건너뛴다.
+
+    - 키: manim 버전, 클래스, 수식 문자열, tex 템플릿 본문, 생성 인자의 SHA-256
+    - 디스크: cache_dir/<키 앞 2자리>/<키>.pkl (원자적 교체로 프로세스 간 공유)
+    - 크기 제한: 파일 접근 시각(mtime) 기준 LRU로 max_bytes 이하 유지
+    - 메모리: 프로세스 내 LRU, 적중 시 copy()만 수행
+
+    NOTE: pickle 파일을 그대로 읽어들이므로 신뢰할 수 있는 로컬 디렉터리만 사용한다.
+    """
+
+    def __init__(self,
+                 cache_dir: str | Path | None = None,
+                 max_bytes: int = DEFAULT_TEX_CACHE_MAX_BYTES,
+                 max_memory_entries: int = DEFAULT_TEX_MEMORY_ENTRIES,
+                 enabled: bool = True):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self.enabled = enabled
+        self.stats = TexCacheStats()
+        self._memory: OrderedDict[str, Mobject] = OrderedDict()
+        self._disk_bytes: int | None = None  # 첫 저장 시 계산
+
+    @property
+    def cache_dir(self) -> Path:
+        """디스크 캐시 위치 (기본값: <media_dir>/tex_cache)"""
+        # config.media_dir는 렌더 시점에 확정되므로 지연 계산
+        return self._cache_dir or Path(config.media_dir) / "tex_cache"
+
+    def make_key(self, tex_class: type, tex_strings: tuple, kwargs: dict) -> str | None:
+        """캐시 키 생성 (키로 쓸 수 없는 인자가 있으면 None)"""
+        tex_template = kwargs.get("tex_template") or config.tex_template
+        parts = [
+            manim.__version__,
+            f"{tex_class.__module__}.{tex_class.__qualname__}",
+            repr(tex_strings),
+            tex_template.body,
+        ]
+        for name, value in sorted(kwargs.items()):
+            if name == "tex_template":
+                continue
+            if not _is_stable_value(value):
+                return None
+            parts.append(f"{name}={value!r}")
+
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get_or_create(self, tex_class: type, *tex_strings, **kwargs) -> Mobject:
+        """캐시된 Tex 객체의 복사본 반환, 없으면 생성 후 캐시"""
+        key = self.make_key(tex_class, tex_strings, kwargs) if self.enabled else None
+        if key is None:
+            self.stats.bypassed += 1
+            return tex_class(*tex_strings, **kwargs)
+
+        prototype = self._memory.get(key)
+        if prototype is not None:
+            self.stats.memory_hits += 1
+            self._memory.move_to_end(key)
+            return prototype.copy()
+
+        prototype = self._load(key)
+        if prototype is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            prototype = tex_class(*tex_strings, **kwargs)
+            self._store(key, prototype)
+
+        self._remember(key, prototype)
+        return prototype.copy()
+
+    def log_stats(self) -> None:
+        """적중/실패 횟수를 INFO 로그로 출력 (한 번도 사용하지 않았으면 생략)"""
+        if self.stats.hits or self.stats.misses or self.stats.bypassed:
+            logger.info(f"Tex cache {self.cache_dir}: {self.stats}")
+
+    def clear(self, disk: bool = False) -> None:
+        """메모리 캐시 (disk=True이면 디스크 캐시까지) 비우기"""
+        self._memory.clear()
+        if disk and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.pkl"):
+                path.unlink(missing_ok=True)
+            self._disk_bytes = 0
+
+    def _remember(self, key: str, prototype: Mobject) -> None:
+        self._memory[key] = prototype
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def _load(self, key: str) -> Mobject | None:
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as f:
+                prototype = pickle.load(f)
+            os.utime(path)  # LRU 갱신
+            return prototype
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            # 손상되었거나 호환되지 않는 항목은 버리고 다시 생성
+            logger.warning(f"Discarding unreadable tex cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _store(self, key: str, prototype: Mobject) -> None:
+        try:
+            data = pickle.dumps(prototype, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Tex object is not picklable, keeping it in memory only: {e}")
+            return
+
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 같은 디렉터리에 임시 파일로 쓴 뒤 교체 (다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+                f.write(data)
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.warning(f"Failed to write tex cache entry {path.name}: {e}")
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = self._scan_disk_bytes()
+        else:
+            self._disk_bytes += len(data)
+
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*/*.pkl"))
+
+    def _evict(self) -> None:
+        """오래 사용하지 않은 항목부터 지워서 상한의 90% 이하로 줄임"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # 다른 프로세스가 먼저 지운 경우
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._disk_bytes = total
+
+
+# 모듈 전역 기본 캐시 (렌더링이 끝나 프로세스가 종료될 때 통계 출력)
+default_tex_cache = TexCache()
+atexit.register(default_tex_cache.log_stats)
+
+
+def cached_math_tex(*tex_strings, cache: TexCache | None = None, **kwargs) -> MathTex:
+    """MathTex(*tex_strings, **kwargs)와 같은 객체를 캐시를 거쳐 생성"""
+    return (cache or default_tex_cache).get_or_create(MathTex, *tex_strings, **kwargs)
@@ -0,0 +1,84 @@
+import copy
+import tempfile
+import unittest
+from pathlib import Path
+
+from common.tex_cache import TexCache
+
+
+class FakeTex:
+    """LaTeX 없이 캐시 동작만 확인하기 위한 Tex 대용 객체"""
+    created = 0
+
+    def __init__(self, *tex_strings, **kwargs):
+        FakeTex.created += 1
+        self.tex_strings = tex_strings
+        self.kwargs = kwargs
+
+    def copy(self):
+        return copy.copy(self)
+
+
+class TestTexCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        FakeTex.created = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_memory_hit(self):
+        cache = TexCache(cache_dir=self.cache_dir)
+        first = cache.get_or_create(FakeTex, "x^2", font_size=48)
+        cached = cache.get_or_create(FakeTex, "x^2", font_size=48)
+
+        self.assertIsNot(cached, first)
+        self.assertEqual(cached.tex_strings, ("x^2",))
+        self.assertEqual(FakeTex.created, 1)
+        self.assertEqual((cache.stats.misses, cache.stats.memory_hits, cache.stats.disk_hits), (1, 1, 0))
+
+    def test_disk_hit_from_other_cache(self):
+        TexCache(cache_dir=self.cache_dir).get_or_create(FakeTex, "x^2")
+        self.assertEqual(len(list(self.cache_dir.glob("*/*.pkl"))), 1)
+
+        cache = TexCache(cache_dir=self.cache_dir)
+        cached = cache.get_or_create(FakeTex, "x^2")
+
+        self.assertEqual(cached.tex_strings, ("x^2",))
+        self.assertEqual(FakeTex.created, 1)
+        self.assertEqual((cache.stats.misses, cache.stats.disk_hits), (0, 1))
+
+    def test_different_arguments_miss(self):
+        cache = TexCache(cache_dir=self.cache_dir)
+        cache.get_or_create(FakeTex, "x^2", font_size=48)
+        cache.get_or_create(FakeTex, "x^2", font_size=24)
+
+        self.assertEqual(cache.stats.misses, 2)
+        self.assertEqual(FakeTex.created, 2)
+
+    def test_unstable_argument_bypasses_cache(self):
+        cache = TexCache(cache_dir=self.cache_dir)
+        cache.get_or_create(FakeTex, "x^2", substrings_to_isolate=object())
+        cache.get_or_create(FakeTex, "x^2", substrings_to_isolate=object())
+
+        self.assertEqual(cache.stats.bypassed, 2)
+        self.assertEqual(FakeTex.created, 2)
+        self.assertEqual(list(self.cache_dir.glob("*/*.pkl")), [])
+
+    def test_log_stats(self):
+        cache = TexCache(cache_dir=self.cache_dir)
+        cache.get_or_create(FakeTex, "x^2")
+        # manim의 렌더링 로거로 출력되어야 별도 설정 없이 보인다
+        with self.assertLogs("manim", level="INFO") as logs:
+            cache.log_stats()
+        self.assertIn("misses=1", logs.output[0])
+
+    def test_log_stats_skipped_when_unused(self):
+        cache = TexCache(cache_dir=self.cache_dir)
+        with self.assertNoLogs("manim", level="INFO"):
+            cache.log_stats()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 from manim import *
 
+from .number_plane_group_impl.function import sample_function_segments
+
 
 def calculate_tan_ranges(x_min, x_max, epsilon=0.001):
     """탄젠트 함수의 연속구간들과 불연속점들을 계산
@@ -56,23 +58,18 @@ def create_tan_segments(axes, x_ranges, num_samples, y_limit=None, y_margin_rati
         y_limit += y_margin
 
     tan_segments = VGroup()
-    total_range = axes.x_range[1] - axes.x_range[0]
-
-    for x_min, x_max in x_ranges:
-        # 구간의 길이에 비례하여 샘플 수 계산
-        interval_length = x_max - x_min
-        interval_samples = int(num_samples * (interval_length / total_range))
-        interval_samples = max(interval_samples, 50)  # 최소 샘플 수 보장
-
-        # 각 구간에 대한 샘플링
-        x_values = np.linspace(x_min, x_max, interval_samples)
-        y_values = np.tan(x_values)
-
-        # y값 범위 제한 (여유값 포함)
-        mask = np.abs(y_values) <= y_limit
-        x_values = x_values[mask]
-        y_values = y_values[mask]
 
+    # 모든 구간을 한 번에 샘플링 (곡률이 큰 곳과 점근선 근처만 조밀하게)
+    samples = sample_function_segments(
+        np.tan,
+        x_ranges,
+        num_samples,
+        total_range=axes.x_range[1] - axes.x_range[0],
+        y_limit=y_limit,
+        unit_size=(axes.get_x_unit_size(), axes.get_y_unit_size())
+    )
+
+    for x_values, y_values in samples:
         # 구간별 그래프 생성
         segment = axes.plot_line_graph(
             x_values=x_values,
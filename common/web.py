@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from typing import List
 from PIL import Image
 from bs4 import BeautifulSoup
@@ -9,11 +11,16 @@ from manim import *
 import numpy as np
 import requests
 
+from .http_cache import HttpCache, default_http_cache
+
+# from_page 에서 이미지를 동시에 내려받는 스레드 수
+DEFAULT_FETCH_WORKERS = 8
+
 
 class WebImageMobject(ImageMobject):
-    def __init__(self, img_src: str | Image.Image, **kwargs):
+    def __init__(self, img_src: str | Image.Image, cache: HttpCache | None = None, **kwargs):
         if isinstance(img_src, str):
-            img = self._get_web_image(img_src)
+            img = self._get_web_image(img_src, cache)
         else:
             img = img_src
 
@@ -22,55 +29,64 @@ class WebImageMobject(ImageMobject):
             ImageMobject.__init__(self, im, **kwargs)
 
     @staticmethod
-    def _get_web_image(img_url: str) -> Image:
-        """웹에서 이미지를 가져온다.
+    def _get_web_image(img_url: str, cache: HttpCache | None = None) -> Image:
+        """웹에서 이미지를 가져온다 (디스크 캐시와 공유 세션 사용).
 
         Args:
             img_url: 이미지 URL
+            cache: HTTP 캐시 (기본: default_http_cache)
 
         Returns:
             PIL Image 객체
         """
-        with requests.get(img_url, stream=True) as response:
-            response.raise_for_status()
-            with Image.open(response.raw) as im:
-                return im.copy()
+        response = (cache or default_http_cache).get(img_url)
+        with Image.open(BytesIO(response.content)) as im:
+            return im.copy()
+
+    @classmethod
+    def _try_get_web_image(cls, img_url: str, cache: HttpCache | None) -> Image.Image | None:
+        try:
+            return cls._get_web_image(img_url, cache)
+        except (requests.RequestException, IOError) as e:
+            print(f"Error fetching image {img_url}: {e}")
+            return None
 
     @classmethod
     def from_page(
         cls,
         page_url: str,
         fetch_limit: int = 10,
-        selector: str | None = None
+        selector: str | None = None,
+        max_workers: int = DEFAULT_FETCH_WORKERS,
+        cache: HttpCache | None = None
     ) -> List[WebImageMobject]:
-        """웹페이지에서 이미지들을 가져와 WebImageMobject 리스트로 반환한다."""
-        images = []
+        """웹페이지에서 이미지들을 가져와 WebImageMobject 리스트로 반환한다.
 
-        with requests.get(page_url) as response:
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            img_tags = []
-            if selector:
-                elements = soup.select(selector)
-                for element in elements:
-                    img_tags.extend(element.find_all('img'))
-            else:
-                img_tags = soup.find_all('img')
-
-            for img in img_tags:
-                img_url = img.get('src')
-                if not img_url:
-                    continue
-
-                img_url = urljoin(page_url, img_url)
-                try:
-                    web_img = cls._get_web_image(img_url)
-                    images.append(cls(web_img))
-                    if len(images) >= fetch_limit:
-                        break
-                except (requests.RequestException, IOError) as e:
-                    print(f"Error fetching image {img_url}: {e}")
-                    continue
+        이미지들은 스레드 풀에서 동시에 내려받되, 결과는 페이지에 나온 순서를 따르고
+        fetch_limit 개를 넘지 않는다. 실패한 이미지는 건너뛴다.
+        """
+        response = (cache or default_http_cache).get(page_url)
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        img_tags = []
+        if selector:
+            elements = soup.select(selector)
+            for element in elements:
+                img_tags.extend(element.find_all('img'))
+        else:
+            img_tags = soup.find_all('img')
+
+        img_urls = [urljoin(page_url, img.get('src')) for img in img_tags if img.get('src')]
+
+        images = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            position = 0
+            while len(images) < fetch_limit and position < len(img_urls):
+                # 모자란 개수만큼만 동시에 요청 (실패가 없으면 추가 요청 없이 끝난다)
+                batch = img_urls[position:position + fetch_limit - len(images)]
+                position += len(batch)
+                for web_img in executor.map(lambda url: cls._try_get_web_image(url, cache), batch):
+                    if web_img is not None:
+                        images.append(cls(web_img))
 
         return images
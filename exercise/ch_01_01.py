@@ -1,8 +1,16 @@
 # TODO:
-# - 성능 개션한 다른 버전 함수 추가
 # - 파이썬스러운 단위 테스트 코드로 변경
 
+from common.number_theory import count_primes
+
+
 def count_number_of_prime_numbers_up_to(n: int) -> int:
+    """n 이하의 소수 개수 (비트 압축 분할 에라토스테네스의 체)"""
+    return count_primes(n)
+
+
+def count_number_of_prime_numbers_up_to_by_trial_division(n: int) -> int:
+    """n 이하의 소수 개수 (모든 수를 나눠 보는 O(n²) 방식, 비교용)"""
     count = 0
     for i in range(2, n + 1):
         for j in range(2, i):
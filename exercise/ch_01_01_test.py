@@ -1,5 +1,8 @@
 import unittest
-from exercise.ch_01_01 import count_number_of_prime_numbers_up_to
+from exercise.ch_01_01 import (
+    count_number_of_prime_numbers_up_to,
+    count_number_of_prime_numbers_up_to_by_trial_division,
+)
 
 
 class TestPrimeNumbers(unittest.TestCase):
@@ -18,6 +21,17 @@ class TestPrimeNumbers(unittest.TestCase):
     def test_hundred_input(self):
         self.assertEqual(count_number_of_prime_numbers_up_to(100), 25)
 
+    def test_large_inputs(self):
+        self.assertEqual(count_number_of_prime_numbers_up_to(10 ** 6), 78498)
+        self.assertEqual(count_number_of_prime_numbers_up_to(10 ** 7), 664579)
+
+    def test_matches_trial_division(self):
+        for n in range(-2, 600):
+            self.assertEqual(
+                count_number_of_prime_numbers_up_to(n),
+                count_number_of_prime_numbers_up_to_by_trial_division(n),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
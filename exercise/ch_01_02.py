@@ -1,5 +1,7 @@
 from collections import Counter
-from typing import List
+from typing import Iterable, List
+
+from common.number_theory import get_default_factorizer
 
 """
 TODO:
@@ -28,12 +30,24 @@ NOTE:
 def factorize(n: int) -> List[int]:
     """정수를 소인수분해하여 소인수들의 리스트를 반환
 
+    가장 작은 소인수 테이블(SPF)을 따라 나누고, 테이블보다 큰 수는 Pollard rho 로 분해한다.
+
     Args:
         n (int): 소인수분해할 양의 정수
 
     Returns:
-        List[int]: 소인수들의 리스트
+        List[int]: 소인수들의 리스트 (오름차순)
     """
+    return get_default_factorizer().factorize(n)
+
+
+def factorize_many(numbers: Iterable[int]) -> List[List[int]]:
+    """여러 정수를 한 번에 소인수분해 (테이블 범위의 수는 배열 연산으로 함께 처리)"""
+    return get_default_factorizer().factorize_many(numbers)
+
+
+def factorize_by_trial_division(n: int) -> List[int]:
+    """√n 까지의 모든 정수로 나눠 보는 소인수분해 (비교용)"""
     factors = []
 
     # 1은 소수가 아니므로 2부터 시작
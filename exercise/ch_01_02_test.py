@@ -1,5 +1,10 @@
 import unittest
-from exercise.ch_01_02 import factorize, factors_to_latex
+from exercise.ch_01_02 import (
+    factorize,
+    factorize_by_trial_division,
+    factorize_many,
+    factors_to_latex,
+)
 
 
 class TestFactorize(unittest.TestCase):
@@ -24,6 +29,20 @@ class TestFactorize(unittest.TestCase):
         self.assertEqual(factorize(8), [2, 2, 2])
         self.assertEqual(factorize(27), [3, 3, 3])
 
+    def test_numbers_beyond_factor_table(self):
+        self.assertEqual(factorize(600851475143), [71, 839, 1471, 6857])
+        self.assertEqual(factorize(1000003 * 1000033), [1000003, 1000033])
+        self.assertEqual(factorize(2 ** 61 - 1), [2 ** 61 - 1])
+        self.assertEqual(factorize(2 ** 40 * 3 ** 5), [2] * 40 + [3] * 5)
+
+    def test_matches_trial_division(self):
+        for n in list(range(1, 2000)) + [5083, 999983 * 2, 10 ** 9 + 7]:
+            self.assertEqual(factorize(n), factorize_by_trial_division(n))
+
+    def test_factorize_many(self):
+        numbers = [0, 1, 2, 360, 5083, 600851475143, 97]
+        self.assertEqual(factorize_many(numbers), [factorize(n) for n in numbers])
+
 
 class TestFactorsToLatex(unittest.TestCase):
     """소인수분해 결과의 LaTeX 문자열 변환 테스트"""
@@ -0,0 +1,86 @@
+"""latex_factory 대입문 추적 백엔드(ast / trace)의 호출당 오버헤드 비교
+
+023 미분 법칙 증명 씬들의 get_intro_formula / get_proof_steps를
+원본, AST 변환 백엔드, trace 백엔드로 각각 반복 호출하여 시간을 잰다.
+
+실행 (저장소 루트에서):
+    python test/latex_factory_backend_benchmark.py [반복 횟수]
+"""
+import sys
+import time
+import tempfile
+import importlib.util
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from common.decorator.latex_factory import LatexFactory, BACKEND_AST, BACKEND_TRACE
+from common.template.proof_sequence.base_proof_scene import BaseProofScene
+
+SCENE_DIR = ROOT_DIR / "animation" / "023"
+SCENE_FILES = [
+    "023_SumRule.py",
+    "023_ConstantMultiple.py",
+    "023_PowerRule.py",
+    "023_ProductRule.py",
+    "023_ChainRule.py",
+]
+METHOD_NAMES = ["get_intro_formula", "get_proof_steps"]
+
+
+def load_scene_classes(path: Path) -> list[type]:
+    """파일 이름이 숫자로 시작하는 씬 모듈을 경로로 불러와 증명 씬 클래스 반환"""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, BaseProofScene) and obj is not BaseProofScene
+    ]
+
+
+def time_per_call(func, args, repeat: int) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    func(*args)  # 워밍업 (변환/분석 비용 제외)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(repeat: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as save_dir:
+        factory = LatexFactory()
+        backends = {
+            BACKEND_AST: factory(save_dir=save_dir, backend=BACKEND_AST),
+            BACKEND_TRACE: factory(save_dir=save_dir, backend=BACKEND_TRACE),
+        }
+
+        print(f"{'scene.method':<42}{'raw(us)':>10}{'ast(us)':>10}{'trace(us)':>11}"
+              f"{'ast+':>9}{'trace+':>9}")
+
+        for file_name in SCENE_FILES:
+            for scene_cls in load_scene_classes(SCENE_DIR / file_name):
+                # 씬 초기화(렌더러 생성) 없이 메서드만 호출
+                scene = object.__new__(scene_cls)
+
+                for method_name in METHOD_NAMES:
+                    # 모듈 로드 시 적용된 latex_factory 래퍼를 벗겨낸 원본 함수
+                    raw_func = getattr(scene_cls, method_name).__wrapped__
+                    args = (scene, 0) if method_name == "get_proof_steps" else (scene,)
+
+                    raw = time_per_call(raw_func, args, repeat)
+                    timings = {
+                        name: time_per_call(decorator(raw_func), args, repeat)
+                        for name, decorator in backends.items()
+                    }
+                    print(f"{scene_cls.__name__ + '.' + method_name:<42}"
+                          f"{raw:>10.1f}{timings[BACKEND_AST]:>10.1f}{timings[BACKEND_TRACE]:>11.1f}"
+                          f"{timings[BACKEND_AST] - raw:>9.1f}{timings[BACKEND_TRACE] - raw:>9.1f}")
+
+        factory.flush()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
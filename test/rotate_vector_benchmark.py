@@ -0,0 +1,88 @@
+"""RotateVectorWithAngularVelocity 프레임 갱신 비용 비교 (become 방식 / 제자리 회전 방식)
+
+015 톱니파 씬(SawtoothWave)과 같은 7개 컴포넌트의 원/벡터를 만들고,
+SineWaveManager.create_animations와 같은 애니메이션 구성으로
+렌더링 없이 interpolate만 반복 호출하여 초당 처리 가능한 프레임 수를 잰다.
+
+실행 (저장소 루트에서):
+    python test/rotate_vector_benchmark.py [프레임 수]
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from manim import *
+from common.number_plane_group import NumberPlaneGroup
+from common.sine_wave_components import SineWaveManager, RotationConfig
+from common.animation.rotate_vector import (
+    RotateVectorWithAngularVelocity,
+    UpdateVectorWithCircle,
+)
+
+N_COMPONENTS = 7
+MAIN_SCALE = 5
+
+
+def build_manager() -> SineWaveManager:
+    """015 SawtoothWave와 같은 반지름(1/k), 각속도(k)의 컴포넌트 구성"""
+    npg = NumberPlaneGroup().scale(MAIN_SCALE)
+    manager = SineWaveManager(npg)
+    prev_vector = None
+    for i in range(N_COMPONENTS):
+        center_point = npg.plane.p2c(prev_vector.get_end()) if prev_vector else (0, 0)
+        _, prev_vector = manager.add_component(RotationConfig(
+            center_point=center_point,
+            angular_velocity=i + 1,
+            circle_radius=1 / (i + 1),
+            color=BLUE,
+            name_suffix=str(i),
+        ))
+    return manager
+
+
+def create_animations(manager: SineWaveManager, in_place: bool) -> list:
+    animations = []
+    prev_vector = None
+    for config, circle, vector in zip(manager.configs, manager.circles, manager.vectors):
+        animations.append(RotateVectorWithAngularVelocity(
+            vector, manager.plane,
+            angular_velocity=config.angular_velocity,
+            reference_circle=circle,
+            rate_func=linear,
+            in_place=in_place,
+        ))
+        if prev_vector:
+            animations.append(UpdateVectorWithCircle(vector, circle, prev_vector, rate_func=linear))
+        prev_vector = vector
+    return animations
+
+
+def frames_per_second(in_place: bool, n_frames: int) -> float:
+    animations = create_animations(build_manager(), in_place)
+    for animation in animations:
+        animation.begin()
+
+    start = time.perf_counter()
+    for frame in range(n_frames):
+        alpha = frame / (n_frames - 1)
+        for animation in animations:
+            animation.interpolate(alpha)
+    elapsed = time.perf_counter() - start
+
+    for animation in animations:
+        animation.finish()
+    return n_frames / elapsed
+
+
+def main(n_frames: int = 600) -> None:
+    before = frames_per_second(in_place=False, n_frames=n_frames)
+    after = frames_per_second(in_place=True, n_frames=n_frames)
+    print(f"become (before): {before:8.1f} frames/s")
+    print(f"in-place (after): {after:8.1f} frames/s  (x{after / before:.1f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600)
@@ -0,0 +1,290 @@
+"""animation/NNN 과 exercise/ 의 씬들을 렌더링하며 시간을 재고, 기준 결과(JSON)와 비교
+
+씬마다 새 프로세스에서 실행하여 다음을 기록한다.
+- wall_time: scene.render() 시간 (모듈 import 시간은 import_time 으로 따로 기록)
+- frames: 실제로 기록된 프레임 수 (construct 모드에서는 0)
+- animation_time: 재생 시간 합 (동영상 길이)
+- peak_rss_mb: 프로세스 최대 메모리 사용량
+- animations: play/wait 호출마다의 이름, 재생 시간, 걸린 시간
+
+모드:
+- render: 저품질(-ql)로 실제 렌더링 (캐시 끔, 결과물은 임시 디렉터리)
+- construct: 모든 구간을 skip_animations 로 건너뛰는 dry_run (프레임을 그리지 않고 construct 비용만)
+
+실행 (저장소 루트에서):
+    python test/scene_render_benchmark.py run [-m construct] [-k 029] [-r 3] [-o result.json] [-b baseline.json]
+    python test/scene_render_benchmark.py compare baseline.json result.json [-t 0.1]
+
+기준 결과(-b)를 주면 비교 보고서를 출력하고, 느려진 씬이 있으면 종료 코드 1을 반환한다.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import re
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import manim
+from manim import *
+from common.parallel_render import load_scene_classes, make_seek_scene
+
+MODE_RENDER = "render"
+MODE_CONSTRUCT = "construct"
+
+# 이보다 짧은 시간 차이는 측정 잡음으로 보고 회귀로 판정하지 않음 (초)
+MIN_REGRESSION_SECONDS = 0.05
+DEFAULT_THRESHOLD = 0.10
+
+
+def discover_scene_files() -> list[Path]:
+    """벤치마크 대상 씬 파일 (animation/NNN/*.py, exercise/*.py 중 테스트 파일 제외)"""
+    files = sorted(ROOT_DIR.glob("animation/[0-9][0-9][0-9]/*.py"))
+    files += sorted(path for path in ROOT_DIR.glob("exercise/*.py") if not path.stem.endswith("_test"))
+    return files
+
+
+def list_scenes(file_path: str) -> list[str] | str:
+    """파일의 씬 이름 목록, import 에 실패하면 오류 메시지 (작업자 프로세스에서 실행)"""
+    try:
+        return list(load_scene_classes(file_path))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def _animation_name(animation) -> str:
+    # self.play(mob.animate...)로 만든 _AnimationBuilder 는 "animate"로 표시
+    return "animate" if type(animation).__name__ == "_AnimationBuilder" else type(animation).__name__
+
+
+def make_benchmark_scene(scene_class: type[Scene], mode: str) -> type[Scene]:
+    """play 호출과 기록된 프레임 수를 측정하는 씬 클래스"""
+    base_class = make_seek_scene(scene_class, None) if mode == MODE_CONSTRUCT else scene_class
+
+    class BenchmarkScene(base_class):
+        animation_records: list[dict]
+        frame_count: int
+
+        def setup(self):
+            super().setup()
+            self.animation_records = []
+            self.frame_count = 0
+
+            file_writer = self.renderer.file_writer
+            write_frame = file_writer.write_frame
+
+            def counting_write_frame(frame_or_renderer, num_frames: int = 1):
+                self.frame_count += num_frames
+                write_frame(frame_or_renderer, num_frames)
+
+            file_writer.write_frame = counting_write_frame
+
+        def play(self, *args, **kwargs):
+            # wait 도 내부적으로 play(Wait(...))를 호출하므로 여기서 함께 기록된다
+            scene_time = self.renderer.time
+            start = time.perf_counter()
+            super().play(*args, **kwargs)
+            self.animation_records.append({
+                "name": ", ".join(_animation_name(animation) for animation in args),
+                "run_time": self.renderer.time - scene_time,
+                "wall_time": time.perf_counter() - start,
+            })
+
+    BenchmarkScene.__name__ = scene_class.__name__
+    BenchmarkScene.__qualname__ = scene_class.__qualname__
+    return BenchmarkScene
+
+
+def benchmark_scene(file_path: str, scene_name: str, mode: str) -> dict:
+    """씬 하나를 렌더링하고 측정값 반환 (씬마다 새 작업자 프로세스에서 실행)"""
+    overrides = {
+        "input_file": file_path,
+        "quality": "low_quality",
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "ERROR",
+    }
+    if mode == MODE_CONSTRUCT:
+        overrides["dry_run"] = True
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({**overrides, "media_dir": media_dir}):
+        try:
+            start = time.perf_counter()
+            scene_class = load_scene_classes(file_path)[scene_name]
+            import_time = time.perf_counter() - start
+
+            scene = make_benchmark_scene(scene_class, mode)()
+            start = time.perf_counter()
+            scene.render()
+            wall_time = time.perf_counter() - start
+        except Exception as e:
+            return {"status": "error", "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+
+    # Linux 의 ru_maxrss 단위는 KB, macOS 는 바이트
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    if peak_rss is not None:
+        peak_rss /= 1024 * 1024 if sys.platform == "darwin" else 1024
+
+    return {
+        "status": "ok",
+        "wall_time": wall_time,
+        "import_time": import_time,
+        "frames": scene.frame_count,
+        "animation_time": scene.renderer.time,
+        "peak_rss_mb": peak_rss,
+        "animations": scene.animation_records,
+    }
+
+
+def run(mode: str, pattern: str | None, repeat: int, jobs: int) -> dict:
+    """대상 씬을 모두 측정 (반복 측정 시 wall_time 이 가장 짧은 결과 사용)"""
+    # 씬마다 import 상태와 최대 메모리가 섞이지 않도록 작업 하나당 새 프로세스 사용
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as pool:
+        files = [str(path) for path in discover_scene_files()]
+        scene_ids = []
+        for file_path, scenes in zip(files, pool.map(list_scenes, files)):
+            relative_path = Path(file_path).relative_to(ROOT_DIR).as_posix()
+            if isinstance(scenes, str):
+                print(f"{relative_path}: skipped ({scenes})")
+                continue
+            for scene_name in scenes:
+                scene_id = f"{relative_path}::{scene_name}"
+                if pattern is None or re.search(pattern, scene_id):
+                    scene_ids.append((scene_id, file_path, scene_name))
+
+        results = {}
+        for scene_id, file_path, scene_name in scene_ids:
+            futures = [pool.submit(benchmark_scene, file_path, scene_name, mode) for _ in range(repeat)]
+            runs = [future.result() for future in futures]
+            succeeded = [result for result in runs if result["status"] == "ok"]
+            result = min(succeeded, key=lambda result: result["wall_time"]) if succeeded else runs[0]
+            results[scene_id] = result
+
+            if result["status"] == "ok":
+                print(f"{scene_id:<70}{result['wall_time']:>9.2f}s{result['frames']:>7} frames"
+                      f"{result['peak_rss_mb'] or 0:>8.0f} MB")
+            else:
+                print(f"{scene_id:<70}  {result['error']}")
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "mode": mode,
+        "repeat": repeat,
+        "manim": manim.__version__,
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "scenes": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """씬별 wall_time 을 비교해 보고서를 출력하고 느려진 씬 id 목록 반환"""
+    if baseline.get("mode") != current.get("mode"):
+        print(f"WARNING: comparing different modes ({baseline.get('mode')} -> {current.get('mode')})")
+
+    rows = []
+    for scene_id, result in current["scenes"].items():
+        base = baseline["scenes"].get(scene_id)
+        if base is None or base["status"] != "ok" or result["status"] != "ok":
+            continue
+        delta = result["wall_time"] - base["wall_time"]
+        ratio = result["wall_time"] / base["wall_time"] if base["wall_time"] else float("inf")
+        regressed = ratio > 1 + threshold and delta > MIN_REGRESSION_SECONDS
+        improved = ratio < 1 - threshold and -delta > MIN_REGRESSION_SECONDS
+        rows.append((scene_id, base, result, delta, ratio, regressed, improved))
+
+    print(f"{'scene':<70}{'base(s)':>9}{'now(s)':>9}{'ratio':>8}{'rss(MB)':>10}")
+    for scene_id, base, result, delta, ratio, regressed, improved in sorted(rows, key=lambda row: -row[4]):
+        mark = "  REGRESSED" if regressed else "  improved" if improved else ""
+        rss_delta = (result["peak_rss_mb"] or 0) - (base["peak_rss_mb"] or 0)
+        print(f"{scene_id:<70}{base['wall_time']:>9.2f}{result['wall_time']:>9.2f}{ratio:>8.2f}"
+              f"{rss_delta:>+10.0f}{mark}")
+        if regressed:
+            _print_animation_deltas(base["animations"], result["animations"])
+
+    new_scenes = sorted(set(current["scenes"]) - set(baseline["scenes"]))
+    missing_scenes = sorted(set(baseline["scenes"]) - set(current["scenes"]))
+    failed_scenes = sorted(scene_id for scene_id, result in current["scenes"].items() if result["status"] != "ok")
+    for label, scene_ids in (("new", new_scenes), ("missing", missing_scenes), ("failed", failed_scenes)):
+        if scene_ids:
+            print(f"{label}: {', '.join(scene_ids)}")
+
+    regressions = [row[0] for row in rows if row[5]]
+    improvements = [row[0] for row in rows if row[6]]
+    base_total = sum(row[1]["wall_time"] for row in rows)
+    current_total = sum(row[2]["wall_time"] for row in rows)
+    print(f"\n{len(rows)} scenes compared: total {base_total:.1f}s -> {current_total:.1f}s, "
+          f"{len(regressions)} regressed, {len(improvements)} improved (threshold {threshold:.0%})")
+    return regressions
+
+
+def _print_animation_deltas(base_animations: list[dict], current_animations: list[dict], top: int = 3) -> None:
+    """느려진 씬에서 시간이 가장 많이 늘어난 애니메이션 (호출 순서가 같을 때만)"""
+    if len(base_animations) != len(current_animations):
+        print(f"    animation count changed: {len(base_animations)} -> {len(current_animations)}")
+        return
+    deltas = sorted(
+        ((now["wall_time"] - base["wall_time"], index, now["name"])
+         for index, (base, now) in enumerate(zip(base_animations, current_animations))),
+        reverse=True,
+    )
+    for delta, index, name in deltas[:top]:
+        print(f"    #{index:<4}{name:<50}{delta:>+9.3f}s")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="씬 렌더링 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="씬들을 측정해 JSON으로 저장")
+    run_parser.add_argument("-m", "--mode", choices=[MODE_RENDER, MODE_CONSTRUCT], default=MODE_RENDER)
+    run_parser.add_argument("-k", "--filter", default=None, help="'경로::씬 이름'에 대한 정규식")
+    run_parser.add_argument("-r", "--repeat", type=int, default=1, help="씬별 반복 측정 횟수")
+    run_parser.add_argument("-j", "--jobs", type=int, default=1,
+                            help="동시에 측정할 씬 수 (1보다 크면 측정값이 서로 영향을 받음)")
+    run_parser.add_argument("-o", "--output", type=Path, default=None,
+                            help="결과 파일 (기본: media/benchmarks/scenes_<모드>_<시각>.json)")
+    run_parser.add_argument("-b", "--baseline", type=Path, default=None, help="비교할 기준 결과 파일")
+    run_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="두 결과 파일 비교")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run(args.mode, args.filter, args.repeat, args.jobs)
+        output = args.output or (
+            ROOT_DIR / "media" / "benchmarks" / f"scenes_{args.mode}_{datetime.now():%Y%m%d_%H%M%S}.json"
+        )
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nsaved: {output}")
+        if args.baseline is None:
+            return 0
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    else:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        result = json.loads(args.current.read_text(encoding="utf-8"))
+
+    return 1 if compare(baseline, result, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
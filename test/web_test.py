@@ -1,6 +1,6 @@
 from manim import *
 from common.web import WebImageMobject
-from common.open_emoji import EmojiImageMobject
+from common.open_emoji import EmojiImageMobject, EmojiSVGMobject, prefetch_emojis
 
 
 class WebImageTest(Scene):
@@ -52,3 +52,14 @@ class EmojiImageTest1(Scene):
         emoji_imgs = [EmojiImageMobject(emoji).scale(0.4) for emoji in face_emojis]
         group = Group(*emoji_imgs).arrange_in_grid(rows=4, cols=5, buff=0.2)
         self.add(group)
+
+
+class EmojiSVGGridTest(Scene):
+    def construct(self):
+        self.camera.background_color = BLUE_A
+        face_emojis = ['😀', '😂', '😍', '🤔', '😴']
+        # 모든 SVG를 미리 동시에 받아 두고, 반복되는 이모지는 파싱 결과를 복사해서 사용
+        prefetch_emojis(face_emojis)
+        emoji_svgs = [EmojiSVGMobject(face_emojis[i % 5]).scale(0.4) for i in range(40)]
+        group = VGroup(*emoji_svgs).arrange_in_grid(rows=5, cols=8, buff=0.2)
+        self.add(group)